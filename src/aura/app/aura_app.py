@@ -6,16 +6,18 @@ from typing import List, Optional
 from PySide6.QtGui import QFontDatabase
 from PySide6.QtWidgets import QApplication
 
-from src.aura.app.event_bus import EventBus
+from src.aura.app.event_bus import EventBus, coalesce_terminal_output
 from src.aura.config import ASSETS_DIR, ROOT_DIR, WORKSPACE_DIR
 from src.aura.project.project_manager import ProjectManager
 from src.aura.services.conversation_management_service import ConversationManagementService
 from src.aura.services.conversation_persistence_service import ConversationPersistenceService
 from src.aura.services.image_storage_service import ImageStorageService
+from src.aura.services.llm_response_cache import LLMResponseCache
 from src.aura.services.llm_service import LLMService
 from src.aura.services.terminal_agent_service import TerminalAgentService
 from src.aura.services.user_settings_manager import UserSettingsManager
 from src.aura.services.workspace_service import WorkspaceService
+from src.aura.models.event_types import TERMINAL_OUTPUT_RECEIVED
 from src.aura.models.events import Event
 from src.ui.controllers.conversation_sidebar_controller import ConversationSidebarController
 from src.ui.windows.main_window import MainWindow
@@ -101,6 +103,8 @@ class AuraApp:
         self._load_fonts()
 
         self.event_bus = EventBus()
+        # Terminal output arrives in bursts of small PTY reads; deliver it once per frame.
+        self.event_bus.enable_batching(TERMINAL_OUTPUT_RECEIVED, coalesce=coalesce_terminal_output)
         image_cache_dir = ROOT_DIR / "image_cache"
         try:
             self.image_storage_service = ImageStorageService(image_cache_dir, retention_limit=200)
@@ -115,8 +119,20 @@ class AuraApp:
         )
         self.workspace_service = WorkspaceService(self.event_bus, WORKSPACE_DIR)
 
+        llm_cache_dir = ROOT_DIR / "llm_cache"
+        try:
+            llm_response_cache = LLMResponseCache(llm_cache_dir)
+        except Exception:
+            logging.warning("LLM response cache unavailable; continuing without response caching.")
+            llm_response_cache = None
+
         # Low-level LLM dispatcher
-        self.llm_service = LLMService(self.event_bus, self.image_storage_service)
+        self.llm_service = LLMService(
+            self.event_bus,
+            self.image_storage_service,
+            response_cache=llm_response_cache,
+            model_cache_path=ROOT_DIR / "llm_models.json",
+        )
 
         # Load terminal agent configuration from user settings
         self.settings_manager = UserSettingsManager()
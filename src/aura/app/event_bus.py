@@ -1,62 +1,554 @@
-from typing import Callable, List, Dict
-from PySide6.QtCore import QObject, Signal
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Dict, Optional, Tuple
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from src.aura.models.events import Event
+from src.aura.utils.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+BatchCoalescer = Callable[[List[Event]], List[Event]]
+
+# Delivery lanes a subscriber can choose from.
+MAIN_LANE = "main"
+"""Callbacks run on the Qt main thread (default; required for anything touching widgets)."""
+WORKER_LANE = "worker"
+"""Callbacks run on the bus's dedicated worker threads, off the UI thread."""
+INLINE_LANE = "inline"
+"""Callbacks run synchronously on whichever thread called ``dispatch``."""
+
+LANES: Tuple[str, ...] = (MAIN_LANE, WORKER_LANE, INLINE_LANE)
+
+
+def coalesce_terminal_output(events: List[Event]) -> List[Event]:
+    """
+    Merge terminal output chunks that belong to the same task and stream.
+
+    Text is concatenated in arrival order and the most recent timestamp wins, so a
+    frame worth of PTY reads collapses into a single event per task.
+    """
+    merged: Dict[tuple, Event] = {}
+    for event in events:
+        payload = event.payload or {}
+        key = (payload.get("task_id"), payload.get("stream_type"))
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = Event(event_type=event.event_type, payload=dict(payload))
+            continue
+        existing.payload["text"] = f"{existing.payload.get('text', '')}{payload.get('text', '')}"
+        if payload.get("timestamp"):
+            existing.payload["timestamp"] = payload["timestamp"]
+    return list(merged.values())
+
+
+class _LaneMetrics:
+    """Thread-safe queue depth and dispatch-to-delivery latency counters for one lane."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.depth = 0
+        self.delivered = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def enqueued(self, count: int = 1) -> None:
+        with self._lock:
+            self.depth += count
+
+    def delivered_one(self, enqueued_at: float, *, dequeued: bool = True) -> float:
+        latency = time.monotonic() - enqueued_at
+        with self._lock:
+            if dequeued:
+                self.depth -= 1
+            self.delivered += 1
+            self.total_latency += latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+        return latency
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            average = self.total_latency / self.delivered if self.delivered else 0.0
+            return {
+                "depth": self.depth,
+                "delivered": self.delivered,
+                "avg_latency_ms": round(average * 1000, 3),
+                "max_latency_ms": round(self.max_latency * 1000, 3),
+            }
+
+
+def _payload_size(payload: Dict[str, Any]) -> int:
+    """Approximate payload size: the length of top-level str/bytes values, without formatting."""
+    size = 0
+    for value in payload.values():
+        if isinstance(value, (str, bytes, bytearray)):
+            size += len(value)
+    return size
+
+
+def _callback_name(callback: Callable) -> str:
+    return getattr(callback, "__qualname__", None) or getattr(callback, "__name__", repr(callback))
+
+
+class _TraceBuffer:
+    """
+    Sampling ring buffer of recent deliveries.
+
+    Every ``sample_every``-th delivery is recorded as (time, type, lane, payload size,
+    latency); older records fall off the end. A capacity of zero disables tracing.
+    """
+
+    def __init__(self, capacity: int, sample_every: int) -> None:
+        self._lock = threading.Lock()
+        self._records: Deque[Tuple[float, str, str, int, float]] = deque(maxlen=max(int(capacity), 0))
+        self._enabled = capacity > 0
+        self._sample_every = max(int(sample_every), 1)
+        self._seen = 0
+
+    def record(self, event: Event, lane: str, latency: float) -> None:
+        if not self._enabled:
+            return
+        with self._lock:
+            self._seen += 1
+            if self._seen % self._sample_every:
+                return
+        record = (time.time(), event.event_type, lane, _payload_size(event.payload or {}), latency)
+        with self._lock:
+            self._records.append(record)
+
+    def dump(self, clear: bool = False) -> List[Dict[str, Any]]:
+        with self._lock:
+            records = list(self._records)
+            if clear:
+                self._records.clear()
+        return [
+            {
+                "timestamp": timestamp,
+                "event_type": event_type,
+                "lane": lane,
+                "payload_size": size,
+                "latency_ms": round(latency * 1000, 3),
+            }
+            for timestamp, event_type, lane, size, latency in records
+        ]
+
+
+class _EventStats:
+    """Per-event-type counters and queue delays plus per-callback execution times."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dispatched: Dict[str, int] = {}
+        self._queue_delay: Dict[str, LatencyHistogram] = {}
+        self._callback_time: Dict[str, LatencyHistogram] = {}
+
+    def dispatched(self, event_type: str) -> None:
+        with self._lock:
+            self._dispatched[event_type] = self._dispatched.get(event_type, 0) + 1
+
+    def queue_delay(self, event_type: str, seconds: float) -> None:
+        self._histogram(self._queue_delay, event_type).observe(seconds)
+
+    def callback_time(self, name: str, seconds: float) -> None:
+        self._histogram(self._callback_time, name).observe(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            dispatched = dict(self._dispatched)
+            delays = dict(self._queue_delay)
+            callbacks = dict(self._callback_time)
+        event_types: Dict[str, Any] = {}
+        for event_type in sorted(set(dispatched) | set(delays)):
+            delay = delays.get(event_type)
+            event_types[event_type] = {
+                "dispatched": dispatched.get(event_type, 0),
+                "queue_delay": delay.snapshot() if delay else None,
+            }
+        return {
+            "event_types": event_types,
+            "callbacks": {name: histogram.snapshot() for name, histogram in sorted(callbacks.items())},
+        }
+
+    def _histogram(self, table: Dict[str, LatencyHistogram], key: str) -> LatencyHistogram:
+        histogram = table.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = table.setdefault(key, LatencyHistogram())
+        return histogram
 
 
 class EventBusSignaller(QObject):
     """
     A QObject to emit signals on the main (UI) thread.
     """
-    signal = Signal(Event)
+    signal = Signal(object, float)
+    batch_ready = Signal()
 
 
 class EventBus:
     """
     A simple event bus for decoupled communication between components.
-    Ensures all event dispatches are handled on the main UI thread.
+
+    Subscribers choose a delivery lane: the Qt main thread (default), the bus's
+    worker threads for service-to-service traffic, or inline on the dispatching
+    thread. Event types registered through ``enable_batching`` are queued and
+    delivered once per frame instead of one signal per event. While a batch is
+    pending, other main-lane events queue behind it, so the lane stays FIFO.
+
+    Tracing goes through the module logger at DEBUG level and is never formatted
+    unless that level is enabled; a sampled ring buffer of recent deliveries can
+    be inspected with ``dump_trace``.
     """
-    def __init__(self):
-        """Initializes the EventBus."""
-        self._subscribers: Dict[str, List[Callable]] = {}
+
+    _DEFAULT_BATCH_INTERVAL_MS = 16
+    _DEFAULT_WORKER_THREADS = 1
+    _DEFAULT_TRACE_CAPACITY = 256
+    _DEFAULT_TRACE_SAMPLE_EVERY = 1
+
+    def __init__(
+        self,
+        batch_interval_ms: int = _DEFAULT_BATCH_INTERVAL_MS,
+        worker_threads: int = _DEFAULT_WORKER_THREADS,
+        trace_capacity: int = _DEFAULT_TRACE_CAPACITY,
+        trace_sample_every: int = _DEFAULT_TRACE_SAMPLE_EVERY,
+    ):
+        """
+        Initializes the EventBus.
+
+        Args:
+            batch_interval_ms: Delay between the first queued batched event and delivery.
+            worker_threads: Size of the worker lane pool. One thread keeps per-type ordering.
+            trace_capacity: Number of delivery records kept in the trace ring buffer; 0 disables it.
+            trace_sample_every: Record one delivery out of every N.
+        """
+        self._trace = _TraceBuffer(trace_capacity, trace_sample_every)
+        self._stats = _EventStats()
+        self._subscribers: Dict[str, Dict[str, List[Callable]]] = {lane: {} for lane in LANES}
+        self._batch_subscribers: Dict[str, List[Callable]] = {}
+        self._batch_rules: Dict[str, Optional[BatchCoalescer]] = {}
+        self._batch_queue: List[Tuple[Event, float]] = []
+        self._batch_lock = threading.Lock()
+        self._flush_pending = False
+
+        self._lane_metrics: Dict[str, _LaneMetrics] = {lane: _LaneMetrics() for lane in LANES}
+        self._worker_queue: "queue.Queue[Optional[Tuple[Event, float]]]" = queue.Queue()
+        self._worker_count = max(int(worker_threads), 1)
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+
         self._signaller = EventBusSignaller()
         self._signaller.signal.connect(self._handle_event_on_main_thread)
+        self._signaller.batch_ready.connect(self._schedule_batch_flush)
+
+        self._flush_timer = QTimer(self._signaller)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(max(int(batch_interval_ms), 0))
+        self._flush_timer.timeout.connect(self.flush_batches)
 
-    def subscribe(self, event_type: str, callback: Callable):
+    def subscribe(self, event_type: str, callback: Callable, lane: str = MAIN_LANE):
         """
         Subscribe a callback function to a specific event type.
 
         Args:
             event_type: The type of event to subscribe to.
             callback: The function to call when the event is dispatched.
+            lane: Delivery lane; one of MAIN_LANE, WORKER_LANE or INLINE_LANE.
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
-        print(f"Subscribed {callback.__name__} to event '{event_type}'")
+        if lane not in self._subscribers:
+            raise ValueError(f"Unknown event bus lane '{lane}'. Expected one of {LANES}.")
+        lane_subscribers = self._subscribers[lane]
+        if event_type not in lane_subscribers:
+            lane_subscribers[event_type] = []
+        lane_subscribers[event_type].append(callback)
+        if lane == WORKER_LANE:
+            self._ensure_workers()
+        logger.debug("Subscribed %s to event '%s' on %s lane", _callback_name(callback), event_type, lane)
+
+    def unsubscribe(self, event_type: str, callback: Callable, lane: str = MAIN_LANE) -> bool:
+        """
+        Remove a callback added with ``subscribe``.
+
+        Args:
+            event_type: The event type the callback was subscribed to.
+            callback: The subscribed function.
+            lane: The lane it was subscribed on.
+
+        Returns:
+            True if the callback was subscribed and has been removed.
+        """
+        callbacks = self._subscribers.get(lane, {}).get(event_type)
+        if not callbacks or callback not in callbacks:
+            return False
+        callbacks.remove(callback)
+        if not callbacks:
+            # Routing checks for the key, so an emptied list must not linger.
+            del self._subscribers[lane][event_type]
+        logger.debug("Unsubscribed %s from event '%s' on %s lane", _callback_name(callback), event_type, lane)
+        return True
+
+    def subscribe_batch(self, event_type: str, callback: Callable[[List[Event]], None]):
+        """
+        Subscribe a main-thread callback that receives each frame's events of a type as one list.
+
+        Batching is enabled for the event type if it was not already.
+
+        Args:
+            event_type: The type of event to subscribe to.
+            callback: The function to call with the list of (coalesced) events.
+        """
+        if event_type not in self._batch_rules:
+            self.enable_batching(event_type)
+        self._batch_subscribers.setdefault(event_type, []).append(callback)
+        logger.debug("Subscribed %s to batched event '%s'", _callback_name(callback), event_type)
+
+    def enable_batching(self, event_type: str, coalesce: Optional[BatchCoalescer] = None):
+        """
+        Route an event type through the per-frame batch queue.
+
+        Main-lane delivery happens once per frame; worker-lane delivery coalesces
+        consecutive queued events with the same rule.
+
+        Args:
+            event_type: The type of event to batch.
+            coalesce: Optional rule that reduces a run of events before delivery.
+        """
+        self._batch_rules[event_type] = coalesce
 
     def dispatch(self, event: Event):
         """
-        Dispatch an event to all subscribed callbacks.
-        This method now emits a signal, ensuring the event is processed on the main thread.
+        Dispatch an event to all subscribed callbacks on their chosen lanes.
 
         Args:
             event: The Event object to dispatch.
         """
-        print(f"Dispatching event '{event.event_type}' with payload: {event.payload}")
-        self._signaller.signal.emit(event)
+        event_type = event.event_type
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching event '%s' with payload: %s", event_type, event.payload)
+        dispatched_at = time.monotonic()
+        self._stats.dispatched(event_type)
+
+        inline_callbacks = self._subscribers[INLINE_LANE].get(event_type)
+        if inline_callbacks:
+            for callback in inline_callbacks:
+                self._invoke(callback, event)
+            self._record_delivery(event, INLINE_LANE, dispatched_at, dequeued=False)
+
+        if event_type in self._subscribers[WORKER_LANE]:
+            self._lane_metrics[WORKER_LANE].enqueued()
+            self._worker_queue.put((event, dispatched_at))
+
+        if not self._needs_main_thread(event_type, bool(inline_callbacks)):
+            return
+        if self._enqueue_batched(event, dispatched_at, event_type in self._batch_rules):
+            return
+        self._lane_metrics[MAIN_LANE].enqueued()
+        self._signaller.signal.emit(event, dispatched_at)
+
+    def lane_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return queue depth and dispatch-to-delivery latency per lane.
+
+        Returns:
+            Mapping of lane name to depth, delivered count, and average/max latency in ms.
+        """
+        return {lane: metrics.snapshot() for lane, metrics in self._lane_metrics.items()}
+
+    def dump_trace(self, clear: bool = False) -> List[Dict[str, Any]]:
+        """
+        Return the sampled delivery records, oldest first.
+
+        Args:
+            clear: Empty the ring buffer after reading it.
+
+        Returns:
+            One dict per record with timestamp, event_type, lane, payload_size and latency_ms.
+        """
+        return self._trace.dump(clear=clear)
 
-    def _handle_event_on_main_thread(self, event: Event):
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the bus's latency and throughput instrumentation.
+
+        Returns:
+            ``lanes``: per-lane depth and latency (see ``lane_stats``);
+            ``event_types``: dispatch count and dispatch-to-delivery queue delay histogram per type;
+            ``callbacks``: execution time histogram per subscriber callback.
+        """
+        snapshot = self._stats.snapshot()
+        return {"lanes": self.lane_stats(), **snapshot}
+
+    def flush_batches(self):
+        """
+        Deliver every queued batched event on the calling (main) thread.
+
+        Events of a batched type are grouped into one slot at the position of the
+        type's first queued event, reduced by the type's coalescing rule, handed to
+        batch subscribers as a list, and then to main-lane subscribers one by one.
+        Other events queued behind the batch keep their own position.
+        """
+        with self._batch_lock:
+            queued = self._batch_queue
+            self._batch_queue = []
+            self._flush_pending = False
+        if not queued:
+            return
+
+        slots: List[Tuple[str, List[Event]]] = []
+        grouped: Dict[str, List[Event]] = {}
+        for event, dispatched_at in queued:
+            self._record_delivery(event, MAIN_LANE, dispatched_at)
+            event_type = event.event_type
+            if event_type not in self._batch_rules:
+                slots.append((event_type, [event]))
+                continue
+            group = grouped.get(event_type)
+            if group is None:
+                group = grouped[event_type] = []
+                slots.append((event_type, group))
+            group.append(event)
+
+        for event_type, group in slots:
+            if event_type in grouped:
+                group = self._coalesce(event_type, group)
+                for callback in self._batch_subscribers.get(event_type, []):
+                    self._invoke(callback, list(group), event_type)
+            for event in group:
+                self._deliver_main(event)
+
+    def shutdown(self):
+        """Stop the worker lane threads after they drain already queued events."""
+        with self._workers_lock:
+            workers = self._workers
+            self._workers = []
+        for _ in workers:
+            self._worker_queue.put(None)
+        for worker in workers:
+            worker.join(timeout=2.0)
+
+    def _needs_main_thread(self, event_type: str, has_inline: bool) -> bool:
+        if event_type in self._subscribers[MAIN_LANE] or event_type in self._batch_subscribers:
+            return True
+        # Unsubscribed events still reach the main thread so they are reported there.
+        return not has_inline and event_type not in self._subscribers[WORKER_LANE]
+
+    def _enqueue_batched(self, event: Event, dispatched_at: float, batched: bool) -> bool:
+        """Queue ``event`` for the next flush if it is batched or a batch is pending; report whether it was."""
+        with self._batch_lock:
+            if not batched and not self._batch_queue:
+                return False
+            self._lane_metrics[MAIN_LANE].enqueued()
+            self._batch_queue.append((event, dispatched_at))
+            if self._flush_pending:
+                return True
+            self._flush_pending = True
+        self._signaller.batch_ready.emit()
+        return True
+
+    def _schedule_batch_flush(self):
+        """Start the frame timer on the main thread once a batch begins filling."""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _coalesce(self, event_type: str, events: List[Event]) -> List[Event]:
+        coalesce = self._batch_rules.get(event_type)
+        if coalesce is None or len(events) < 2:
+            return events
+        try:
+            return coalesce(events)
+        except Exception:
+            logger.exception("Error coalescing batch for event '%s'", event_type)
+            return events
+
+    def _ensure_workers(self):
+        with self._workers_lock:
+            while len(self._workers) < self._worker_count:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"aura-event-worker-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+
+    def _worker_loop(self):
+        """Drain the worker queue, coalescing consecutive runs of batched event types."""
+        while True:
+            item = self._worker_queue.get()
+            if item is None:
+                return
+            drained = [item]
+            stop = False
+            while True:
+                try:
+                    extra = self._worker_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    stop = True
+                    break
+                drained.append(extra)
+
+            run: List[Event] = []
+            for event, dispatched_at in drained:
+                self._record_delivery(event, WORKER_LANE, dispatched_at)
+                if run and run[0].event_type != event.event_type:
+                    self._deliver_worker_run(run)
+                    run = []
+                run.append(event)
+            if run:
+                self._deliver_worker_run(run)
+            if stop:
+                return
+
+    def _deliver_worker_run(self, run: List[Event]):
+        event_type = run[0].event_type
+        if event_type in self._batch_rules:
+            run = self._coalesce(event_type, run)
+        callbacks = self._subscribers[WORKER_LANE].get(event_type, [])
+        for event in run:
+            for callback in callbacks:
+                self._invoke(callback, event)
+
+    def _handle_event_on_main_thread(self, event: Event, dispatched_at: float):
         """
         This slot is connected to the signaller's signal and ensures callbacks
         are executed on the main (UI) thread.
         """
+        self._record_delivery(event, MAIN_LANE, dispatched_at)
+        self._deliver_main(event)
+
+    def _record_delivery(self, event: Event, lane: str, dispatched_at: float, dequeued: bool = True):
+        latency = self._lane_metrics[lane].delivered_one(dispatched_at, dequeued=dequeued)
+        self._stats.queue_delay(event.event_type, latency)
+        self._trace.record(event, lane, latency)
+
+    def _deliver_main(self, event: Event):
         event_type = event.event_type
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"Error in callback {callback.__name__} for event '{event_type}': {e}")
-        else:
-            print(f"No subscribers for event '{event_type}'")
+        callbacks = self._subscribers[MAIN_LANE].get(event_type)
+        if callbacks:
+            for callback in callbacks:
+                self._invoke(callback, event)
+        elif event_type not in self._batch_subscribers and not self._has_off_main_subscribers(event_type):
+            logger.debug("No subscribers for event '%s'", event_type)
+
+    def _has_off_main_subscribers(self, event_type: str) -> bool:
+        return event_type in self._subscribers[WORKER_LANE] or event_type in self._subscribers[INLINE_LANE]
+
+    def _invoke(self, callback: Callable, event: Any, event_type: Optional[str] = None):
+        """Run one callback, timing it and logging (not raising) its errors."""
+        started = time.perf_counter()
+        try:
+            callback(event)
+        except Exception:
+            logger.exception(
+                "Error in callback %s for event '%s'",
+                _callback_name(callback),
+                event_type or event.event_type,
+            )
+        finally:
+            self._stats.callback_time(_callback_name(callback), time.perf_counter() - started)
+
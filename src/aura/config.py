@@ -15,5 +15,13 @@ AGENT_CONFIG = {
     "architect_agent": {
         "temperature": 0.05,  # Deterministic coding output
         "top_p": 0.9,
+        # Optional hedging: also send the prompt to a secondary model when the
+        # primary has not produced a first token within the deadline.
+        # "hedge_model": "llama3.1",
+        # "hedge_after_seconds": 3.0,
+        # Optional Gemini server-side context caching for large stable prefixes
+        # (system instruction + earlier turns, or the planning prompt template).
+        # "context_cache": True,
+        # "context_cache_ttl_seconds": 3600,
     },
 }
@@ -150,6 +150,35 @@ Payload:
 """
 
 TASK_PLAN_GENERATED = "TASK_PLAN_GENERATED"
+"""
+Dispatched while the architect plan streams in and once more when it is complete.
+
+Partial events fire as each plan section opens and closes, so the UI can show
+progress; the agent is launched as soon as the task spec section closes.
+
+Payload:
+    task_id (str): Task identifier
+    task_description (str): Detailed plan for the user (possibly incomplete while partial)
+    task_spec (str): Condensed specification handed to the terminal agent
+    partial (bool): True for streaming progress, False for the final plan
+    section (str, optional): Section that changed ("detailed_plan" or "task_spec"); partial events only
+    section_state (str, optional): "streaming" or "complete"; partial events only
+    timestamp (str): ISO-8601 timestamp
+"""
+
+AGENT_QUEUE_UPDATED = "AGENT_QUEUE_UPDATED"
+"""
+Dispatched by the agent task scheduler whenever its queue or running set changes.
+
+Payload:
+    task_id (str): Task whose state changed
+    change (str): 'queued', 'started', 'finished', 'launch_failed' or 'cancelled'
+    queued (list[dict]): Waiting tasks in launch order, each with task_id and project
+    running (list[dict]): Running tasks, each with task_id and project
+    max_concurrent (int): Concurrency limit
+    max_queue (int): Queue capacity
+    timestamp (str): ISO-8601 timestamp
+"""
 
 
 # Terminal I/O streaming events
@@ -172,6 +201,8 @@ Payload:
     task_id (str): Unique identifier for the task issuing the command
     command (str): Command string to send to the embedded terminal
     project_root (str, optional): Project directory associated with the command
+    dedicated_pty (bool, optional): True when the command already runs in its own PTY
+        through the terminal bridge, so the terminal only needs to show it
 """
 
 AGENT_OUTPUT = "AGENT_OUTPUT"
@@ -188,6 +219,43 @@ Payload:
 APP_START = "APP_START"
 APP_SHUTDOWN = "APP_SHUTDOWN"
 
+# LLM request lifecycle events
+LLM_REQUEST_CANCELLED = "LLM_REQUEST_CANCELLED"
+"""
+Dispatched when an in-flight LLM request is cancelled before completion.
+
+Payload:
+    agent_name (str): Agent whose request was cancelled
+    operation (str): LLMService operation that was running (e.g., 'run_for_agent')
+    reason (str): Why the request was cancelled
+"""
+
+LLM_REQUEST_METRICS = "LLM_REQUEST_METRICS"
+"""
+Dispatched after each provider call finishes, and in reply to REQUEST_LLM_METRICS.
+
+Payload:
+    span (dict | None): Timing span of the finished call (agent_name, provider, model, operation,
+        ttft_ms, duration_ms, chunks, bytes, chunks_per_second, outcome); None for snapshot replies
+    metrics (dict): Rolling percentiles keyed by '<agent>/<model>' (see LLMService.metrics)
+"""
+
+REQUEST_LLM_METRICS = "REQUEST_LLM_METRICS"
+"""
+Dispatched to ask LLMService for its current rolling latency metrics.
+
+Payload: None
+"""
+
+# Diagnostics events
+DEBUG_EVENT_BUS_STATS = "DEBUG_EVENT_BUS_STATS"
+"""
+Dispatched to render the EventBus latency/throughput statistics into the chat display.
+
+Payload:
+    top (int, optional): Number of slowest event types and callbacks to list (default 8)
+"""
+
 # Automation trigger events
 TRIGGER_AUTO_INTEGRATE = "TRIGGER_AUTO_INTEGRATE"
 """
@@ -1,13 +1,66 @@
+import os
+from typing import Any, Dict, Mapping, Optional
+
 from pydantic import BaseModel
-from typing import Any, Dict
 
-class Event(BaseModel):
+# Set AURA_VALIDATE_EVENTS=1 to run every Event through the pydantic contract.
+VALIDATE_EVENTS = os.getenv("AURA_VALIDATE_EVENTS", "").strip().lower() in {"1", "true", "yes"}
+
+
+class EventModel(BaseModel):
     """
     Data contract for all events flowing through the EventBus.
 
+    Used to validate events at boundaries (or every event in debug mode);
+    the bus itself carries the lightweight ``Event`` below.
+
     Attributes:
         event_type (str): The type of the event (e.g., "USER_MESSAGE_SENT").
         payload (Dict[str, Any]): The data associated with the event.
     """
     event_type: str
-    payload: Dict[str, Any] = {}
\ No newline at end of file
+    payload: Dict[str, Any] = {}
+
+
+class Event:
+    """
+    A single event flowing through the EventBus.
+
+    A plain ``__slots__`` object: constructing one is a couple of attribute
+    stores, which matters for high-volume events such as terminal output.
+    Validation against ``EventModel`` happens in ``Event.parse`` and, when
+    ``AURA_VALIDATE_EVENTS`` is set, on every construction.
+
+    Attributes:
+        event_type (str): The type of the event (e.g., "USER_MESSAGE_SENT").
+        payload (Dict[str, Any]): The data associated with the event.
+    """
+
+    __slots__ = ("event_type", "payload")
+
+    def __init__(self, event_type: str, payload: Optional[Dict[str, Any]] = None) -> None:
+        if VALIDATE_EVENTS:
+            model = EventModel(event_type=event_type, payload=payload if payload is not None else {})
+            event_type, payload = model.event_type, model.payload
+        self.event_type = event_type
+        self.payload = payload if payload is not None else {}
+
+    @classmethod
+    def parse(cls, data: Mapping[str, Any]) -> "Event":
+        """Validate untrusted event data against ``EventModel`` and build an Event from it."""
+        model = EventModel.model_validate(data)
+        return cls(event_type=model.event_type, payload=model.payload)
+
+    def to_model(self) -> EventModel:
+        """Return a validated pydantic copy of this event."""
+        return EventModel(event_type=self.event_type, payload=self.payload)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.event_type == other.event_type and self.payload == other.payload
+
+    __hash__ = None  # type: ignore[assignment]  # mutable payload, like the pydantic model
+
+    def __repr__(self) -> str:
+        return f"Event(event_type={self.event_type!r}, payload={self.payload!r})"
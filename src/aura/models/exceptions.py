@@ -51,3 +51,10 @@ class LLMConnectionError(LLMServiceError):
     connectivity issues.
     """
 
+
+
+class LLMCancelledError(LLMServiceError):
+    """
+    Raised when an in-flight LLM request is cancelled by its caller before
+    it completes. Cancellation is never retried.
+    """
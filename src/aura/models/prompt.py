@@ -0,0 +1,24 @@
+class PrefixedPrompt(str):
+    """
+    A prompt whose leading ``prefix`` is identical across requests.
+
+    It is a plain ``str`` (prefix + suffix) everywhere it is passed, so providers
+    and caches that know nothing about it keep working. The Gemini provider reads
+    ``prefix`` to place the stable part in a server-side cached context; Ollama
+    receives the whole prompt and relies on the server's own KV prefix cache.
+
+    Attributes:
+        prefix (str): Stable leading part (instructions, output template).
+    """
+
+    prefix: str
+
+    def __new__(cls, prefix: str, suffix: str) -> "PrefixedPrompt":
+        prompt = super().__new__(cls, prefix + suffix)
+        prompt.prefix = prefix
+        return prompt
+
+    @property
+    def suffix(self) -> str:
+        """The request-specific tail following ``prefix``."""
+        return self[len(self.prefix):]
@@ -5,32 +5,77 @@ import logging
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
 import pydantic
 from pydantic import BaseModel, Field
 
-from src.aura.app.event_bus import EventBus
+from src.aura.app.event_bus import WORKER_LANE, EventBus
 from src.aura.models.agent_task import AgentSpecification, TerminalSession, TaskSummary
 from src.aura.models.event_types import (
     TASK_PLAN_GENERATED,
     TERMINAL_SESSION_COMPLETED,
+    TERMINAL_OUTPUT_RECEIVED,
     TERMINAL_SESSION_FAILED,
     TERMINAL_SESSION_STARTED,
 )
 from src.aura.models.events import Event
+from src.aura.models.exceptions import LLMCancelledError
+from src.aura.models.prompt import PrefixedPrompt
+from src.aura.services.agent_task_scheduler import AgentQueueFullError, AgentTaskScheduler
 from src.aura.services.agents_md_formatter import format_specification_for_gemini
 from src.aura.services.llm_service import LLMService
+from src.aura.services.session_watcher import SessionCompletion, SessionWatcher
 from src.aura.services.terminal_agent_service import TerminalAgentService
 from src.aura.services.workspace_service import WorkspaceService
+from src.aura.utils.cancellation import CancellationToken
+from src.aura.utils.output_parser import CliStatsAccumulator
 
 
 logger = logging.getLogger(__name__)
 
+# Kept byte-for-byte stable and ahead of the user request so it can be served from
+# Gemini's cached context and hit Ollama's server-side KV prefix cache.
+_ARCHITECT_PROMPT_PREFIX = """You are Aura's architect agent. Produce TWO coordinated outputs for the user request below,
+in this order: <task_spec> before <detailed_plan>.
+
+<task_spec>
+[# Task: <concise project title>
+
+## Requirements
+- 5-10 bullet points covering functional and non-functional requirements.
+
+## Files to Create
+- path/to/file.py — Short purpose
+
+## Technical Constraints
+- Key guardrails, dependencies, or coding standards to honor.
+
+## Success Criteria
+- Observable behaviours or commands to validate completion.
+
+When complete, write .aura/{task_id}.done and .aura/{task_id}.summary.json files.]
+</task_spec>
+
+<detailed_plan>
+[Comprehensive plan for the user. Include rationale, file-by-file work, and implementation steps.
+Mirror the current detailed format with sections for Task Summary, Files, Implementation Steps, Testing, and Risks.
+Keep content thorough so a human developer could follow it end-to-end.]
+</detailed_plan>
+
+Rules:
+- Do NOT include code snippets inside <task_spec>.
+- Every file mentioned must include an explicit relative path.
+- Keep <task_spec> between 50 and 150 lines.
+- The user's request may include additional context; respect it precisely.
+
+"""
+
 
 @dataclass
 class TaskPlanningResult:
@@ -38,6 +83,90 @@ class TaskPlanningResult:
     task_spec: str
 
 
+class PlanStreamParser:
+    """
+    Incremental parser for the architect's tagged response.
+
+    A small state machine over streamed chunks: text outside a section is
+    ignored, ``<tag>`` opens a section and ``</tag>`` closes it. A tag split
+    across chunks is held back until it can be decided, so each section's
+    content is available the moment its closing tag arrives.
+    """
+
+    SECTIONS = ("detailed_plan", "task_spec")
+    _MAX_TAG_LENGTH = max(len(f"</{section}>") for section in SECTIONS)
+
+    def __init__(self) -> None:
+        self._raw: List[str] = []
+        self._pending = ""
+        self._section: Optional[str] = None
+        self._content: Dict[str, List[str]] = {}
+        self.closed: Dict[str, str] = {}
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._raw)
+
+    def section_text(self, section: str) -> str:
+        """Content streamed so far for ``section`` (complete once it is in ``closed``)."""
+        return self.closed.get(section) or "".join(self._content.get(section, ())).strip()
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """
+        Consume one chunk.
+
+        Returns:
+            ("open", section) and ("close", section) transitions, in stream order.
+        """
+        self._raw.append(chunk)
+        buffer, self._pending = self._pending + chunk, ""
+        transitions: List[Tuple[str, str]] = []
+        position = 0
+        while position < len(buffer):
+            start = buffer.find("<", position)
+            if start == -1:
+                self._append(buffer[position:])
+                break
+            self._append(buffer[position:start])
+            end = buffer.find(">", start, start + self._MAX_TAG_LENGTH)
+            if end == -1:
+                if len(buffer) - start < self._MAX_TAG_LENGTH:
+                    # Possibly a tag split across chunks; decide once more text arrives.
+                    self._pending = buffer[start:]
+                    break
+                self._append("<")
+                position = start + 1
+                continue
+            if self._transition(buffer[start + 1:end].strip().lower(), transitions):
+                position = end + 1
+            else:
+                self._append("<")
+                position = start + 1
+        return transitions
+
+    def finish(self) -> None:
+        """Flush any held-back text at the end of the stream."""
+        pending, self._pending = self._pending, ""
+        self._append(pending)
+
+    def _append(self, text: str) -> None:
+        if text and self._section is not None:
+            self._content.setdefault(self._section, []).append(text)
+
+    def _transition(self, tag: str, transitions: List[Tuple[str, str]]) -> bool:
+        if self._section is None and tag in self.SECTIONS and tag not in self.closed:
+            self._section = tag
+            transitions.append(("open", tag))
+            return True
+        if self._section is not None and tag == f"/{self._section}":
+            section, self._section = self._section, None
+            self.closed[section] = "".join(self._content.get(section, ())).strip()
+            transitions.append(("close", section))
+            return True
+        return False
+
+
 class ParsedCliStats(BaseModel):
     """Normalized statistics extracted from Gemini CLI logs and filesystem artefacts."""
 
@@ -60,6 +189,7 @@ class AgentSupervisor:
     _POLL_INTERVAL_SECONDS = 2.0
     _SESSION_TIMEOUT_SECONDS = 600.0
     _SUMMARY_WAIT_SECONDS = 5.0
+    _STATS_POLL_INTERVAL_SECONDS = 1.0
 
     def __init__(
         self,
@@ -73,6 +203,16 @@ class AgentSupervisor:
         self.workspace = workspace_service
         self.event_bus = event_bus
         self._sessions: dict[str, TerminalSession] = {}
+        self._plan_tokens: Dict[str, CancellationToken] = {}
+        self._plan_lock = threading.Lock()
+        # One watcher thread serves every session; finalization (which waits on
+        # exit codes and summaries) runs on a small pool so it never stalls it.
+        self._watcher = SessionWatcher(poll_interval=self._POLL_INTERVAL_SECONDS)
+        self._finalizer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aura-finalize")
+        self.scheduler = AgentTaskScheduler(self._launch_agent, event_bus)
+        # Per-session CLI stats, fed as output arrives so completion needs no full-log parse.
+        self._stats_accumulators: Dict[str, CliStatsAccumulator] = {}
+        self.event_bus.subscribe(TERMINAL_OUTPUT_RECEIVED, self._handle_terminal_output, lane=WORKER_LANE)
 
     def process_message(self, user_message: str, project_name: str) -> None:
         message = user_message.strip()
@@ -84,8 +224,31 @@ class AgentSupervisor:
 
         task_id = uuid4().hex[:12]
         project_path = self._ensure_project_directory(project)
-        plan = self._generate_task_plan(message)
-        spec = self._build_specification(task_id, project, message, plan.task_spec)
+        launched: List[str] = []
+
+        def _queue_early(task_spec: str) -> None:
+            # The spec is complete; queue the agent while the detailed plan keeps streaming.
+            if launched:
+                return
+            launched.append(task_spec)
+            self._queue_agent(task_id, project, project_path, message, task_spec)
+
+        try:
+            plan = self._generate_task_plan(
+                message, task_id=task_id, on_task_spec=_queue_early, plan_key=str(project_path)
+            )
+        except LLMCancelledError as exc:
+            logger.info("Task planning for %s abandoned: %s", task_id, exc)
+            return
+
+        # The agent may already be running on the streamed spec; report that one, not a re-parse.
+        task_spec = launched[0] if launched else plan.task_spec
+        spec_diverged = bool(launched) and task_spec.strip() != plan.task_spec.strip()
+        if spec_diverged:
+            logger.warning(
+                "Final task spec for %s differs from the spec the agent was launched with; reporting the launched one.",
+                task_id,
+            )
 
         # Dispatch event to show the user the plan
         self._dispatch_event(
@@ -93,11 +256,37 @@ class AgentSupervisor:
             {
                 "task_id": task_id,
                 "task_description": plan.detailed_plan,
-                "task_spec": plan.task_spec,
+                "task_spec": task_spec,
+                "partial": False,
+                "spec_diverged": spec_diverged,
                 "timestamp": datetime.utcnow().isoformat(),
             },
         )
 
+        if not launched:
+            self._queue_agent(task_id, project, project_path, message, plan.task_spec)
+
+    def _queue_agent(
+        self,
+        task_id: str,
+        project: str,
+        project_path: Path,
+        message: str,
+        task_spec: str,
+    ) -> None:
+        """Hand the task to the scheduler; it launches once a slot and the project are free."""
+        spec = self._build_specification(task_id, project, message, task_spec)
+        try:
+            self.scheduler.submit(spec, project_path)
+        except AgentQueueFullError as exc:
+            logger.warning("Rejected task %s: %s", task_id, exc)
+            self._dispatch_event(
+                TERMINAL_SESSION_FAILED,
+                {"task_id": task_id, "failure_reason": "queue_full", "error_message": str(exc)},
+            )
+
+    def _launch_agent(self, spec: AgentSpecification, project_path: Path) -> TerminalSession:
+        """Write GEMINI.md for the task, spawn the terminal agent and start monitoring it."""
         gemini_document = format_specification_for_gemini(spec)
         self._create_gemini_md(project_path, gemini_document, spec.task_id)
 
@@ -112,6 +301,9 @@ class AgentSupervisor:
             raise
 
         self._sessions[session.task_id] = session
+        self._stats_accumulators[session.task_id] = CliStatsAccumulator(
+            project_path / ".aura" / f"{session.task_id}.output.log"
+        )
         payload = {
             "task_id": session.task_id,
             "command": session.command,
@@ -121,54 +313,75 @@ class AgentSupervisor:
         if session.process_id is not None:
             payload["process_id"] = session.process_id
         self._dispatch_event(TERMINAL_SESSION_STARTED, payload)
-        self._start_monitor_thread(session, project_path)
+        self._watch_session(session, project_path)
+        return session
 
-    def _generate_task_plan(self, user_message: str) -> TaskPlanningResult:
+    def _generate_task_plan(
+        self,
+        user_message: str,
+        task_id: Optional[str] = None,
+        on_task_spec: Optional[Callable[[str], None]] = None,
+        plan_key: str = "",
+    ) -> TaskPlanningResult:
         """
         Generate both a detailed plan for the user and a concise task specification for Gemini.
-        """
-        prompt = f"""User request: {user_message}
-
-You are Aura's architect agent. Produce TWO coordinated outputs for this request.
-
-<detailed_plan>
-[Comprehensive plan for the user. Include rationale, file-by-file work, and implementation steps.
-Mirror the current detailed format with sections for Task Summary, Files, Implementation Steps, Testing, and Risks.
-Keep content thorough so a human developer could follow it end-to-end.]
-</detailed_plan>
-
-<task_spec>
-[# Task: <concise project title>
-
-## Requirements
-- 5-10 bullet points covering functional and non-functional requirements.
-
-## Files to Create
-- path/to/file.py — Short purpose
-
-## Technical Constraints
-- Key guardrails, dependencies, or coding standards to honor.
-
-## Success Criteria
-- Observable behaviours or commands to validate completion.
 
-When complete, write .aura/{{task_id}}.done and .aura/{{task_id}}.summary.json files.]
-</task_spec>
+        The response is streamed through ``PlanStreamParser``: each section opening and
+        closing is reported as a partial TASK_PLAN_GENERATED event (when ``task_id`` is
+        given), and ``on_task_spec`` runs as soon as ``</task_spec>`` arrives. A newer
+        plan with the same ``plan_key`` (project) cancels this one.
+        """
+        prompt = PrefixedPrompt(_ARCHITECT_PROMPT_PREFIX, f"User request: {user_message}\n")
 
-Rules:
-- Do NOT include code snippets inside <task_spec>.
-- Every file mentioned must include an explicit relative path.
-- Keep <task_spec> between 50 and 150 lines.
-- The user's request may include additional context; respect it precisely.
-"""
+        token = CancellationToken()
+        with self._plan_lock:
+            previous = self._plan_tokens.get(plan_key)
+            self._plan_tokens[plan_key] = token
+        if previous is not None:
+            # A newer request for the same project supersedes any plan still streaming.
+            previous.cancel("superseded by a newer request")
 
         try:
-            response = self.llm.run_for_agent(self._LLM_AGENT_NAME, prompt).strip()
+            stream = self.llm.stream_chat_for_agent(self._LLM_AGENT_NAME, prompt, cancel_token=token)
+        except LLMCancelledError:
+            raise
         except Exception as exc:
             logger.error("LLM task planning failed: %s", exc, exc_info=True)
             fallback = user_message or "(no task description provided)"
             return TaskPlanningResult(detailed_plan=fallback, task_spec=fallback)
 
+        parser = PlanStreamParser()
+        chunks = iter(stream)
+        try:
+            while True:
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    break
+                except LLMCancelledError:
+                    raise
+                except Exception as exc:
+                    # Keep whatever streamed before the failure; the fallbacks below cover the rest.
+                    logger.error("LLM task planning failed: %s", exc, exc_info=True)
+                    break
+                if not chunk:
+                    continue
+                for transition, section in parser.feed(str(chunk)):
+                    if task_id is not None:
+                        self._dispatch_plan_progress(task_id, parser, transition, section)
+                    if transition == "close" and section == "task_spec" and on_task_spec is not None:
+                        on_task_spec(parser.closed[section])
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                close()
+        parser.finish()
+
+        response = parser.text.strip()
+        if not response:
+            fallback = user_message or "(no task description provided)"
+            return TaskPlanningResult(detailed_plan=fallback, task_spec=fallback)
+
         plan = self._parse_plan_sections(response)
         if plan:
             return plan
@@ -177,6 +390,22 @@ Rules:
         fallback = response or user_message or "(no task description provided)"
         return TaskPlanningResult(detailed_plan=fallback, task_spec=fallback)
 
+    def _dispatch_plan_progress(
+        self, task_id: str, parser: PlanStreamParser, transition: str, section: str
+    ) -> None:
+        self._dispatch_event(
+            TASK_PLAN_GENERATED,
+            {
+                "task_id": task_id,
+                "task_description": parser.section_text("detailed_plan"),
+                "task_spec": parser.section_text("task_spec"),
+                "partial": True,
+                "section": section,
+                "section_state": "complete" if transition == "close" else "streaming",
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+        )
+
     def _parse_plan_sections(self, response: str) -> Optional[TaskPlanningResult]:
         if not response:
             return None
@@ -252,65 +481,34 @@ Rules:
         gemini_md_path.write_text(content + "\n", encoding="utf-8")
         logger.info("Wrote GEMINI.md to %s", gemini_md_path)
 
-    def _start_monitor_thread(self, session: TerminalSession, project_path: Path) -> None:
-        threading.Thread(
-            target=self._monitor_output_loop,
-            args=(session, project_path),
-            daemon=True,
-            name=f"aura-monitor-{session.task_id}",
-        ).start()
-
-    def _monitor_output_loop(self, session: TerminalSession, project_path: Path) -> None:
-        task_id = session.task_id
-        aura_dir = project_path / ".aura"
-        log_path = aura_dir / f"{task_id}.output.log"
-        done_path = aura_dir / f"{task_id}.done"
-        summary_path = aura_dir / f"{task_id}.summary.json"
-        start_time = time.monotonic()
-        completion_reason = "unknown"
-        timed_out = False
-
-        logger.debug(
-            "Monitoring terminal session %s (log=%s)",
-            task_id,
-            log_path,
+    def _watch_session(self, session: TerminalSession, project_path: Path) -> None:
+        """Register the session with the shared completion watcher."""
+        self._watcher.watch(
+            session,
+            project_path / ".aura",
+            lambda completion: self._finalizer.submit(self._complete_session, session, project_path, completion),
+            timeout=self._SESSION_TIMEOUT_SECONDS,
         )
 
+    def _complete_session(
+        self, session: TerminalSession, project_path: Path, completion: SessionCompletion
+    ) -> None:
+        task_id = session.task_id
         try:
-            while True:
-                if done_path.exists():
-                    completion_reason = "done-file-detected"
-                    break
-                if summary_path.exists():
-                    completion_reason = "summary-file-detected"
-                    break
-
-                exit_code = session.poll()
-                if exit_code is not None:
-                    completion_reason = "process-exited"
-                    break
-
-                elapsed = time.monotonic() - start_time
-                if elapsed >= self._SESSION_TIMEOUT_SECONDS:
-                    timed_out = True
-                    completion_reason = "timeout"
-                    break
-
-                time.sleep(self._POLL_INTERVAL_SECONDS)
-
-            duration_seconds = time.monotonic() - start_time
+            if completion.error is not None:
+                raise completion.error
             logger.info(
                 "Terminal session %s completion detected via %s after %.2fs",
                 task_id,
-                completion_reason,
-                duration_seconds,
+                completion.reason,
+                completion.duration_seconds,
             )
             self._finalize_session(
                 session,
                 project_path,
-                completion_reason=completion_reason,
-                duration_seconds=duration_seconds,
-                timed_out=timed_out,
+                completion_reason=completion.reason,
+                duration_seconds=completion.duration_seconds,
+                timed_out=completion.timed_out,
             )
         except Exception as exc:
             logger.error("Output monitor error for task %s: %s", task_id, exc, exc_info=True)
@@ -318,6 +516,12 @@ Rules:
                 TERMINAL_SESSION_FAILED,
                 {"task_id": task_id, "failure_reason": "monitor_error", "error_message": str(exc)},
             )
+        finally:
+            try:
+                self.terminal_service.end_session(task_id)
+            except Exception as exc:
+                logger.debug("Ending terminal session %s failed: %s", task_id, exc)
+            self.scheduler.release(task_id)
 
     def _finalize_session(
         self,
@@ -345,8 +549,13 @@ Rules:
         if summary_data.get("execution_time_seconds") is None:
             summary_data["execution_time_seconds"] = round(duration_seconds, 3)
 
+        try:
+            # Terminal logs are written in the background; make sure the tail has landed.
+            self.terminal_service.flush_output(session.task_id)
+        except Exception as exc:
+            logger.debug("Flushing terminal output for task %s failed: %s", session.task_id, exc)
         log_path = project_path / ".aura" / f"{session.task_id}.output.log"
-        cli_stats = self._parse_cli_stats(log_path)
+        cli_stats = self._parse_cli_stats(log_path, self._stats_accumulators.pop(session.task_id, None))
 
         payload: Dict[str, Any] = {
             "task_id": session.task_id,
@@ -417,20 +626,27 @@ Rules:
                 "note": "Summary file could not be retrieved or was invalid.",
             }
 
-    def _parse_cli_stats(self, log_path: Path) -> Optional[Dict[str, Any]]:
+    def _parse_cli_stats(
+        self, log_path: Path, accumulator: Optional[CliStatsAccumulator] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Derive CLI statistics for a finished session.
+
+        ``accumulator`` is the session's running ``CliStatsAccumulator``; only the
+        output it has not consumed yet is read. Without one the log is streamed
+        through a fresh accumulator in fixed-size chunks.
+        """
         if not log_path.exists():
             logger.debug("Output log not found for stats parsing: %s", log_path)
             return None
 
-        try:
-            log_text = log_path.read_text(encoding="utf-8", errors="replace")
-        except Exception as exc:
-            logger.debug("Failed reading output log %s: %s", log_path, exc)
-            return None
+        accumulator = accumulator or CliStatsAccumulator(log_path)
+        accumulator.consume_file()
+        accumulator.flush()
 
-        latest_block = self._extract_latest_json_block(log_text)
+        latest_block = accumulator.latest_json()
         json_stats = self._build_stats_from_json_payload(latest_block) if latest_block else None
-        text_stats = self._extract_stats_from_verbose_output(log_text)
+        text_stats = self._stats_from_accumulated_text(accumulator)
         filesystem_stats = self._inspect_filesystem_counts(log_path)
 
         merged = self._merge_parsed_cli_stats(json_stats, text_stats, filesystem_stats)
@@ -495,46 +711,22 @@ Rules:
     def _extract_stats_from_verbose_output(self, log_text: str) -> Optional[ParsedCliStats]:
         if not log_text:
             return None
+        accumulator = CliStatsAccumulator()
+        accumulator.feed(log_text)
+        accumulator.flush()
+        return self._stats_from_accumulated_text(accumulator)
 
-        tool_calls = 0
-        file_targets: Set[str] = set()
-        lines_added = 0
-        lines_removed = 0
-        matched_any = False
-
-        for raw_line in log_text.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-
-            if "using tool:" in line.lower():
-                tool_calls += 1
-                matched_any = True
-
-            writing_match = re.search(r"writing to:\s*(.+)", line, re.IGNORECASE)
-            if writing_match:
-                file_targets.add(writing_match.group(1).strip())
-                matched_any = True
-
-            wrote_match = re.search(r"(?:wrote|added)\s+(\d+)\s+lines", line, re.IGNORECASE)
-            if wrote_match:
-                lines_added += int(wrote_match.group(1))
-                matched_any = True
-
-            removed_match = re.search(r"(?:removed|deleted)\s+(\d+)\s+lines", line, re.IGNORECASE)
-            if removed_match:
-                lines_removed += int(removed_match.group(1))
-                matched_any = True
-
-        if not matched_any:
+    @staticmethod
+    def _stats_from_accumulated_text(accumulator: CliStatsAccumulator) -> Optional[ParsedCliStats]:
+        if not accumulator.matched_text:
             return None
 
-        files_created_count = len(file_targets) if file_targets else None
+        file_targets = accumulator.file_targets
         stats_model = ParsedCliStats(
-            files_created_count=files_created_count,
-            lines_added=lines_added or None,
-            lines_removed=lines_removed or None,
-            tool_calls=tool_calls or None,
+            files_created_count=len(file_targets) if file_targets else None,
+            lines_added=accumulator.lines_added or None,
+            lines_removed=accumulator.lines_removed or None,
+            tool_calls=accumulator.tool_calls or None,
             source="text",
         )
 
@@ -598,56 +790,9 @@ Rules:
         return merged
 
     def _extract_latest_json_block(self, log_text: str) -> Optional[Dict[str, Any]]:
-        candidates: list[int] = []
-        lowered = log_text.lower()
-        idx = lowered.rfind("json{")
-        while idx != -1:
-            brace_idx = log_text.find("{", idx)
-            if brace_idx != -1:
-                candidates.append(brace_idx)
-            idx = lowered.rfind("json{", 0, idx)
-
-        if not candidates:
-            brace_idx = log_text.rfind("{")
-            if brace_idx != -1:
-                candidates.append(brace_idx)
-
-        for start in candidates:
-            block = self._slice_balanced_block(log_text, start)
-            if not block:
-                continue
-            try:
-                return json.loads(block)
-            except json.JSONDecodeError as exc:
-                logger.debug("Failed to parse JSON block at %d: %s", start, exc)
-                continue
-        return None
-
-    @staticmethod
-    def _slice_balanced_block(text: str, start: int) -> Optional[str]:
-        depth = 0
-        in_string = False
-        escape = False
-        for idx in range(start, len(text)):
-            char = text[idx]
-            if in_string:
-                if escape:
-                    escape = False
-                elif char == "\\":
-                    escape = True
-                elif char == '"':
-                    in_string = False
-                continue
-
-            if char == '"':
-                in_string = True
-            elif char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    return text[start : idx + 1]
-        return None
+        accumulator = CliStatsAccumulator()
+        accumulator.feed(log_text)
+        return accumulator.latest_json()
 
     @staticmethod
     def _coerce_int(value: Any) -> Optional[int]:
@@ -656,6 +801,14 @@ Rules:
         except (TypeError, ValueError):
             return None
 
+    def _handle_terminal_output(self, event: Event) -> None:
+        task_id = (event.payload or {}).get("task_id")
+        accumulator = self._stats_accumulators.get(task_id) if task_id else None
+        if accumulator is not None:
+            # Output arrives in small chunks; reading the log once per interval keeps
+            # the running stats current without a file read per chunk.
+            accumulator.consume_file(min_interval=self._STATS_POLL_INTERVAL_SECONDS)
+
     def _dispatch_event(self, event_type: str, payload: dict[str, object]) -> None:
         try:
             self.event_bus.dispatch(Event(event_type=event_type, payload=payload))
@@ -0,0 +1,188 @@
+"""Bounded, project-aware scheduling of terminal agent tasks."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from src.aura.models.agent_task import AgentSpecification
+from src.aura.models.event_types import AGENT_QUEUE_UPDATED
+from src.aura.models.events import Event
+
+logger = logging.getLogger(__name__)
+
+
+class AgentQueueFullError(RuntimeError):
+    """Raised when a task is submitted while the scheduler queue is at capacity."""
+
+
+@dataclass
+class _ScheduledTask:
+    spec: AgentSpecification
+    project_path: Path
+    queued_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def task_id(self) -> str:
+        return self.spec.task_id
+
+    @property
+    def project_key(self) -> str:
+        return str(self.project_path)
+
+    def describe(self) -> Dict[str, str]:
+        return {"task_id": self.task_id, "project": self.spec.project_name or self.project_key}
+
+
+class AgentTaskScheduler:
+    """
+    Launch agent tasks concurrently, bounded and serialized per project.
+
+    Submitted specifications wait in a bounded FIFO queue. A task starts once
+    fewer than ``max_concurrent`` tasks are running and no other task is running
+    in the same project directory, so two agents never race on one project's
+    GEMINI.md. Tasks for a busy project do not block later tasks for other
+    projects. Every queue or running-set change is dispatched as
+    ``AGENT_QUEUE_UPDATED``.
+
+    ``launch(spec, project_path)`` runs on the thread that freed the slot (the
+    submitter or whoever calls ``release``); an exception from it frees the slot
+    again and is logged, so the launcher reports its own failures.
+    """
+
+    _DEFAULT_MAX_CONCURRENT = 2
+    _DEFAULT_MAX_QUEUE = 16
+
+    def __init__(
+        self,
+        launch: Callable[[AgentSpecification, Path], Any],
+        event_bus: Any = None,
+        *,
+        max_concurrent: Optional[int] = None,
+        max_queue: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            launch: Callable that starts a task; called as ``launch(spec, project_path)``.
+            event_bus: Optional bus for ``AGENT_QUEUE_UPDATED`` events.
+            max_concurrent: Running task limit (``AURA_MAX_CONCURRENT_AGENTS``, default 2).
+            max_queue: Waiting task limit (``AURA_MAX_QUEUED_AGENTS``, default 16).
+        """
+        self._launch = launch
+        self._event_bus = event_bus
+        self.max_concurrent = self._env_int("AURA_MAX_CONCURRENT_AGENTS", max_concurrent, self._DEFAULT_MAX_CONCURRENT)
+        self.max_queue = self._env_int("AURA_MAX_QUEUED_AGENTS", max_queue, self._DEFAULT_MAX_QUEUE)
+        self._lock = threading.Lock()
+        self._queue: Deque[_ScheduledTask] = deque()
+        self._running: Dict[str, _ScheduledTask] = {}
+
+    @staticmethod
+    def _env_int(name: str, explicit: Optional[int], default: int) -> int:
+        if explicit is not None:
+            return max(1, int(explicit))
+        raw = os.getenv(name)
+        if raw:
+            try:
+                return max(1, int(raw))
+            except ValueError:
+                logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+    # ------------------------------------------------------------------ Public API
+    def submit(self, spec: AgentSpecification, project_path: Path) -> bool:
+        """
+        Queue ``spec`` and start it right away if a slot and its project are free.
+
+        Returns:
+            True if the task was started immediately, False if it is waiting.
+
+        Raises:
+            AgentQueueFullError: The queue already holds ``max_queue`` tasks.
+        """
+        task = _ScheduledTask(spec=spec, project_path=Path(project_path))
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                raise AgentQueueFullError(
+                    f"Agent queue is full ({self.max_queue} tasks waiting); task {spec.task_id} rejected"
+                )
+            self._queue.append(task)
+        self._publish(task.task_id, "queued")
+        started = self._drain()
+        return task.task_id in started
+
+    def release(self, task_id: str) -> None:
+        """Mark a running task finished and start whatever can run next."""
+        with self._lock:
+            task = self._running.pop(task_id, None)
+        if task is None:
+            return
+        self._publish(task_id, "finished")
+        self._drain()
+
+    def cancel(self, task_id: str) -> bool:
+        """Drop a task that is still waiting; returns False if it is not queued."""
+        with self._lock:
+            for task in self._queue:
+                if task.task_id == task_id:
+                    self._queue.remove(task)
+                    break
+            else:
+                return False
+        self._publish(task_id, "cancelled")
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the queued and running tasks plus the configured limits."""
+        with self._lock:
+            return {
+                "queued": [task.describe() for task in self._queue],
+                "running": [task.describe() for task in self._running.values()],
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+            }
+
+    # ------------------------------------------------------------------ Internals
+    def _drain(self) -> List[str]:
+        started: List[str] = []
+        while True:
+            with self._lock:
+                task = self._next_runnable_locked()
+                if task is None:
+                    return started
+                self._queue.remove(task)
+                self._running[task.task_id] = task
+            self._publish(task.task_id, "started")
+            try:
+                self._launch(task.spec, task.project_path)
+            except Exception as exc:
+                logger.error("Launching agent task %s failed: %s", task.task_id, exc, exc_info=True)
+                with self._lock:
+                    self._running.pop(task.task_id, None)
+                self._publish(task.task_id, "launch_failed")
+                continue
+            started.append(task.task_id)
+
+    def _next_runnable_locked(self) -> Optional[_ScheduledTask]:
+        if len(self._running) >= self.max_concurrent:
+            return None
+        busy = {task.project_key for task in self._running.values()}
+        for task in self._queue:
+            if task.project_key not in busy:
+                return task
+        return None
+
+    def _publish(self, task_id: str, change: str) -> None:
+        if self._event_bus is None:
+            return
+        payload = {"task_id": task_id, "change": change, **self.snapshot()}
+        payload["timestamp"] = datetime.utcnow().isoformat()
+        try:
+            self._event_bus.dispatch(Event(event_type=AGENT_QUEUE_UPDATED, payload=payload))
+        except Exception:
+            logger.error("Failed to dispatch %s for task %s", AGENT_QUEUE_UPDATED, task_id, exc_info=True)
@@ -0,0 +1,215 @@
+"""
+Content-addressed on-disk cache for LLM responses.
+
+Deterministic calls (the architect planning prompt runs at a near-zero
+temperature) are keyed by agent, model, configuration and prompt, so repeating
+the same request returns the stored response instead of paying full provider
+latency again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Persist complete LLM responses under a hash of everything that shaped them.
+
+    Responsibilities:
+    - Derive a stable content address from agent, model, config and prompt.
+    - Store one JSON file per response, written atomically.
+    - Expire entries older than the TTL and evict least recently used entries
+      once the cache exceeds its size budget.
+    - Track hit/miss/write/eviction counters.
+    """
+
+    _SUFFIX = ".json"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_seconds: float = 24 * 60 * 60,
+        max_bytes: int = 50 * 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            cache_dir: Directory that will hold cached responses.
+            ttl_seconds: Age after which an entry is treated as a miss and deleted.
+            max_bytes: Total size budget; least recently used entries are evicted beyond it.
+        """
+        self._cache_dir = cache_dir
+        self._ttl_seconds = max(float(ttl_seconds), 0.0)
+        self._max_bytes = max(int(max_bytes), 0)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as exc:
+            logger.error("Unable to ensure LLM response cache directory %s: %s", cache_dir, exc, exc_info=True)
+            raise
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    @staticmethod
+    def make_key(agent_name: str, model_name: str, config: Dict[str, Any], prompt: Any) -> str:
+        """
+        Return the content address for a request.
+
+        Args:
+            agent_name: The configured agent name.
+            model_name: The provider model identifier.
+            config: The agent configuration passed to the provider.
+            prompt: The prompt string or structured messages.
+
+        Returns:
+            A SHA-256 hex digest.
+        """
+        material = json.dumps(
+            {"agent": agent_name, "model": model_name, "config": config, "prompt": prompt},
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for ``key``, or None on a miss or expired entry.
+
+        Args:
+            key: Content address from ``make_key``.
+        """
+        path = self._path_for(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._count("_misses")
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug("Discarding unreadable LLM cache entry %s: %s", path, exc)
+            self._remove(path)
+            self._count("_misses")
+            return None
+
+        created_at = float(entry.get("created_at") or 0.0)
+        if self._ttl_seconds and time.time() - created_at > self._ttl_seconds:
+            self._remove(path)
+            self._count("_misses")
+            return None
+
+        try:
+            # Touch for LRU ordering during eviction.
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("_hits")
+        return entry.get("response")
+
+    def put(self, key: str, response: str, **metadata: Any) -> None:
+        """
+        Store a complete response.
+
+        Args:
+            key: Content address from ``make_key``.
+            response: The full response text.
+            **metadata: Extra JSON-serialisable fields stored alongside the response.
+        """
+        path = self._path_for(key)
+        payload = json.dumps(
+            {"created_at": time.time(), "response": response, **metadata},
+            default=str,
+            ensure_ascii=False,
+        ).encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous_size = path.stat().st_size if path.exists() else 0
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            logger.warning("Failed to write LLM cache entry %s: %s", path, exc)
+            return
+
+        with self._lock:
+            self._writes += 1
+            self._total_bytes += len(payload) - previous_size
+            over_budget = self._max_bytes and self._total_bytes > self._max_bytes
+        if over_budget:
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        for path, _, _ in self._scan():
+            self._remove(path)
+        with self._lock:
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/write/eviction counters and the current on-disk size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "bytes": self._total_bytes,
+            }
+
+    def _path_for(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}{self._SUFFIX}"
+
+    def _scan(self) -> List[Tuple[Path, int, float]]:
+        entries: List[Tuple[Path, int, float]] = []
+        try:
+            for path in self._cache_dir.glob(f"*/*{self._SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        except OSError as exc:
+            logger.debug("Unable to scan LLM response cache: %s", exc, exc_info=True)
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits its budget."""
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= self._max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+                evicted += 1
+        with self._lock:
+            self._total_bytes = total
+            self._evictions += evicted
+        if evicted:
+            logger.info("Evicted %d LLM cache entries (%d bytes remain)", evicted, total)
+
+    def _remove(self, path: Path) -> bool:
+        try:
+            path.unlink(missing_ok=True)
+            return True
+        except OSError as exc:
+            logger.debug("Failed to remove LLM cache entry %s: %s", path, exc)
+            return False
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
@@ -1,85 +1,232 @@
 import copy
+import json
 import logging
+import os
+import queue
 import socket
+import sys
+import threading
 import time
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, TypeVar
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import asyncio
 
-from src.aura.app.event_bus import EventBus
+from src.aura.app.event_bus import WORKER_LANE, EventBus
 from src.aura.config import AGENT_CONFIG
+from src.aura.models.event_types import LLM_REQUEST_CANCELLED, LLM_REQUEST_METRICS, REQUEST_LLM_METRICS
 from src.aura.models.exceptions import (
+    LLMCancelledError,
     LLMConnectionError,
     LLMRateLimitError,
     LLMServiceError,
     LLMTimeoutError,
 )
 from src.aura.models.events import Event
+from src.aura.services.llm_response_cache import LLMResponseCache
+from src.aura.services.llm_telemetry import LLMTelemetry, RequestSpan
+from src.aura.utils.cancellation import CancellationToken
+from src.aura.utils.metrics import LatencyHistogram
 # Image storage is optional; import only for type checking
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 if _TYPE_CHECKING:  # pragma: no cover
     from src.aura.services.image_storage_service import ImageStorageService as _ImageStorageService
 from src.aura.services.user_settings_manager import load_user_settings
-# Providers are optional. Gracefully degrade if not installed/present.
-try:  # pragma: no cover - optional provider
-    from src.providers.gemini_provider import GeminiProvider  # type: ignore
-except Exception:  # pragma: no cover
-    GeminiProvider = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional provider
-    from src.providers.ollama_provider import OllamaProvider  # type: ignore
-except Exception:  # pragma: no cover
-    OllamaProvider = None  # type: ignore[assignment]
-
-try:
-    from requests import exceptions as requests_exceptions
-except Exception:  # pragma: no cover - requests may be optional in some deployments
-    requests_exceptions = None
-
-try:
-    from google.api_core import exceptions as google_exceptions
-except Exception:  # pragma: no cover - google client library may be optional
-    google_exceptions = None
+# Providers are optional and imported lazily; see src.providers.get_provider_class.
+from src.providers import get_provider_class, provider_names
 
 T = TypeVar("T")
+ProviderTarget = Tuple[Any, str, Dict[str, Any]]
+StreamStarter = Callable[[Any, str, Dict[str, Any]], Generator[str, None, None]]
 
 
 logger = logging.getLogger(__name__)
 
 
+def _loaded_module(name: str) -> Any:
+    """
+    Return an SDK exception module only if something already imported it.
+
+    An exception can only be an instance of a class from a module that is loaded,
+    so classification never needs to import ``requests`` or ``google.api_core`` itself.
+    """
+    return sys.modules.get(name)
+
+
+class LLMStream:
+    """
+    Iterable handle over a streaming LLM response.
+
+    Iterate it like the generator it wraps; call ``cancel`` from any thread to stop
+    the provider stream at the next chunk boundary and skip any pending retry backoff.
+    Iteration then raises ``LLMCancelledError``.
+    """
+
+    def __init__(self, generator: Generator[str, None, None], token: CancellationToken) -> None:
+        self._generator = generator
+        self.token = token
+
+    def __iter__(self) -> "LLMStream":
+        return self
+
+    def __next__(self) -> str:
+        return next(self._generator)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Request cancellation; returns False if the request was already cancelled."""
+        return self.token.cancel(reason)
+
+    def close(self) -> None:
+        """Release the underlying generator (and its provider stream) without cancelling."""
+        close = getattr(self._generator, "close", None)
+        if callable(close):
+            close()
+
+
 class LLMService:
     """
     Low-level dispatcher to LLM providers.
 
     Responsibilities:
-    - Load providers and model configurations.
+    - Load providers and model configurations; provider discovery runs on a background
+      thread so slow model listing (e.g. an unreachable Ollama server) never delays startup.
     - Map configured agents to provider models.
     - Offer simple streaming and non-streaming interfaces for a given agent.
     - Answer model list/config reload requests for the UI.
+    - Serve repeated deterministic requests from an optional on-disk response cache.
+    - Optionally hedge slow first tokens by racing a secondary model (agent config keys
+      ``hedge_model`` and ``hedge_after_seconds``), recording time-to-first-token per provider.
+    - Record a timing span for every provider call and keep rolling percentiles per agent/model.
     """
 
     _RETRY_BACKOFF_SECONDS: Tuple[int, ...] = (1, 2, 4)
+    _DEFAULT_HEDGE_AFTER_SECONDS = 3.0
+    _DISCOVERY_WAIT_SECONDS = 30.0
     _RETRY_SUGGESTIONS: Tuple[str, ...] = (
         "Check your LLM API key configuration.",
         "Verify your provider quota usage.",
         "Ensure your network connection is stable.",
     )
 
-    def __init__(self, event_bus: EventBus, image_storage: Optional["_ImageStorageService"] = None):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        image_storage: Optional["_ImageStorageService"] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        model_cache_path: Optional[Path] = None,
+    ):
         self.event_bus = event_bus
         self.image_storage = image_storage
+        self.response_cache = response_cache
         self.agent_config: Dict = {}
         self.providers: Dict = {}
         self.model_to_provider_map: Dict[str, str] = {}
+        self._inflight: Set[CancellationToken] = set()
+        self._inflight_lock = threading.Lock()
+        self._ttft: Dict[str, LatencyHistogram] = {}
+        self._ttft_lock = threading.Lock()
+        self.telemetry = LLMTelemetry()
+        self.model_cache_path = model_cache_path
+        self._cached_models: Dict[str, List[str]] = self._load_cached_models()
+        self._providers_ready = threading.Event()
 
-        self._load_providers()
         self._load_agent_configurations()
         self._register_event_handlers()
+        self._discovery_thread = threading.Thread(
+            target=self._discover_providers,
+            name="aura-llm-discovery",
+            daemon=True,
+        )
+        self._discovery_thread.start()
 
     # ------------------- Boot / Config -------------------
+    def wait_for_providers(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until background provider discovery has finished.
+
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            True if discovery finished, False on timeout.
+        """
+        return self._providers_ready.wait(timeout)
+
+    def _discover_providers(self) -> None:
+        """Load providers off the UI thread, persist their models and announce the result."""
+        try:
+            self._load_providers()
+        except Exception as exc:  # noqa: BLE001 - discovery must always release waiters
+            logger.error("LLM provider discovery failed: %s", exc, exc_info=True)
+        models_by_provider: Dict[str, List[str]] = {}
+        for model_name, provider_name in list(self.model_to_provider_map.items()):
+            models_by_provider.setdefault(provider_name, []).append(model_name)
+        self._cached_models = models_by_provider
+        self._persist_cached_models(models_by_provider)
+        # Announce before releasing waiters so listeners never see a half-loaded service.
+        self._dispatch_service_event(
+            "AVAILABLE_MODELS_RECEIVED",
+            {"models": models_by_provider, "stale": False},
+        )
+        self._providers_ready.set()
+
+    def _load_cached_models(self) -> Dict[str, List[str]]:
+        """Return the last-known model list persisted by a previous discovery run."""
+        if self.model_cache_path is None:
+            return {}
+        try:
+            data = json.loads(Path(self.model_cache_path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable model cache %s: %s", self.model_cache_path, exc)
+            return {}
+        models = data.get("models") if isinstance(data, dict) else None
+        if not isinstance(models, dict):
+            return {}
+        return {
+            str(provider): [str(model) for model in provider_models]
+            for provider, provider_models in models.items()
+            if isinstance(provider_models, list)
+        }
+
+    def _persist_cached_models(self, models_by_provider: Dict[str, List[str]]) -> None:
+        if self.model_cache_path is None:
+            return
+        path = Path(self.model_cache_path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps({"updated_at": time.time(), "models": models_by_provider}, indent=2),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to persist model cache %s: %s", path, exc)
+
     def _load_providers(self):
         logger.info("Loading LLM providers...")
         provider_instances = []
+        GeminiProvider = get_provider_class("Google")
         if GeminiProvider is not None:
             try:
                 logger.debug("Initializing GeminiProvider...")
@@ -89,6 +236,7 @@ class LLMService:
         else:
             logger.debug("GeminiProvider not imported (missing dependency or import error)")
 
+        OllamaProvider = get_provider_class("Ollama")
         if OllamaProvider is not None:
             try:
                 logger.debug("Initializing OllamaProvider...")
@@ -98,12 +246,17 @@ class LLMService:
         else:
             logger.debug("OllamaProvider not imported (missing dependency or import error)")
 
+        # Build new mappings and swap them in whole; other threads may be reading the old ones.
+        providers: Dict = {}
+        model_to_provider_map: Dict[str, str] = {}
         for provider in provider_instances:
-            self.providers[provider.provider_name] = provider
+            providers[provider.provider_name] = provider
             models = provider.get_available_models()
             for model_name in models:
-                self.model_to_provider_map[model_name] = provider.provider_name
+                model_to_provider_map[model_name] = provider.provider_name
             logger.info("Provider '%s' loaded with %d models", provider.provider_name, len(models))
+        self.providers = providers
+        self.model_to_provider_map = model_to_provider_map
 
         logger.info(f"Loaded {len(self.providers)} providers managing {len(self.model_to_provider_map)} models.")
 
@@ -151,11 +304,43 @@ class LLMService:
             logger.info("Agent '%s' configured with model: %s", agent_name, model)
 
     def _register_event_handlers(self):
-        self.event_bus.subscribe("RELOAD_LLM_CONFIG", lambda event: self._load_agent_configurations())
-        self.event_bus.subscribe("REQUEST_AVAILABLE_MODELS", self._handle_request_available_models)
+        # Both handlers touch disk or provider APIs; never run them on the UI thread.
+        self.event_bus.subscribe(
+            "RELOAD_LLM_CONFIG",
+            self._handle_reload_llm_config,
+            lane=WORKER_LANE,
+        )
+        self.event_bus.subscribe(
+            "REQUEST_AVAILABLE_MODELS",
+            self._handle_request_available_models,
+            lane=WORKER_LANE,
+        )
+        self.event_bus.subscribe(
+            REQUEST_LLM_METRICS,
+            self._handle_request_llm_metrics,
+            lane=WORKER_LANE,
+        )
+
+    def _handle_reload_llm_config(self, event: Event):
+        self._load_agent_configurations()
+        # Cached provider handles may embed the previous model/config choices.
+        for provider in self.providers.values():
+            clear_cache = getattr(provider, "clear_model_cache", None)
+            if callable(clear_cache):
+                clear_cache()
 
     # ------------------- Provider Mapping -------------------
-    def _get_provider_for_agent(self, agent_name: str):
+    def _get_provider_for_agent(self, agent_name: str, wait: bool = True):
+        # Requests on worker threads wait for discovery; the UI (main) thread never blocks on it.
+        current = threading.current_thread()
+        if (
+            wait
+            and not self._providers_ready.is_set()
+            and current is not self._discovery_thread
+            and current is not threading.main_thread()
+        ):
+            if not self._providers_ready.wait(self._DISCOVERY_WAIT_SECONDS):
+                self._warn_discovery_pending(agent_name)
         config = self.agent_config.get(agent_name)
         if config is None:
             return None, None, None
@@ -164,6 +349,23 @@ class LLMService:
         if not model_name:
             return None, None, config
 
+        return self._resolve_provider(model_name), model_name, config
+
+    async def _aget_provider_for_agent(self, agent_name: str):
+        """Async counterpart of ``_get_provider_for_agent``; waits for discovery without blocking the loop."""
+        if not self._providers_ready.is_set() and threading.current_thread() is not self._discovery_thread:
+            if not await asyncio.to_thread(self._providers_ready.wait, self._DISCOVERY_WAIT_SECONDS):
+                self._warn_discovery_pending(agent_name)
+        return self._get_provider_for_agent(agent_name, wait=False)
+
+    def _warn_discovery_pending(self, agent_name: str) -> None:
+        logger.warning(
+            "LLM provider discovery still running after %.0fs; resolving agent '%s' with providers loaded so far.",
+            self._DISCOVERY_WAIT_SECONDS,
+            agent_name,
+        )
+
+    def _resolve_provider(self, model_name: str):
         provider_name = self.model_to_provider_map.get(model_name)
         if not provider_name:
             # Attempt to infer from model prefix
@@ -175,69 +377,130 @@ class LLMService:
             if not provider_name and 'gemini' in model_name:
                 provider_name = 'Google'
 
-        provider = self.providers.get(provider_name)
-        return provider, model_name, config
+        return self.providers.get(provider_name)
+
+    def _get_hedge_for_agent(self, agent_name: str, model_name: str, config: Dict[str, Any]) -> Optional[ProviderTarget]:
+        """
+        Resolve the secondary (provider, model, config) raced against slow first tokens.
+
+        Args:
+            agent_name: The configured agent name.
+            model_name: The agent's primary model.
+            config: The agent's configuration.
+
+        Returns:
+            The hedge target, or None when hedging is not configured or not resolvable.
+        """
+        hedge_model = config.get("hedge_model")
+        if not isinstance(hedge_model, str) or not hedge_model.strip() or hedge_model == model_name:
+            return None
+        hedge_model = hedge_model.strip()
+        hedge_provider = self._resolve_provider(hedge_model)
+        if hedge_provider is None:
+            logger.debug("Hedge model '%s' for agent '%s' has no loaded provider.", hedge_model, agent_name)
+            return None
+        return hedge_provider, hedge_model, {**config, "model": hedge_model}
 
     # ------------------- Public Dispatcher APIs -------------------
-    def stream_chat_for_agent(self, agent_name: str, prompt: Any) -> Generator[str, None, None]:
+    def stream_chat_for_agent(
+        self,
+        agent_name: str,
+        prompt: Any,
+        cancel_token: Optional[CancellationToken] = None,
+        use_cache: bool = True,
+    ) -> LLMStream:
         """
-        Return a generator streaming chunks for the configured agent.
+        Return a cancellable stream of chunks for the configured agent.
 
         Args:
             agent_name: The configured agent name.
             prompt: The prompt payload to send to the provider.
+            cancel_token: Optional token to cancel the request with; one is created if omitted.
+            use_cache: Serve/store the response through the response cache when one is configured.
 
         Returns:
-            A generator yielding response chunks from the provider.
+            An ``LLMStream`` yielding response chunks from the provider.
 
         Raises:
             ValueError: If no provider/model mapping exists for the agent.
             LLMServiceError: If the provider call fails after all retries.
+            LLMCancelledError: If the stream is cancelled before it completes.
         """
         provider, model_name, config = self._get_provider_for_agent(agent_name)
         if not provider or not model_name:
             raise ValueError(f"Agent '{agent_name}' is not configured with a valid model.")
-        return self._stream_with_retries(
+        token = cancel_token or CancellationToken()
+        cache_key = self._cache_key(use_cache, agent_name, model_name, config, prompt)
+        cached = self._cache_lookup(cache_key, agent_name, "stream_chat")
+        if cached is not None:
+            return LLMStream(self._replay_cached(cached), token)
+        response: List[str] = []
+        generator = self._stream_with_retries(
             agent_name=agent_name,
             operation_name="stream_chat",
-            stream_factory=lambda: provider.stream_chat(model_name, prompt, config),
+            stream_factory=lambda: self._open_stream(
+                agent_name,
+                "stream_chat",
+                (provider, model_name, config),
+                lambda p, m, c: p.stream_chat(m, prompt, c),
+                token,
+            ),
+            cancel_token=token,
+            on_retry=response.clear,
         )
+        return LLMStream(self._tee_to_cache(generator, response, cache_key, agent_name, model_name), token)
 
-    def stream_structured_for_agent(self, agent_name: str, messages: List[Dict[str, Any]]) -> Generator[str, None, None]:
+    def stream_structured_for_agent(
+        self,
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        cancel_token: Optional[CancellationToken] = None,
+        use_cache: bool = True,
+    ) -> LLMStream:
         provider, model_name, config = self._get_provider_for_agent(agent_name)
         if not provider or not model_name:
             raise ValueError(f"Agent '{agent_name}' is not configured with a valid model.")
         operation_name = "stream_chat_structured"
+        token = cancel_token or CancellationToken()
 
-        def _factory() -> Generator[str, None, None]:
-            if hasattr(provider, "stream_chat_structured"):
-                return provider.stream_chat_structured(model_name, messages, config)
+        def _start(target: Any, target_model: str, target_config: Dict[str, Any]) -> Generator[str, None, None]:
+            if hasattr(target, "stream_chat_structured"):
+                return target.stream_chat_structured(target_model, messages, target_config)
 
-            prompt_parts: List[str] = []
-            for message in messages:
-                role_prefix = (
-                    f"{message['role'].capitalize()}: " if message.get("role") != "system" else ""
-                )
-                content = message.get("content", "")
-                if message.get("images"):
-                    content = f"{content} [Image attached]" if content else "[Image attached]"
-                prompt_parts.append(f"{role_prefix}{content}")
-            fallback_prompt = "\n\n".join(prompt_parts)
-            return provider.stream_chat(model_name, fallback_prompt, config)
-
-        return self._stream_with_retries(
+            return target.stream_chat(target_model, self._flatten_messages(messages), target_config)
+
+        def _factory() -> Generator[str, None, None]:
+            return self._open_stream(agent_name, operation_name, (provider, model_name, config), _start, token)
+
+        cache_key = self._cache_key(use_cache, agent_name, model_name, config, messages)
+        cached = self._cache_lookup(cache_key, agent_name, operation_name)
+        if cached is not None:
+            return LLMStream(self._replay_cached(cached), token)
+        response: List[str] = []
+        generator = self._stream_with_retries(
             agent_name=agent_name,
             operation_name=operation_name,
             stream_factory=_factory,
+            cancel_token=token,
+            on_retry=response.clear,
         )
+        return LLMStream(self._tee_to_cache(generator, response, cache_key, agent_name, model_name), token)
 
-    def run_for_agent(self, agent_name: str, prompt: str) -> str:
+    def run_for_agent(
+        self,
+        agent_name: str,
+        prompt: str,
+        cancel_token: Optional[CancellationToken] = None,
+        use_cache: bool = True,
+    ) -> str:
         """
         Execute a blocking LLM call and return the concatenated response text.
 
         Args:
             agent_name: The configured agent name.
             prompt: The textual prompt to send to the provider.
+            cancel_token: Optional token another thread can use to abort the call.
+            use_cache: Serve/store the response through the response cache when one is configured.
 
         Returns:
             The full response text returned by the provider.
@@ -245,31 +508,440 @@ class LLMService:
         Raises:
             ValueError: If no provider/model mapping exists for the agent.
             LLMServiceError: If the provider call fails after all retries.
+            LLMCancelledError: If the call is cancelled before it completes.
         """
         provider, model_name, config = self._get_provider_for_agent(agent_name)
         if not provider or not model_name:
             raise ValueError(f"Agent '{agent_name}' is not configured with a valid model.")
+        token = cancel_token or CancellationToken()
+        cache_key = self._cache_key(use_cache, agent_name, model_name, config, prompt)
+        cached = self._cache_lookup(cache_key, agent_name, "run_for_agent")
+        if cached is not None:
+            return cached
 
         def _operation() -> str:
-            stream = provider.stream_chat(model_name, prompt, config)
+            stream = self._open_stream(
+                agent_name,
+                "run_for_agent",
+                (provider, model_name, config),
+                lambda p, m, c: p.stream_chat(m, prompt, c),
+                token,
+            )
             chunks: List[str] = []
-            for chunk in stream:
-                if chunk is None:
-                    continue
-                chunks.append(str(chunk))
+            try:
+                for chunk in stream:
+                    if token.cancelled:
+                        break
+                    if chunk is None:
+                        continue
+                    chunks.append(str(chunk))
+            finally:
+                self._close_stream(stream)
             return "".join(chunks)
 
-        return self._invoke_with_retries(
+        response = self._invoke_with_retries(
             agent_name=agent_name,
             operation_name="run_for_agent",
             operation=_operation,
+            cancel_token=token,
+        )
+        self._cache_store(cache_key, response, agent_name, model_name)
+        return response
+
+    # ------------------- Telemetry / Time To First Token -------------------
+    def metrics(self, agent_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return rolling request latency percentiles keyed by ``"<agent>/<model>"``.
+
+        Args:
+            agent_name: Restrict the result to one agent.
+
+        Returns:
+            Per agent/model: provider, request/error counts, p50/p95 time-to-first-token
+            and total duration in ms, and median chunks per second.
+        """
+        return self.telemetry.summary(agent_name)
+
+    def time_to_first_token_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return time-to-first-token histograms keyed by ``"<provider>:<model>"``.
+
+        Returns:
+            Mapping of provider/model to count, mean/max and p50/p95/p99 in ms.
+        """
+        with self._ttft_lock:
+            histograms = dict(self._ttft)
+        return {key: histogram.snapshot() for key, histogram in sorted(histograms.items())}
+
+    def _record_ttft(self, provider_name: str, model_name: str, seconds: float) -> None:
+        key = f"{provider_name}:{model_name}"
+        with self._ttft_lock:
+            histogram = self._ttft.get(key)
+            if histogram is None:
+                histogram = self._ttft[key] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def _finish_span(self, span: RequestSpan, outcome: str) -> None:
+        """Close a request span, fold it into the rolling metrics and publish it."""
+        span.finish(outcome)
+        ttft_ms = span.ttft_ms
+        if ttft_ms is not None:
+            self._record_ttft(span.provider, span.model, ttft_ms / 1000)
+        self.telemetry.record(span)
+        self._dispatch_service_event(
+            LLM_REQUEST_METRICS,
+            {"span": span.to_dict(), "metrics": self.metrics()},
         )
 
+    @staticmethod
+    def _provider_label(provider: Any) -> str:
+        return getattr(provider, "provider_name", type(provider).__name__)
+
+    def _open_stream(
+        self,
+        agent_name: str,
+        operation_name: str,
+        primary: ProviderTarget,
+        start: StreamStarter,
+        token: CancellationToken,
+    ) -> Generator[str, None, None]:
+        """
+        Open the provider stream for one attempt, hedged when the agent configures it.
+
+        Args:
+            agent_name: The configured agent name.
+            operation_name: Operation recorded on the request span.
+            primary: The agent's (provider, model, config).
+            start: Callable opening a provider stream for a (provider, model, config).
+            token: The request's cancellation token.
+
+        Returns:
+            A generator of response chunks with a timing span recorded per provider call.
+        """
+        provider, model_name, config = primary
+        hedge = self._get_hedge_for_agent(agent_name, model_name, config)
+        if hedge is None:
+            return self._timed_stream(
+                agent_name, operation_name, provider, model_name, lambda: start(provider, model_name, config)
+            )
+        try:
+            hedge_after = float(config.get("hedge_after_seconds", self._DEFAULT_HEDGE_AFTER_SECONDS))
+        except (TypeError, ValueError):
+            hedge_after = self._DEFAULT_HEDGE_AFTER_SECONDS
+        return self._hedged_stream(
+            agent_name, operation_name, [primary, hedge], max(hedge_after, 0.0), start, token
+        )
+
+    def _timed_stream(
+        self,
+        agent_name: str,
+        operation_name: str,
+        provider: Any,
+        model_name: str,
+        opener: Callable[[], Generator[str, None, None]],
+    ) -> Generator[str, None, None]:
+        span = RequestSpan(agent_name, self._provider_label(provider), model_name, operation_name)
+        # Closing the generator early (consumer stopped, lost hedge race) counts as cancelled.
+        outcome = "cancelled"
+        stream = None
+        try:
+            stream = opener()
+            for chunk in stream:
+                span.chunk(chunk)
+                yield chunk
+            outcome = "ok"
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            if stream is not None:
+                self._close_stream(stream)
+            self._finish_span(span, outcome)
+
+    async def _atimed_stream(
+        self,
+        agent_name: str,
+        operation_name: str,
+        provider: Any,
+        model_name: str,
+        stream: AsyncIterator[str],
+    ) -> AsyncIterator[str]:
+        """Async counterpart of ``_timed_stream``."""
+        span = RequestSpan(agent_name, self._provider_label(provider), model_name, operation_name)
+        outcome = "cancelled"
+        try:
+            async for chunk in stream:
+                span.chunk(chunk)
+                yield chunk
+            outcome = "ok"
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            self._finish_span(span, outcome)
+
+    def _hedged_stream(
+        self,
+        agent_name: str,
+        operation_name: str,
+        contenders: List[ProviderTarget],
+        hedge_after: float,
+        start: StreamStarter,
+        token: CancellationToken,
+    ) -> Generator[str, None, None]:
+        """
+        Race the primary stream against a secondary one started after ``hedge_after`` seconds.
+
+        The first contender to deliver a chunk wins and the other is cancelled. The
+        secondary also starts immediately if the primary fails before any output.
+
+        Args:
+            agent_name: The configured agent name.
+            operation_name: Operation recorded on each contender's request span.
+            contenders: Primary and secondary (provider, model, config) targets.
+            hedge_after: First-token deadline before the secondary is started.
+            start: Callable opening a provider stream for a target.
+            token: The request's cancellation token.
+
+        Yields:
+            Chunks from the winning stream.
+        """
+        results: "queue.Queue[Tuple[Optional[int], str, Any]]" = queue.Queue()
+        tokens = [CancellationToken() for _ in contenders]
+        token.add_callback(lambda _token: results.put((None, "cancelled", None)))
+        launched: List[int] = []
+
+        def _launch(index: int) -> None:
+            provider, model_name, config = contenders[index]
+            child = tokens[index]
+
+            def _pump() -> None:
+                try:
+                    stream = self._timed_stream(
+                        agent_name, operation_name, provider, model_name, lambda: start(provider, model_name, config)
+                    )
+                    try:
+                        for chunk in stream:
+                            if child.cancelled:
+                                break
+                            results.put((index, "chunk", chunk))
+                    finally:
+                        stream.close()
+                except Exception as exc:  # noqa: BLE001 - surfaced to the consumer below
+                    results.put((index, "error", exc))
+                else:
+                    results.put((index, "done", None))
+
+            launched.append(index)
+            threading.Thread(target=_pump, name=f"aura-llm-hedge-{index}", daemon=True).start()
+
+        def _claim(index: int) -> None:
+            for other in launched:
+                if other != index:
+                    tokens[other].cancel("lost hedged race")
+            _, winner_model, _ = contenders[index]
+            if len(launched) > 1:
+                logger.info("Hedged request for agent '%s' won by model '%s'.", agent_name, winner_model)
+
+        _launch(0)
+        deadline = time.monotonic() + hedge_after
+        winner: Optional[int] = None
+        errors: Dict[int, Exception] = {}
+        try:
+            while True:
+                timeout = None
+                if winner is None and len(launched) < len(contenders):
+                    timeout = max(deadline - time.monotonic(), 0.0)
+                try:
+                    index, kind, value = results.get(timeout=timeout)
+                except queue.Empty:
+                    _, hedge_model, _ = contenders[1]
+                    logger.info(
+                        "No first token for agent '%s' within %.1fs; hedging with model '%s'.",
+                        agent_name,
+                        hedge_after,
+                        hedge_model,
+                    )
+                    _launch(1)
+                    continue
+
+                if kind == "cancelled":
+                    return
+                if winner is not None and index != winner:
+                    continue
+                if kind == "chunk":
+                    if winner is None:
+                        winner = index
+                        _claim(index)
+                    yield value
+                elif kind == "done":
+                    if winner is None:
+                        winner = index
+                        _claim(index)
+                    return
+                else:
+                    if winner is not None:
+                        raise value
+                    errors[index] = value
+                    if len(launched) < len(contenders):
+                        _launch(len(launched))
+                        continue
+                    if len(errors) == len(launched):
+                        raise errors.get(0, value)
+        finally:
+            for child in tokens:
+                child.cancel("hedged request finished")
+
+    # ------------------- Response Cache -------------------
+    def _cache_key(
+        self,
+        use_cache: bool,
+        agent_name: str,
+        model_name: str,
+        config: Dict[str, Any],
+        prompt: Any,
+    ) -> Optional[str]:
+        if not use_cache or self.response_cache is None:
+            return None
+        return self.response_cache.make_key(agent_name, model_name, config, prompt)
+
+    @staticmethod
+    def _replay_cached(cached: str) -> Generator[str, None, None]:
+        yield cached
+
+    def _cache_lookup(self, cache_key: Optional[str], agent_name: str, operation_name: str) -> Optional[str]:
+        if cache_key is None or self.response_cache is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        stats = self.response_cache.stats()
+        if cached is None:
+            logger.debug(
+                "LLM cache miss for %s (agent '%s'; hits=%d, misses=%d)",
+                operation_name,
+                agent_name,
+                stats["hits"],
+                stats["misses"],
+            )
+            return None
+        logger.info(
+            "LLM cache hit for %s (agent '%s'; hits=%d, misses=%d)",
+            operation_name,
+            agent_name,
+            stats["hits"],
+            stats["misses"],
+        )
+        return cached
+
+    def _cache_store(self, cache_key: Optional[str], response: str, agent_name: str, model_name: str) -> None:
+        if cache_key is None or self.response_cache is None or not response:
+            return
+        self.response_cache.put(cache_key, response, agent_name=agent_name, model=model_name)
+
+    def _tee_to_cache(
+        self,
+        generator: Generator[str, None, None],
+        chunks: List[str],
+        cache_key: Optional[str],
+        agent_name: str,
+        model_name: str,
+    ) -> Generator[str, None, None]:
+        """
+        Pass chunks through and cache the full response only if the stream completes.
+
+        ``chunks`` collects the response; the retry loop must clear it (``on_retry``)
+        when it restarts the stream, so only the successful attempt is cached.
+        """
+        if cache_key is None:
+            return generator
+
+        def _tee() -> Generator[str, None, None]:
+            try:
+                for chunk in generator:
+                    if chunk is not None:
+                        chunks.append(str(chunk))
+                    yield chunk
+            finally:
+                generator.close()
+            self._cache_store(cache_key, "".join(chunks), agent_name, model_name)
+
+        return _tee()
+
+    def cancel_all(self, reason: str = "cancelled") -> int:
+        """
+        Cancel every in-flight request, sync or async (e.g. when the window closes).
+
+        Args:
+            reason: Reason reported with each cancellation event.
+
+        Returns:
+            The number of requests that were cancelled.
+        """
+        with self._inflight_lock:
+            tokens = list(self._inflight)
+        cancelled = sum(1 for token in tokens if token.cancel(reason))
+        if cancelled:
+            logger.info("Cancelled %d in-flight LLM request(s): %s", cancelled, reason)
+        return cancelled
+
+    @contextmanager
+    def _track_request(self, token: CancellationToken) -> Iterator[None]:
+        with self._inflight_lock:
+            self._inflight.add(token)
+        try:
+            yield
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(token)
+
+    def _raise_if_cancelled(self, token: CancellationToken, agent_name: str, operation_name: str) -> None:
+        """
+        Emit ``LLM_REQUEST_CANCELLED`` and raise ``LLMCancelledError`` if the token was cancelled.
+
+        Args:
+            token: The request's cancellation token.
+            agent_name: The agent associated with the request.
+            operation_name: Human-readable operation identifier for logging.
+
+        Raises:
+            LLMCancelledError: If the token is cancelled.
+        """
+        if not token.cancelled:
+            return
+        reason = token.reason or "cancelled"
+        logger.info("LLM %s for agent '%s' cancelled: %s", operation_name, agent_name, reason)
+        self._dispatch_service_event(
+            LLM_REQUEST_CANCELLED,
+            {"agent_name": agent_name, "operation": operation_name, "reason": reason},
+        )
+        raise LLMCancelledError(
+            f"{operation_name} for agent '{agent_name}' was cancelled: {reason}",
+            agent_name=agent_name,
+        )
+
+    def _backoff(self, token: CancellationToken, attempt: int, agent_name: str, operation_name: str) -> None:
+        """Sleep before the next retry, waking immediately if the request is cancelled."""
+        token.wait(self._RETRY_BACKOFF_SECONDS[attempt])
+        self._raise_if_cancelled(token, agent_name, operation_name)
+
+    @staticmethod
+    def _close_stream(stream: Any) -> None:
+        close = getattr(stream, "close", None)
+        if close is None:
+            return
+        try:
+            close()
+        except Exception:  # noqa: BLE001 - closing is best effort
+            logger.debug("Failed to close provider stream", exc_info=True)
+
     def _invoke_with_retries(
         self,
         agent_name: str,
         operation_name: str,
         operation: Callable[[], T],
+        cancel_token: Optional[CancellationToken] = None,
     ) -> T:
         """
         Execute a provider operation with exponential backoff handling.
@@ -278,17 +950,32 @@ class LLMService:
             agent_name: The agent associated with the request.
             operation_name: Human-readable operation identifier for logging.
             operation: Callable that executes the provider request.
+            cancel_token: Optional token that aborts the operation and any pending backoff.
 
         Returns:
             The result returned by the operation.
 
         Raises:
             LLMServiceError: If the operation fails after retries or encounters a non-retryable error.
+            LLMCancelledError: If the token is cancelled before the operation completes.
         """
+        token = cancel_token or CancellationToken()
         total_attempts = len(self._RETRY_BACKOFF_SECONDS) + 1
-        for attempt in range(total_attempts):
-            try:
-                result = operation()
+        with self._track_request(token):
+            for attempt in range(total_attempts):
+                self._raise_if_cancelled(token, agent_name, operation_name)
+                try:
+                    result = operation()
+                except Exception as exc:  # noqa: BLE001 - we classify below
+                    self._raise_if_cancelled(token, agent_name, operation_name)
+                    error, retryable = self._categorize_exception(exc, agent_name, operation_name)
+                    if not retryable or attempt == len(self._RETRY_BACKOFF_SECONDS):
+                        self._handle_permanent_failure(agent_name, operation_name, error)
+                    retry_count = attempt + 1
+                    self._handle_retry(agent_name, operation_name, error, retry_count)
+                    self._backoff(token, attempt, agent_name, operation_name)
+                    continue
+                self._raise_if_cancelled(token, agent_name, operation_name)
                 logger.info(
                     "LLM %s succeeded for agent '%s' on attempt %d/%d.",
                     operation_name,
@@ -297,13 +984,6 @@ class LLMService:
                     total_attempts,
                 )
                 return result
-            except Exception as exc:  # noqa: BLE001 - we classify below
-                error, retryable = self._categorize_exception(exc, agent_name, operation_name)
-                if not retryable or attempt == len(self._RETRY_BACKOFF_SECONDS):
-                    self._handle_permanent_failure(agent_name, operation_name, error)
-                retry_count = attempt + 1
-                self._handle_retry(agent_name, operation_name, error, retry_count)
-                time.sleep(self._RETRY_BACKOFF_SECONDS[attempt])
 
         # The loop exits via return or permanent failure; this guard satisfies type checkers.
         raise LLMServiceError(
@@ -316,6 +996,8 @@ class LLMService:
         agent_name: str,
         operation_name: str,
         stream_factory: Callable[[], Generator[str, None, None]],
+        cancel_token: Optional[CancellationToken] = None,
+        on_retry: Optional[Callable[[], None]] = None,
     ) -> Generator[str, None, None]:
         """
         Execute a streaming provider operation with exponential backoff handling.
@@ -324,55 +1006,648 @@ class LLMService:
             agent_name: The agent associated with the request.
             operation_name: Human-readable operation identifier for logging.
             stream_factory: Callable that returns the provider's streaming generator.
+            cancel_token: Optional token that stops the stream and any pending backoff.
+            on_retry: Called before each new attempt; the chunks already yielded belong to a failed one.
 
         Returns:
             A generator yielding response chunks from the provider.
 
         Raises:
             LLMServiceError: If streaming fails after retries or encounters a non-retryable error.
+            LLMCancelledError: If the token is cancelled before the stream completes.
         """
+        token = cancel_token or CancellationToken()
         total_attempts = len(self._RETRY_BACKOFF_SECONDS) + 1
 
         def _generator() -> Generator[str, None, None]:
+            with self._track_request(token):
+                for attempt in range(total_attempts):
+                    self._raise_if_cancelled(token, agent_name, operation_name)
+                    if attempt and on_retry is not None:
+                        on_retry()
+                    try:
+                        stream = stream_factory()
+                    except Exception as exc:  # noqa: BLE001 - classification occurs below
+                        error, retryable = self._categorize_exception(exc, agent_name, operation_name)
+                        if not retryable or attempt == len(self._RETRY_BACKOFF_SECONDS):
+                            self._handle_permanent_failure(agent_name, operation_name, error)
+                        retry_count = attempt + 1
+                        self._handle_retry(agent_name, operation_name, error, retry_count)
+                        self._backoff(token, attempt, agent_name, operation_name)
+                        continue
+
+                    try:
+                        for chunk in stream:
+                            if token.cancelled:
+                                break
+                            yield chunk
+                    except Exception as exc:  # noqa: BLE001 - classification occurs below
+                        self._raise_if_cancelled(token, agent_name, operation_name)
+                        error, retryable = self._categorize_exception(exc, agent_name, operation_name)
+                        if not retryable or attempt == len(self._RETRY_BACKOFF_SECONDS):
+                            self._handle_permanent_failure(agent_name, operation_name, error)
+                        retry_count = attempt + 1
+                        self._handle_retry(agent_name, operation_name, error, retry_count)
+                        self._backoff(token, attempt, agent_name, operation_name)
+                        continue
+                    finally:
+                        self._close_stream(stream)
+
+                    self._raise_if_cancelled(token, agent_name, operation_name)
+                    logger.info(
+                        "LLM %s completed for agent '%s' on attempt %d/%d.",
+                        operation_name,
+                        agent_name,
+                        attempt + 1,
+                        total_attempts,
+                    )
+                    return
+
+            raise LLMServiceError(
+                f"Streaming operation '{operation_name}' entered an unexpected retry state for agent '{agent_name}'.",
+                agent_name=agent_name,
+            )
+
+        return _generator()
+
+    # ------------------- Async Dispatcher APIs -------------------
+    async def astream_chat_for_agent(
+        self,
+        agent_name: str,
+        prompt: Any,
+        cancel_token: Optional[CancellationToken] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``stream_chat_for_agent``.
+
+        Retry backoff awaits instead of sleeping, and cancelling the consuming task
+        cancels the in-flight provider request, so many requests can share one loop.
+        The request is tracked like a synchronous one: ``cancel_token`` and
+        ``cancel_all`` stop it, and it shares the response cache and hedging.
+
+        Args:
+            agent_name: The configured agent name.
+            prompt: The prompt payload to send to the provider.
+            cancel_token: Optional token to cancel the request with; one is created if omitted.
+            use_cache: Serve/store the response through the response cache when one is configured.
+
+        Yields:
+            Response chunks from the provider.
+
+        Raises:
+            ValueError: If no provider/model mapping exists for the agent.
+            LLMServiceError: If the provider call fails after all retries.
+            LLMCancelledError: If the token is cancelled before the stream completes.
+        """
+        provider, model_name, config = await self._aget_provider_for_agent(agent_name)
+        if not provider or not model_name:
+            raise ValueError(f"Agent '{agent_name}' is not configured with a valid model.")
+        operation_name = "astream_chat"
+        token = cancel_token or CancellationToken()
+        cache_key = self._cache_key(use_cache, agent_name, model_name, config, prompt)
+        cached = self._cache_lookup(cache_key, agent_name, operation_name)
+        if cached is not None:
+            yield cached
+            return
+        response: List[str] = []
+        stream = self._astream_with_retries(
+            agent_name=agent_name,
+            operation_name=operation_name,
+            stream_factory=lambda: self._aopen_stream(
+                agent_name,
+                operation_name,
+                (provider, model_name, config),
+                lambda p, m, c: p.stream_chat(m, prompt, c),
+                lambda p, m, c: self._provider_astream(p, "astream_chat", "stream_chat", m, prompt, c),
+                token,
+            ),
+            cancel_token=token,
+            on_retry=response.clear,
+        )
+        async for chunk in self._atee_to_cache(stream, response, cache_key, agent_name, model_name):
+            yield chunk
+
+    async def astream_structured_for_agent(
+        self,
+        agent_name: str,
+        messages: List[Dict[str, Any]],
+        cancel_token: Optional[CancellationToken] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``stream_structured_for_agent``.
+
+        Args:
+            agent_name: The configured agent name.
+            messages: Role/content messages to send to the provider.
+            cancel_token: Optional token to cancel the request with; one is created if omitted.
+            use_cache: Serve/store the response through the response cache when one is configured.
+
+        Yields:
+            Response chunks from the provider.
+
+        Raises:
+            ValueError: If no provider/model mapping exists for the agent.
+            LLMServiceError: If the provider call fails after all retries.
+            LLMCancelledError: If the token is cancelled before the stream completes.
+        """
+        provider, model_name, config = await self._aget_provider_for_agent(agent_name)
+        if not provider or not model_name:
+            raise ValueError(f"Agent '{agent_name}' is not configured with a valid model.")
+        if not hasattr(provider, "astream_chat_structured") and not hasattr(provider, "stream_chat_structured"):
+            # Same flattening fallback as the synchronous API.
+            async for chunk in self.astream_chat_for_agent(
+                agent_name, self._flatten_messages(messages), cancel_token, use_cache
+            ):
+                yield chunk
+            return
+        operation_name = "astream_chat_structured"
+        token = cancel_token or CancellationToken()
+        cache_key = self._cache_key(use_cache, agent_name, model_name, config, messages)
+        cached = self._cache_lookup(cache_key, agent_name, operation_name)
+        if cached is not None:
+            yield cached
+            return
+
+        def _start(target: Any, target_model: str, target_config: Dict[str, Any]) -> Generator[str, None, None]:
+            if hasattr(target, "stream_chat_structured"):
+                return target.stream_chat_structured(target_model, messages, target_config)
+
+            return target.stream_chat(target_model, self._flatten_messages(messages), target_config)
+
+        response: List[str] = []
+        stream = self._astream_with_retries(
+            agent_name=agent_name,
+            operation_name=operation_name,
+            stream_factory=lambda: self._aopen_stream(
+                agent_name,
+                operation_name,
+                (provider, model_name, config),
+                _start,
+                lambda p, m, c: self._provider_astream(
+                    p, "astream_chat_structured", "stream_chat_structured", m, messages, c
+                ),
+                token,
+            ),
+            cancel_token=token,
+            on_retry=response.clear,
+        )
+        async for chunk in self._atee_to_cache(stream, response, cache_key, agent_name, model_name):
+            yield chunk
+
+    async def arun_for_agent(
+        self,
+        agent_name: str,
+        prompt: str,
+        cancel_token: Optional[CancellationToken] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """
+        Async counterpart of ``run_for_agent``.
+
+        Args:
+            agent_name: The configured agent name.
+            prompt: The textual prompt to send to the provider.
+            cancel_token: Optional token another thread can use to abort the call.
+            use_cache: Serve/store the response through the response cache when one is configured.
+
+        Returns:
+            The full response text returned by the provider.
+
+        Raises:
+            ValueError: If no provider/model mapping exists for the agent.
+            LLMServiceError: If the provider call fails after all retries.
+            LLMCancelledError: If the call is cancelled before it completes.
+        """
+        provider, model_name, config = await self._aget_provider_for_agent(agent_name)
+        if not provider or not model_name:
+            raise ValueError(f"Agent '{agent_name}' is not configured with a valid model.")
+        operation_name = "arun_for_agent"
+        token = cancel_token or CancellationToken()
+        cache_key = self._cache_key(use_cache, agent_name, model_name, config, prompt)
+        cached = self._cache_lookup(cache_key, agent_name, operation_name)
+        if cached is not None:
+            return cached
+
+        async def _operation() -> str:
+            chunks: List[str] = []
+            stream = self._aopen_stream(
+                agent_name,
+                operation_name,
+                (provider, model_name, config),
+                lambda p, m, c: p.stream_chat(m, prompt, c),
+                lambda p, m, c: self._provider_astream(p, "astream_chat", "stream_chat", m, prompt, c),
+                token,
+            )
+            try:
+                async for chunk in stream:
+                    if token.cancelled:
+                        break
+                    if chunk is None:
+                        continue
+                    chunks.append(str(chunk))
+            finally:
+                await stream.aclose()
+            return "".join(chunks)
+
+        response = await self._ainvoke_with_retries(
+            agent_name=agent_name,
+            operation_name=operation_name,
+            operation=_operation,
+            cancel_token=token,
+        )
+        self._cache_store(cache_key, response, agent_name, model_name)
+        return response
+
+    def _aopen_stream(
+        self,
+        agent_name: str,
+        operation_name: str,
+        primary: ProviderTarget,
+        start: StreamStarter,
+        astart: Callable[[Any, str, Dict[str, Any]], AsyncIterator[str]],
+        token: CancellationToken,
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``_open_stream``.
+
+        Unhedged requests use the provider's native async stream. Hedged ones race
+        on helper threads through ``_open_stream`` and the winner is bridged onto the loop.
+
+        Args:
+            agent_name: The configured agent name.
+            operation_name: Operation recorded on the request span.
+            primary: The agent's (provider, model, config).
+            start: Callable opening a blocking provider stream, used when hedging.
+            astart: Callable opening an async provider stream.
+            token: The request's cancellation token.
+
+        Returns:
+            An async iterator of response chunks with a timing span recorded per provider call.
+        """
+        provider, model_name, config = primary
+        if self._get_hedge_for_agent(agent_name, model_name, config) is not None:
+            return self._iterate_in_thread(
+                lambda: self._open_stream(agent_name, operation_name, primary, start, token)
+            )
+        return self._atimed_stream(
+            agent_name, operation_name, provider, model_name, astart(provider, model_name, config)
+        )
+
+    def _atee_to_cache(
+        self,
+        stream: AsyncIterator[str],
+        chunks: List[str],
+        cache_key: Optional[str],
+        agent_name: str,
+        model_name: str,
+    ) -> AsyncIterator[str]:
+        """Async counterpart of ``_tee_to_cache``."""
+        if cache_key is None:
+            return stream
+
+        async def _tee() -> AsyncIterator[str]:
+            try:
+                async for chunk in stream:
+                    if chunk is not None:
+                        chunks.append(str(chunk))
+                    yield chunk
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            self._cache_store(cache_key, "".join(chunks), agent_name, model_name)
+
+        return _tee()
+
+    @contextmanager
+    def _track_async_request(self, token: CancellationToken) -> Iterator["asyncio.Future[None]"]:
+        """
+        Track ``token`` like a synchronous request.
+
+        Yields:
+            A future on the running loop that resolves once the token is cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        cancelled: "asyncio.Future[None]" = loop.create_future()
+
+        def _resolve() -> None:
+            if not cancelled.done():
+                cancelled.set_result(None)
+
+        def _on_cancel(_token: CancellationToken) -> None:
+            try:
+                loop.call_soon_threadsafe(_resolve)
+            except RuntimeError:
+                # The loop already closed; the request is gone with it.
+                pass
+
+        token.add_callback(_on_cancel)
+        with self._track_request(token):
+            try:
+                yield cancelled
+            finally:
+                if not cancelled.done():
+                    cancelled.cancel()
+
+    @staticmethod
+    async def _await_unless_cancelled(awaitable: Awaitable[T], cancelled: "asyncio.Future[None]") -> Optional[T]:
+        """
+        Await ``awaitable`` in an inner task, cancelling only that task if ``cancelled`` resolves first.
+
+        Returns:
+            The awaitable's result, or None when it was cancelled; callers then check the token.
+        """
+        inner = asyncio.ensure_future(awaitable)
+        try:
+            await asyncio.wait((inner, cancelled), return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            inner.cancel()
+            raise
+        if not inner.done():
+            inner.cancel()
+            await asyncio.gather(inner, return_exceptions=True)
+            return None
+        return inner.result()
+
+    @staticmethod
+    async def _aiterate_unless_cancelled(
+        stream: AsyncIterator[str], cancelled: "asyncio.Future[None]"
+    ) -> AsyncIterator[str]:
+        """
+        Consume ``stream`` on an inner task and stop as soon as ``cancelled`` resolves.
+
+        The provider stream is iterated and closed entirely on the inner task, so
+        cancelling it never touches the consumer's task.
+        """
+        pending: "asyncio.Queue[str]" = asyncio.Queue(maxsize=1)
+
+        async def _pump() -> None:
+            try:
+                async for chunk in stream:
+                    await pending.put(chunk)
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+
+        pump = asyncio.ensure_future(_pump())
+        try:
+            while not cancelled.done():
+                if not pending.empty():
+                    yield pending.get_nowait()
+                    continue
+                if pump.done():
+                    pump.result()
+                    return
+                getter = asyncio.ensure_future(pending.get())
+                try:
+                    await asyncio.wait((getter, pump, cancelled), return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    if not getter.done():
+                        getter.cancel()
+                if getter.done() and not getter.cancelled() and not cancelled.done():
+                    yield getter.result()
+        finally:
+            if not pump.done():
+                pump.cancel()
+            await asyncio.gather(pump, return_exceptions=True)
+
+    async def _abackoff(
+        self,
+        token: CancellationToken,
+        cancelled: "asyncio.Future[None]",
+        attempt: int,
+        agent_name: str,
+        operation_name: str,
+    ) -> None:
+        """Async counterpart of ``_backoff``: await the delay, ending early if the request is cancelled."""
+        await self._await_unless_cancelled(asyncio.sleep(self._RETRY_BACKOFF_SECONDS[attempt]), cancelled)
+        self._raise_if_cancelled(token, agent_name, operation_name)
+
+    async def _ainvoke_with_retries(
+        self,
+        agent_name: str,
+        operation_name: str,
+        operation: Callable[[], Awaitable[T]],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> T:
+        """
+        Async counterpart of ``_invoke_with_retries`` with non-blocking backoff.
+
+        Each attempt runs on an inner task; cancelling the token cancels that task
+        and raises ``LLMCancelledError`` here, leaving the caller's task untouched.
+
+        Args:
+            agent_name: The agent associated with the request.
+            operation_name: Human-readable operation identifier for logging.
+            operation: Coroutine function that executes the provider request.
+            cancel_token: Optional token that aborts the operation and any pending backoff.
+
+        Returns:
+            The result returned by the operation.
+
+        Raises:
+            LLMServiceError: If the operation fails after retries or encounters a non-retryable error.
+            LLMCancelledError: If the token is cancelled before the operation completes.
+        """
+        token = cancel_token or CancellationToken()
+        total_attempts = len(self._RETRY_BACKOFF_SECONDS) + 1
+        with self._track_async_request(token) as cancelled:
             for attempt in range(total_attempts):
+                self._raise_if_cancelled(token, agent_name, operation_name)
                 try:
-                    stream = stream_factory()
-                except Exception as exc:  # noqa: BLE001 - classification occurs below
+                    result = await self._await_unless_cancelled(operation(), cancelled)
+                except Exception as exc:  # noqa: BLE001 - we classify below
+                    self._raise_if_cancelled(token, agent_name, operation_name)
                     error, retryable = self._categorize_exception(exc, agent_name, operation_name)
                     if not retryable or attempt == len(self._RETRY_BACKOFF_SECONDS):
                         self._handle_permanent_failure(agent_name, operation_name, error)
                     retry_count = attempt + 1
                     self._handle_retry(agent_name, operation_name, error, retry_count)
-                    time.sleep(self._RETRY_BACKOFF_SECONDS[attempt])
+                    await self._abackoff(token, cancelled, attempt, agent_name, operation_name)
                     continue
+                self._raise_if_cancelled(token, agent_name, operation_name)
+                logger.info(
+                    "LLM %s succeeded for agent '%s' on attempt %d/%d.",
+                    operation_name,
+                    agent_name,
+                    attempt + 1,
+                    total_attempts,
+                )
+                return result  # type: ignore[return-value]
+
+        raise LLMServiceError(
+            f"Unexpected retry state for operation '{operation_name}' on agent '{agent_name}'.",
+            agent_name=agent_name,
+        )
 
+    async def _astream_with_retries(
+        self,
+        agent_name: str,
+        operation_name: str,
+        stream_factory: Callable[[], AsyncIterator[str]],
+        cancel_token: Optional[CancellationToken] = None,
+        on_retry: Optional[Callable[[], None]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``_stream_with_retries`` with non-blocking backoff.
+
+        The provider stream is consumed on an inner task; cancelling the token stops
+        it and raises ``LLMCancelledError`` here, leaving the caller's task untouched.
+
+        Args:
+            agent_name: The agent associated with the request.
+            operation_name: Human-readable operation identifier for logging.
+            stream_factory: Callable that returns the provider's async stream.
+            cancel_token: Optional token that stops the stream and any pending backoff.
+            on_retry: Called before each new attempt; the chunks already yielded belong to a failed one.
+
+        Yields:
+            Response chunks from the provider.
+
+        Raises:
+            LLMServiceError: If streaming fails after retries or encounters a non-retryable error.
+            LLMCancelledError: If the token is cancelled before the stream completes.
+        """
+        token = cancel_token or CancellationToken()
+        total_attempts = len(self._RETRY_BACKOFF_SECONDS) + 1
+        with self._track_async_request(token) as cancelled:
+            for attempt in range(total_attempts):
+                self._raise_if_cancelled(token, agent_name, operation_name)
+                if attempt and on_retry is not None:
+                    on_retry()
+                stream = None
                 try:
-                    for chunk in stream:
+                    stream = self._aiterate_unless_cancelled(stream_factory(), cancelled)
+                    async for chunk in stream:
                         yield chunk
                 except Exception as exc:  # noqa: BLE001 - classification occurs below
+                    self._raise_if_cancelled(token, agent_name, operation_name)
                     error, retryable = self._categorize_exception(exc, agent_name, operation_name)
                     if not retryable or attempt == len(self._RETRY_BACKOFF_SECONDS):
                         self._handle_permanent_failure(agent_name, operation_name, error)
                     retry_count = attempt + 1
                     self._handle_retry(agent_name, operation_name, error, retry_count)
-                    time.sleep(self._RETRY_BACKOFF_SECONDS[attempt])
+                    await self._abackoff(token, cancelled, attempt, agent_name, operation_name)
                     continue
+                finally:
+                    # Runs on cancellation too, releasing the provider's connection.
+                    if stream is not None:
+                        await stream.aclose()
+
+                self._raise_if_cancelled(token, agent_name, operation_name)
+                logger.info(
+                    "LLM %s completed for agent '%s' on attempt %d/%d.",
+                    operation_name,
+                    agent_name,
+                    attempt + 1,
+                    total_attempts,
+                )
+                return
+
+        raise LLMServiceError(
+            f"Streaming operation '{operation_name}' entered an unexpected retry state for agent '{agent_name}'.",
+            agent_name=agent_name,
+        )
+
+    def _provider_astream(
+        self,
+        provider: Any,
+        async_method: str,
+        sync_method: str,
+        *args: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Return the provider's native async stream, or bridge its sync stream from a thread.
+
+        Args:
+            provider: The provider instance.
+            async_method: Name of the provider's async streaming method.
+            sync_method: Name of the synchronous streaming method used as fallback.
+            *args: Arguments forwarded to the provider method.
+
+        Returns:
+            An async iterator of response chunks.
+        """
+        native = getattr(provider, async_method, None)
+        if native is not None:
+            return native(*args)
+        return self._iterate_in_thread(lambda: getattr(provider, sync_method)(*args))
+
+    @staticmethod
+    async def _iterate_in_thread(
+        stream_factory: Callable[[], Generator[str, None, None]],
+    ) -> AsyncIterator[str]:
+        """
+        Drive a blocking generator on a helper thread and yield its items on the loop.
+
+        Cancelling the consumer stops the helper thread after its current chunk.
+
+        Args:
+            stream_factory: Callable that returns the blocking generator.
+
+        Yields:
+            Items produced by the generator.
+        """
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Tuple[str, Any]]" = asyncio.Queue()
+        stop = threading.Event()
+
+        def _post(kind: str, value: Any) -> None:
+            if stop.is_set():
+                return
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (kind, value))
+            except RuntimeError:
+                # The consumer's loop already closed; nobody is listening anymore.
+                stop.set()
+
+        def _pump() -> None:
+            try:
+                stream = stream_factory()
+                try:
+                    for item in stream:
+                        if stop.is_set():
+                            break
+                        _post("item", item)
+                finally:
+                    close = getattr(stream, "close", None)
+                    if close is not None:
+                        close()
+            except BaseException as exc:  # noqa: BLE001 - re-raised on the loop
+                _post("error", exc)
+            else:
+                _post("done", None)
+
+        thread = threading.Thread(target=_pump, name="aura-llm-stream-bridge", daemon=True)
+        thread.start()
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == "item":
+                    yield value
+                elif kind == "error":
+                    raise value
                 else:
-                    logger.info(
-                        "LLM %s completed for agent '%s' on attempt %d/%d.",
-                        operation_name,
-                        agent_name,
-                        attempt + 1,
-                        total_attempts,
-                    )
                     return
+        finally:
+            stop.set()
 
-            raise LLMServiceError(
-                f"Streaming operation '{operation_name}' entered an unexpected retry state for agent '{agent_name}'.",
-                agent_name=agent_name,
+    @staticmethod
+    def _flatten_messages(messages: List[Dict[str, Any]]) -> str:
+        """Flatten role/content messages into one prompt for providers without a chat API."""
+        prompt_parts: List[str] = []
+        for message in messages:
+            role_prefix = (
+                f"{message['role'].capitalize()}: " if message.get("role") != "system" else ""
             )
-
-        return _generator()
+            content = message.get("content", "")
+            if message.get("images"):
+                content = f"{content} [Image attached]" if content else "[Image attached]"
+            prompt_parts.append(f"{role_prefix}{content}")
+        return "\n\n".join(prompt_parts)
 
     def _handle_retry(
         self,
@@ -569,6 +1844,8 @@ class LLMService:
         if isinstance(exc, socket.timeout):
             return True
 
+        requests_exceptions = _loaded_module("requests.exceptions")
+        google_exceptions = _loaded_module("google.api_core.exceptions")
         if requests_exceptions:
             timeout_attrs = (
                 getattr(requests_exceptions, "Timeout", None),
@@ -600,6 +1877,8 @@ class LLMService:
         Returns:
             True if the error indicates a rate limit, otherwise False.
         """
+        requests_exceptions = _loaded_module("requests.exceptions")
+        google_exceptions = _loaded_module("google.api_core.exceptions")
         if requests_exceptions:
             http_error = getattr(requests_exceptions, "HTTPError", None)
             if http_error and isinstance(exc, http_error):
@@ -642,6 +1921,8 @@ class LLMService:
         if isinstance(exc, socket.gaierror):
             return True
 
+        requests_exceptions = _loaded_module("requests.exceptions")
+        google_exceptions = _loaded_module("google.api_core.exceptions")
         if requests_exceptions:
             connection_types = (
                 getattr(requests_exceptions, "ConnectionError", None),
@@ -662,19 +1943,53 @@ class LLMService:
 
     # ------------------- UI Support -------------------
     def _handle_request_available_models(self, event: Event):
+        if not self._providers_ready.is_set():
+            # Answer from the last-known list; discovery sends a fresh one when it finishes.
+            self.event_bus.dispatch(Event(
+                event_type="AVAILABLE_MODELS_RECEIVED",
+                payload={"models": dict(self._cached_models), "stale": True}
+            ))
+            return
         models_by_provider = {}
         for provider_name, provider in self.providers.items():
             models_by_provider[provider_name] = provider.get_available_models()
         self.event_bus.dispatch(Event(
             event_type="AVAILABLE_MODELS_RECEIVED",
-            payload={"models": models_by_provider}
+            payload={"models": models_by_provider, "stale": False}
+        ))
+
+    def _handle_request_llm_metrics(self, event: Event):
+        self.event_bus.dispatch(Event(
+            event_type=LLM_REQUEST_METRICS,
+            payload={"span": None, "metrics": self.metrics()}
         ))
 
     # ------------------- Capability Queries -------------------
     def get_provider_name_for_agent(self, agent_name: str) -> Optional[str]:
-        provider, _, _ = self._get_provider_for_agent(agent_name)
-        if provider:
-            return provider.provider_name
+        """
+        Name the provider serving ``agent_name`` without waiting for discovery.
+
+        Until discovery finishes the answer comes from the persisted model list
+        (``llm_models.json``) and the provider registry's naming defaults.
+        """
+        if self._providers_ready.is_set():
+            provider, _, _ = self._get_provider_for_agent(agent_name)
+            return provider.provider_name if provider else None
+        model_name = (self.agent_config.get(agent_name) or {}).get("model")
+        if not model_name:
+            return None
+        return self._provider_name_before_discovery(model_name)
+
+    def _provider_name_before_discovery(self, model_name: str) -> Optional[str]:
+        for provider_name, models in self._cached_models.items():
+            if model_name in models:
+                return provider_name
+        known = list(self._cached_models) + [name for name in provider_names() if name not in self._cached_models]
+        for provider_name in known:
+            if model_name.lower().startswith(provider_name.lower()):
+                return provider_name
+        if "gemini" in model_name:
+            return "Google"
         return None
 
     def provider_supports_vision(self, agent_name: str) -> bool:
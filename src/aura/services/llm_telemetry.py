@@ -0,0 +1,149 @@
+"""
+Per-request timing spans and rolling latency percentiles for LLM calls.
+
+Each provider call records when it started, when the first and last chunks
+arrived, how many chunks/bytes it produced and how it ended. That separates
+connection and first-token latency from decode throughput.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+@dataclass
+class RequestSpan:
+    """Timing span for a single provider call (one attempt, one contender)."""
+
+    agent_name: str
+    provider: str
+    model: str
+    operation: str
+    started_at: float = field(default_factory=time.monotonic)
+    first_chunk_at: Optional[float] = None
+    last_chunk_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    chunks: int = 0
+    bytes: int = 0
+    outcome: str = "pending"
+
+    def chunk(self, text: Any) -> None:
+        now = time.monotonic()
+        if self.first_chunk_at is None:
+            self.first_chunk_at = now
+        self.last_chunk_at = now
+        self.chunks += 1
+        if isinstance(text, str):
+            self.bytes += len(text.encode("utf-8"))
+
+    def finish(self, outcome: str) -> None:
+        self.finished_at = time.monotonic()
+        self.outcome = outcome
+
+    @property
+    def ttft_ms(self) -> Optional[float]:
+        if self.first_chunk_at is None:
+            return None
+        return (self.first_chunk_at - self.started_at) * 1000
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at) * 1000
+
+    @property
+    def chunks_per_second(self) -> Optional[float]:
+        """Decode throughput between first and last chunk; providers stream roughly token-sized chunks."""
+        if self.first_chunk_at is None or self.last_chunk_at is None or self.chunks < 2:
+            return None
+        elapsed = self.last_chunk_at - self.first_chunk_at
+        return (self.chunks - 1) / elapsed if elapsed > 0 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["ttft_ms"] = _round(self.ttft_ms)
+        data["duration_ms"] = _round(self.duration_ms)
+        data["chunks_per_second"] = _round(self.chunks_per_second)
+        return data
+
+
+class LLMTelemetry:
+    """
+    Thread-safe rolling window of completed spans per (agent, model).
+
+    Percentiles are computed over the last ``window`` spans of each pair, so they
+    follow recent behaviour instead of averaging over the whole session.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self._window = max(int(window), 1)
+        self._lock = threading.Lock()
+        self._spans: Dict[Tuple[str, str], Deque[RequestSpan]] = {}
+        self._providers: Dict[Tuple[str, str], str] = {}
+
+    def record(self, span: RequestSpan) -> None:
+        key = (span.agent_name, span.model)
+        with self._lock:
+            spans = self._spans.get(key)
+            if spans is None:
+                spans = self._spans[key] = deque(maxlen=self._window)
+            spans.append(span)
+            self._providers[key] = span.provider
+
+    def summary(self, agent_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return rolling percentiles keyed by ``"<agent>/<model>"``.
+
+        Args:
+            agent_name: Restrict the summary to one agent.
+
+        Returns:
+            Per agent/model: provider, request and error counts, and p50/p95 of
+            time-to-first-token, total duration and chunks per second.
+        """
+        with self._lock:
+            items = [(key, list(spans), self._providers.get(key, "")) for key, spans in self._spans.items()]
+        summary: Dict[str, Dict[str, Any]] = {}
+        for (agent, model), spans, provider in sorted(items):
+            if agent_name is not None and agent != agent_name:
+                continue
+            summary[f"{agent}/{model}"] = {
+                "agent_name": agent,
+                "model": model,
+                "provider": provider,
+                **_summarise(spans),
+            }
+        return summary
+
+
+def _summarise(spans: List[RequestSpan]) -> Dict[str, Any]:
+    ttft = sorted(span.ttft_ms for span in spans if span.ttft_ms is not None)
+    duration = sorted(span.duration_ms for span in spans if span.duration_ms is not None)
+    throughput = sorted(span.chunks_per_second for span in spans if span.chunks_per_second is not None)
+    return {
+        "requests": len(spans),
+        "errors": sum(1 for span in spans if span.outcome == "error"),
+        "ttft_p50_ms": _round(_percentile(ttft, 0.50)),
+        "ttft_p95_ms": _round(_percentile(ttft, 0.95)),
+        "duration_p50_ms": _round(_percentile(duration, 0.50)),
+        "duration_p95_ms": _round(_percentile(duration, 0.95)),
+        "chunks_per_second_p50": _round(_percentile(throughput, 0.50)),
+    }
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
@@ -0,0 +1,416 @@
+"""Shared, event-driven completion detection for terminal agent sessions."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import selectors
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_EVENT = struct.Struct("iIII")
+
+_DONE_SUFFIX = ".done"
+_SUMMARY_SUFFIX = ".summary.json"
+
+
+@dataclass(frozen=True)
+class SessionCompletion:
+    """How and when a watched session finished."""
+
+    task_id: str
+    reason: str
+    duration_seconds: float
+    error: Optional[BaseException] = None
+
+    @property
+    def timed_out(self) -> bool:
+        return self.reason == "timeout"
+
+
+@dataclass
+class _WatchedSession:
+    task_id: str
+    session: Any
+    aura_dir: Path
+    on_complete: Callable[[SessionCompletion], None]
+    started: float
+    deadline: float
+    pidfd: Optional[int] = None
+    watched_dir: bool = False
+    next_poll: float = field(default=0.0)
+    exited_at: Optional[float] = None
+
+    @property
+    def needs_polling(self) -> bool:
+        return not (self.watched_dir and self.pidfd is not None)
+
+
+class _Inotify:
+    """Minimal ctypes binding for inotify; raises OSError where unavailable."""
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path: Path) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(path), _IN_CREATE | _IN_CLOSE_WRITE | _IN_MOVED_TO)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._rm_watch(self.fd, wd)
+
+    def read_events(self) -> Tuple[List[Tuple[int, int, str]], bool]:
+        """Drain pending events as (wd, mask, name); the flag reports a queue overflow."""
+        events: List[Tuple[int, int, str]] = []
+        overflow = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _IN_EVENT.unpack_from(data, offset)
+                offset += _IN_EVENT.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                elif not mask & _IN_IGNORED:
+                    events.append((wd, mask, name))
+        return events, overflow
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class SessionWatcher:
+    """
+    Detects terminal session completion for any number of sessions on one thread.
+
+    Each session is finished by the first of: ``.aura/<task_id>.done`` appearing,
+    ``.aura/<task_id>.summary.json`` being written, the agent process exiting, or
+    the timeout elapsing. On Linux the ``.aura`` directories are watched with
+    inotify and process exit is signalled through a pidfd, so completion is seen
+    within milliseconds; elsewhere (or when either is unavailable for a session)
+    that session falls back to polling every ``poll_interval`` seconds.
+
+    ``on_complete`` callbacks run on the watcher thread and should hand any slow
+    work off to another thread.
+    """
+
+    # After a pidfd fires, the exit status may take a moment to be reaped by its owner.
+    _EXIT_RECHECK_SECONDS = 0.05
+    _EXIT_RECHECK_WINDOW = 1.0
+
+    def __init__(self, poll_interval: float = 2.0, use_inotify: bool = True) -> None:
+        self.poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self._lock = threading.Lock()
+        self._commands: List[Tuple[str, Any]] = []
+        self._entries: Dict[str, _WatchedSession] = {}
+        self._dir_watches: Dict[Path, int] = {}
+        self._wd_dirs: Dict[int, Path] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._inotify: Optional[_Inotify] = None
+        self._wake_r = self._wake_w = -1
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify is not None else "polling"
+
+    def watch(
+        self,
+        session: Any,
+        aura_dir: Path,
+        on_complete: Callable[[SessionCompletion], None],
+        *,
+        timeout: float,
+    ) -> None:
+        """Start watching ``session``; ``on_complete`` is called exactly once."""
+        now = time.monotonic()
+        entry = _WatchedSession(
+            task_id=session.task_id,
+            session=session,
+            aura_dir=Path(aura_dir),
+            on_complete=on_complete,
+            started=now,
+            deadline=now + timeout,
+        )
+        self._submit("watch", entry)
+
+    def unwatch(self, task_id: str) -> None:
+        """Stop watching ``task_id`` without invoking its callback."""
+        self._submit("unwatch", task_id)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the watcher thread and release its file descriptors."""
+        with self._lock:
+            self._stopped = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._wake()
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = list(self._entries.values())
+            return {
+                "backend": self.backend,
+                "sessions": len(entries),
+                "polling": sum(1 for entry in entries if entry.needs_polling),
+                "watched_dirs": len(self._dir_watches),
+            }
+
+    # ------------------------------------------------------------------ #
+    # Watcher thread
+    # ------------------------------------------------------------------ #
+    def _submit(self, command: str, argument: Any) -> None:
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("SessionWatcher has been stopped")
+            self._commands.append((command, argument))
+            if self._thread is None:
+                self._open()
+                self._thread = threading.Thread(target=self._run, daemon=True, name="aura-session-watcher")
+                self._thread.start()
+                return
+        self._wake()
+
+    def _open(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, ("wake", None))
+        if self._use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as exc:
+                logger.info("inotify unavailable, polling session files instead: %s", exc)
+            else:
+                self._selector.register(self._inotify.fd, selectors.EVENT_READ, ("inotify", None))
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _run(self) -> None:
+        selector = self._selector
+        assert selector is not None
+        try:
+            while True:
+                self._apply_commands()
+                with self._lock:
+                    if self._stopped:
+                        break
+                for key, _ in selector.select(self._next_timeout()):
+                    kind, task_id = key.data
+                    if kind == "wake":
+                        self._drain_wake()
+                    elif kind == "inotify":
+                        self._handle_inotify()
+                    elif kind == "pidfd":
+                        self._handle_process_exit(task_id)
+                self._poll_due()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error("Session watcher stopped unexpectedly: %s", exc, exc_info=True)
+        finally:
+            self._close()
+
+    def _apply_commands(self) -> None:
+        with self._lock:
+            commands, self._commands = self._commands, []
+        for command, argument in commands:
+            if command == "watch":
+                self._add(argument)
+            elif command == "unwatch":
+                entry = self._entries.get(argument)
+                if entry is not None:
+                    self._remove(entry)
+
+    def _add(self, entry: _WatchedSession) -> None:
+        with self._lock:
+            self._entries[entry.task_id] = entry
+        if self._inotify is not None:
+            entry.watched_dir = self._watch_dir(entry.aura_dir)
+        process_id = getattr(entry.session, "process_id", None)
+        if process_id is not None and hasattr(os, "pidfd_open"):
+            try:
+                entry.pidfd = os.pidfd_open(process_id)
+            except OSError as exc:
+                logger.debug("pidfd unavailable for task %s (pid %s): %s", entry.task_id, process_id, exc)
+            else:
+                self._selector.register(entry.pidfd, selectors.EVENT_READ, ("pidfd", entry.task_id))
+        logger.debug(
+            "Watching terminal session %s (dir=%s, inotify=%s, pidfd=%s)",
+            entry.task_id,
+            entry.aura_dir,
+            entry.watched_dir,
+            entry.pidfd is not None,
+        )
+        # Files may already exist, or the process may already be gone.
+        self._evaluate(entry)
+
+    def _remove(self, entry: _WatchedSession) -> None:
+        with self._lock:
+            self._entries.pop(entry.task_id, None)
+        if entry.pidfd is not None:
+            self._selector.unregister(entry.pidfd)
+            os.close(entry.pidfd)
+            entry.pidfd = None
+        if entry.watched_dir and not any(
+            other.watched_dir and other.aura_dir == entry.aura_dir for other in self._entries.values()
+        ):
+            wd = self._dir_watches.pop(entry.aura_dir, None)
+            if wd is not None:
+                self._wd_dirs.pop(wd, None)
+                self._inotify.rm_watch(wd)
+
+    def _watch_dir(self, aura_dir: Path) -> bool:
+        if aura_dir in self._dir_watches:
+            return True
+        try:
+            aura_dir.mkdir(parents=True, exist_ok=True)
+            wd = self._inotify.add_watch(aura_dir)
+        except OSError as exc:
+            logger.warning("Cannot watch %s, polling instead: %s", aura_dir, exc)
+            return False
+        self._dir_watches[aura_dir] = wd
+        self._wd_dirs[wd] = aura_dir
+        return True
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _handle_inotify(self) -> None:
+        events, overflow = self._inotify.read_events()
+        if overflow:
+            for entry in list(self._entries.values()):
+                self._evaluate(entry)
+            return
+        touched: Set[str] = set()
+        for wd, mask, name in events:
+            aura_dir = self._wd_dirs.get(wd)
+            if aura_dir is None:
+                continue
+            if name.endswith(_DONE_SUFFIX):
+                touched.add(name[: -len(_DONE_SUFFIX)])
+            elif name.endswith(_SUMMARY_SUFFIX) and mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                # Only once fully written, so finalization never reads a partial summary.
+                touched.add(name[: -len(_SUMMARY_SUFFIX)])
+        for task_id in touched:
+            entry = self._entries.get(task_id)
+            if entry is not None:
+                self._evaluate(entry)
+
+    def _handle_process_exit(self, task_id: str) -> None:
+        entry = self._entries.get(task_id)
+        if entry is None or entry.pidfd is None:
+            return
+        self._selector.unregister(entry.pidfd)
+        os.close(entry.pidfd)
+        entry.pidfd = None
+        entry.exited_at = time.monotonic()
+        self._evaluate(entry)
+
+    def _poll_due(self) -> None:
+        now = time.monotonic()
+        for entry in list(self._entries.values()):
+            if now >= entry.deadline or (entry.needs_polling and now >= entry.next_poll):
+                self._evaluate(entry)
+
+    def _next_timeout(self) -> Optional[float]:
+        if not self._entries:
+            return None
+        now = time.monotonic()
+        due = min(
+            min(entry.deadline, entry.next_poll) if entry.needs_polling else entry.deadline
+            for entry in self._entries.values()
+        )
+        return max(0.0, due - now)
+
+    def _evaluate(self, entry: _WatchedSession) -> None:
+        error: Optional[BaseException] = None
+        try:
+            reason = self._completion_reason(entry)
+        except Exception as exc:
+            reason, error = "monitor-error", exc
+        if reason is None:
+            now = time.monotonic()
+            recheck = entry.exited_at is not None and now - entry.exited_at < self._EXIT_RECHECK_WINDOW
+            entry.next_poll = now + (self._EXIT_RECHECK_SECONDS if recheck else self.poll_interval)
+            return
+        self._remove(entry)
+        completion = SessionCompletion(
+            task_id=entry.task_id,
+            reason=reason,
+            duration_seconds=time.monotonic() - entry.started,
+            error=error,
+        )
+        try:
+            entry.on_complete(completion)
+        except Exception as exc:
+            logger.error("Completion callback for task %s failed: %s", entry.task_id, exc, exc_info=True)
+
+    @staticmethod
+    def _completion_reason(entry: _WatchedSession) -> Optional[str]:
+        if (entry.aura_dir / f"{entry.task_id}{_DONE_SUFFIX}").exists():
+            return "done-file-detected"
+        if (entry.aura_dir / f"{entry.task_id}{_SUMMARY_SUFFIX}").exists():
+            return "summary-file-detected"
+        if entry.session.poll() is not None:
+            return "process-exited"
+        if time.monotonic() >= entry.deadline:
+            return "timeout"
+        return None
+
+    def _close(self) -> None:
+        for entry in list(self._entries.values()):
+            self._remove(entry)
+        if self._selector is not None:
+            self._selector.close()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
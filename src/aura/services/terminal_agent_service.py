@@ -6,8 +6,9 @@ import shlex
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
 
+from src.aura.app.event_bus import WORKER_LANE
 from src.aura.models.agent_task import AgentSpecification, TerminalSession
 from src.aura.models.event_types import (
     AGENT_OUTPUT,
@@ -67,7 +68,7 @@ class TerminalAgentService:
         self._sessions: Dict[str, TerminalSession] = {}
         self.settings_manager = settings_manager
 
-        self.event_bus.subscribe(TERMINAL_OUTPUT_RECEIVED, self._handle_terminal_output)
+        self.event_bus.subscribe(TERMINAL_OUTPUT_RECEIVED, self._handle_terminal_output, lane=WORKER_LANE)
 
         logger.info(
             "TerminalAgentService initialized with embedded terminal bridge (workspace=%s, template=%s)",
@@ -119,11 +120,13 @@ class TerminalAgentService:
         effective_working_dir = working_dir or project_root
 
         try:
-            self._terminal_bridge.start_session(
+            # Each task runs in its own PTY so concurrent agents never share a shell.
+            process_handle = self._terminal_bridge.start_session(
                 spec.task_id,
                 log_path,
                 working_dir=effective_working_dir,
                 environment=env_map,
+                command=terminal_command,
             )
         except Exception as exc:
             logger.error("Failed to start terminal bridge session for task %s: %s", spec.task_id, exc, exc_info=True)
@@ -138,18 +141,28 @@ class TerminalAgentService:
                         "command": terminal_command,
                         "project_root": str(project_root),
                         "gemini_md_path": str(gemini_md_path),
+                        "dedicated_pty": process_handle is not None,
                     },
                 )
             )
         except Exception as exc:
             logger.error("Failed to dispatch terminal command for task %s: %s", spec.task_id, exc, exc_info=True)
-            self._terminal_bridge.end_session()
+            self._terminal_bridge.end_session(spec.task_id)
             raise
 
-        session = self._record_session(spec, command_tokens, spec_path, log_path)
+        session = self._record_session(spec, command_tokens, spec_path, log_path, process_handle)
         logger.info("Terminal command dispatched for task %s", spec.task_id)
         return session
 
+    def flush_output(self, task_id: str) -> None:
+        """Block until the output captured so far for ``task_id`` is written to its log."""
+        self._terminal_bridge.flush_log(task_id)
+
+    def end_session(self, task_id: str) -> None:
+        """Stop capturing output for ``task_id`` and tear down its terminal, if still running."""
+        self._sessions.pop(task_id, None)
+        self._terminal_bridge.end_session(task_id)
+
     # ------------------------------------------------------------------ Event handling
 
     def _handle_terminal_output(self, event: Event) -> None:
@@ -355,12 +368,15 @@ class TerminalAgentService:
         command_tokens: Sequence[str],
         spec_path: Path,
         log_path: Path,
+        process_handle: Optional[Any] = None,
     ) -> TerminalSession:
+        process_id = getattr(process_handle, "pid", None)
         session = TerminalSession(
             task_id=spec.task_id,
             command=list(command_tokens),
             spec_path=str(spec_path),
-            process_id=None,
+            process_id=process_id if isinstance(process_id, int) else None,
+            child=process_handle,
             log_path=str(log_path),
         )
         self._sessions[spec.task_id] = session
@@ -1,34 +1,195 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import json
 import logging
 import os
+import struct
 import sys
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, TextIO
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import websockets
 from websockets.server import WebSocketServerProtocol
 
 from src.aura.models.event_types import TERMINAL_OUTPUT_RECEIVED
 from src.aura.models.events import Event
+from src.aura.services.terminal_frame_writer import TerminalFrameWriter
+from src.aura.services.terminal_log_writer import TerminalLog, TerminalLogWriter
 
 logger = logging.getLogger(__name__)
 
+# Websocket subprotocol for compact binary framing. Clients that do not offer it
+# keep the JSON/text protocol: ``{"type": "input"|"resize", ...}`` in, text frames out.
+BINARY_SUBPROTOCOL = "aura.terminal.binary"
+# Binary client->server frames are one opcode byte followed by the payload.
+OP_INPUT = 0x00  # payload: raw bytes for the PTY
+OP_RESIZE = 0x01  # payload: cols, rows as big-endian uint16
+_RESIZE_FORMAT = struct.Struct("!HH")
+
+
+def _new_output_decoder() -> codecs.IncrementalDecoder:
+    """UTF-8 decoder that carries a multibyte sequence split across reads over to the next one."""
+    return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+class TaskProcessHandle:
+    """
+    Thread-safe view of a task's dedicated PTY process, shaped like ``subprocess.Popen``.
+
+    ``TerminalSession`` treats it as its child process: ``poll()`` and ``wait()``
+    report the exit status once the bridge's event loop has reaped the process.
+    """
+
+    def __init__(self, task_id: str) -> None:
+        self.task_id = task_id
+        self.pid: Optional[int] = None
+        self.returncode: Optional[int] = None
+        self._exited = threading.Event()
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        self._exited.wait(timeout)
+        return self.returncode
+
+    def _mark_exit(self, returncode: Optional[int]) -> None:
+        self.returncode = returncode
+        self._exited.set()
+
+
+class _PtyReader:
+    """
+    Event-driven reader for a non-blocking PTY master.
+
+    The master fd is registered with the event loop through ``add_reader``, and
+    the readiness callback drains what the kernel has buffered straight into a
+    local buffer on the loop thread, so no executor hop is needed per chunk.
+    The read size adapts to the output rate: it doubles while reads fill it and
+    halves when they come back mostly empty. Reading pauses once ``HIGH_WATER``
+    bytes are pending and resumes when the consumer catches up.
+
+    ``close()`` must be called before the fd is closed so the loop's selector
+    never holds a stale registration.
+    """
+
+    MIN_READ_SIZE = 4096
+    MAX_READ_SIZE = 256 * 1024
+    HIGH_WATER = 1024 * 1024
+
+    def __init__(self, fd: int, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self._fd = fd
+        self._loop = loop or asyncio.get_running_loop()
+        self._buffer = bytearray()
+        self._waiter: Optional[asyncio.Future] = None
+        self._reading = False
+        self._eof = False
+        self.read_size = self.MIN_READ_SIZE
+        self.reads = 0
+        self.wakeups = 0
+        self.bytes_read = 0
+        self._resume()
+
+    async def read(self) -> Optional[bytes]:
+        """Return the output buffered so far (waiting for some if needed); None at EOF."""
+        while not self._buffer:
+            if self._eof:
+                return None
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        data = bytes(self._buffer[: self.MAX_READ_SIZE])
+        del self._buffer[: self.MAX_READ_SIZE]
+        self._resume()
+        return data
+
+    def close(self) -> None:
+        """Unregister the fd and wake a pending ``read`` with EOF."""
+        self._eof = True
+        self._pause()
+        self._wake()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "reads": self.reads,
+            "wakeups": self.wakeups,
+            "bytes": self.bytes_read,
+            "read_size": self.read_size,
+        }
+
+    def _resume(self) -> None:
+        if self._reading or self._eof or len(self._buffer) >= self.HIGH_WATER:
+            return
+        self._loop.add_reader(self._fd, self._on_readable)
+        self._reading = True
+
+    def _pause(self) -> None:
+        if not self._reading:
+            return
+        self._reading = False
+        try:
+            self._loop.remove_reader(self._fd)
+        except (OSError, ValueError):
+            pass
+
+    def _on_readable(self) -> None:
+        self.wakeups += 1
+        while len(self._buffer) < self.HIGH_WATER:
+            size = self.read_size
+            try:
+                data = os.read(self._fd, size)
+            except BlockingIOError:
+                break
+            except OSError:
+                # EIO: every slave fd is closed, i.e. the child exited.
+                data = b""
+            if not data:
+                self._eof = True
+                self._pause()
+                break
+            self.reads += 1
+            self.bytes_read += len(data)
+            self._buffer += data
+            if len(data) == size:
+                self.read_size = min(size * 2, self.MAX_READ_SIZE)
+            else:
+                if len(data) < size // 4:
+                    self.read_size = max(size // 2, self.MIN_READ_SIZE)
+                # A short read means the kernel buffer is drained.
+                break
+        else:
+            self._pause()
+        self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
 
 @dataclass
 class _SessionBinding:
-    """Track the active task whose output is being captured."""
+    """Track a task whose output is being captured, and its dedicated PTY if it has one."""
 
     task_id: str
     log_path: Path
-    stream: TextIO
+    log: TerminalLog
     working_dir: Optional[Path] = None
     environment: Optional[Dict[str, str]] = None
+    command: Optional[str] = None
+    handle: Optional[TaskProcessHandle] = None
+    process: Optional[asyncio.subprocess.Process] = None
+    master_fd: Optional[int] = None
+    pty_reader: Optional[_PtyReader] = None
+    reader: Optional[asyncio.Task] = None
+    decoder: codecs.IncrementalDecoder = field(default_factory=_new_output_decoder)
 
 
 class TerminalBridge:
@@ -38,8 +199,13 @@ class TerminalBridge:
     Responsibilities:
         - Accept websocket connections from the Qt-embedded terminal.
         - Spawn and manage the underlying shell process with platform-aware PTY shims.
-        - Relay terminal input and output between the browser and the PTY.
-        - Persist terminal output to log files and broadcast output events.
+        - Relay terminal input and output between the browser and the PTY, merging
+          output bursts into few frames and bounding what a slow client can queue.
+        - Speak a binary framing (``BINARY_SUBPROTOCOL``) when the client offers it:
+          raw PTY bytes out, one-byte opcode plus payload in.
+        - Persist terminal output to log files (off the event loop) and broadcast output events.
+        - Run each agent task in its own PTY so concurrent tasks never share a shell
+          or a log; the websocket client mirrors whichever task is attached.
     """
 
     _DEFAULT_WINDOWS_SHELL = ["powershell.exe", "-NoLogo", "-NoProfile"]
@@ -51,21 +217,33 @@ class TerminalBridge:
         host: str = "127.0.0.1",
         port: int = 8765,
         event_bus=None,
+        output_policy: Optional[str] = None,
+        log_writer: Optional[TerminalLogWriter] = None,
     ) -> None:
         self._host = host
         self._port = port
         self._event_bus = event_bus
+        self._output_policy = output_policy
+        self._log_writer = log_writer or TerminalLogWriter()
 
         self._server: Optional[websockets.server.Serve] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
         self._active_websocket: Optional[WebSocketServerProtocol] = None
+        self._frame_writer: Optional[TerminalFrameWriter] = None
+        self._binary_frames = False
 
         self._process: Optional[asyncio.subprocess.Process] = None
         self._pty_master_fd: Optional[int] = None
+        self._pty_reader: Optional[_PtyReader] = None
+        self._output_decoder = _new_output_decoder()
 
         self._session_lock = threading.RLock()
-        self._session: Optional[_SessionBinding] = None
+        self._sessions: Dict[str, _SessionBinding] = {}
+        # Task whose output the interactive (websocket) shell is captured for.
+        self._interactive_task_id: Optional[str] = None
+        # Task whose dedicated PTY the websocket client currently mirrors.
+        self._attached_task_id: Optional[str] = None
         self._ready_event = threading.Event()
 
     # ------------------------------------------------------------------ Public API
@@ -89,6 +267,8 @@ class TerminalBridge:
         self._ready_event.clear()
         loop = self._loop
         if loop is None:
+            self.end_session()
+            self._log_writer.stop()
             return
 
         async def _shutdown() -> None:
@@ -96,6 +276,10 @@ class TerminalBridge:
                 self._server.close()
                 await self._server.wait_closed()
             await self._terminate_process()
+            with self._session_lock:
+                bindings = list(self._sessions.values())
+            for binding in bindings:
+                await self._terminate_task_process(binding)
 
         futures = [
             asyncio.run_coroutine_threadsafe(_shutdown(), loop),
@@ -112,6 +296,7 @@ class TerminalBridge:
         self._loop = None
         self._thread = None
         self.end_session()
+        self._log_writer.stop()
         logger.info("Terminal bridge stopped")
 
     def start_session(
@@ -120,43 +305,126 @@ class TerminalBridge:
         log_path: Path,
         working_dir: Optional[Path] = None,
         environment: Optional[Dict[str, str]] = None,
-    ) -> None:
+        command: Optional[str] = None,
+    ) -> Optional[TaskProcessHandle]:
         """
         Begin capturing terminal output for the supplied task.
 
+        Without ``command`` the task captures the interactive shell behind the
+        websocket, replacing any task that captured it before. With ``command``
+        the task gets a dedicated PTY running that command, independent of every
+        other session, and the websocket client is attached to it.
+
         Args:
             task_id: Identifier of the agent task.
             log_path: Destination log file path for raw terminal output.
             working_dir: Directory to execute commands in.
             environment: Optional environment variables for the shell session.
+            command: Optional shell command to run in a dedicated PTY.
+
+        Returns:
+            A handle on the dedicated process when ``command`` is given, else None.
         """
+        if command is not None and not self.wait_ready(timeout=5.0):
+            raise RuntimeError("Terminal bridge is not running")
         with self._session_lock:
-            self._close_session_locked()
-            try:
-                log_path.parent.mkdir(parents=True, exist_ok=True)
-                stream = log_path.open("a", encoding="utf-8")
-            except OSError as exc:
-                logger.error("Unable to open terminal log %s: %s", log_path, exc, exc_info=True)
-                raise
-            self._session = _SessionBinding(
+            replaced = [self._close_session_locked(task_id)]
+            if command is None and self._interactive_task_id is not None:
+                replaced.append(self._close_session_locked(self._interactive_task_id))
+        # The previous log for this task must be fully written before it is reopened.
+        self._close_logs(replaced)
+        try:
+            log = self._log_writer.open(log_path)
+        except OSError as exc:
+            logger.error("Unable to open terminal log %s: %s", log_path, exc, exc_info=True)
+            raise
+        with self._session_lock:
+            binding = _SessionBinding(
                 task_id=task_id,
                 log_path=log_path,
-                stream=stream,
+                log=log,
                 working_dir=working_dir,
                 environment=environment,
+                command=command,
+                handle=TaskProcessHandle(task_id) if command is not None else None,
             )
+            self._sessions[task_id] = binding
+            if command is None:
+                self._interactive_task_id = task_id
             logger.info(
-                "Terminal bridge capturing output for task %s at %s (cwd=%s, env_keys=%s)",
+                "Terminal bridge capturing output for task %s at %s (cwd=%s, env_keys=%s, dedicated_pty=%s)",
                 task_id,
                 log_path,
                 working_dir,
                 sorted(environment.keys()) if environment else [],
+                command is not None,
             )
 
-    def end_session(self) -> None:
-        """Stop capturing output for the active task."""
+        if command is None:
+            return None
+        loop = self._loop
+        if loop is None:
+            self.end_session(task_id)
+            raise RuntimeError("Terminal bridge event loop is not running")
+        future = asyncio.run_coroutine_threadsafe(self._spawn_task_process(binding), loop)
+        try:
+            future.result(timeout=10)
+        except Exception:
+            self.end_session(task_id)
+            raise
+        self._attached_task_id = task_id
+        return binding.handle
+
+    def end_session(self, task_id: Optional[str] = None) -> None:
+        """
+        Stop capturing output for ``task_id`` (every task when omitted).
+
+        A dedicated PTY still running for the task is terminated, and everything
+        it logged is written and flushed before this returns.
+        """
+        with self._session_lock:
+            task_ids = [task_id] if task_id is not None else list(self._sessions)
+            bindings = [self._sessions[key] for key in task_ids if key in self._sessions]
+            for binding in bindings:
+                self._close_session_locked(binding.task_id)
+        loop = self._loop
+        for binding in bindings:
+            if binding.process is None or loop is None:
+                continue
+            future = asyncio.run_coroutine_threadsafe(self._terminate_task_process(binding), loop)
+            try:
+                future.result(timeout=5)
+            except Exception as exc:
+                logger.debug("Terminating PTY for task %s failed: %s", binding.task_id, exc)
+        self._close_logs(bindings)
+
+    def flush_log(self, task_id: Optional[str] = None, timeout: float = 5.0) -> None:
+        """Block until output captured so far for ``task_id`` (every task when omitted) is on disk."""
+        if task_id is None:
+            futures = [self._log_writer.flush()]
+        else:
+            with self._session_lock:
+                binding = self._sessions.get(task_id)
+            futures = [self._log_writer.flush(binding.log)] if binding is not None else []
+        for future in futures:
+            try:
+                future.result(timeout)
+            except Exception as exc:
+                logger.warning("Flushing terminal log for %s failed: %s", task_id or "all tasks", exc)
+
+    def active_sessions(self) -> List[str]:
+        """Return the task ids currently capturing output."""
         with self._session_lock:
-            self._close_session_locked()
+            return list(self._sessions)
+
+    def attach(self, task_id: Optional[str]) -> None:
+        """Mirror ``task_id``'s dedicated PTY to the websocket client (None for the interactive shell)."""
+        self._attached_task_id = task_id
+
+    def output_stats(self) -> Dict[str, object]:
+        """Return frame/byte counters and rates for the connected client (empty when none)."""
+        writer = self._frame_writer
+        return writer.stats() if writer is not None else {}
 
     def wait_ready(self, timeout: float = 5.0) -> bool:
         """
@@ -170,16 +438,24 @@ class TerminalBridge:
         """
         return self._ready_event.wait(timeout)
 
-    def send_input(self, data: str) -> None:
+    def send_input(self, data: str, task_id: Optional[str] = None) -> None:
         """
         Inject input directly into the underlying PTY.
 
         Useful for backend automation to dispatch commands even when the UI has not issued them yet.
+        Input goes to ``task_id``'s dedicated PTY when given, else to the interactive shell.
         """
         loop = self._loop
         if loop is None:
             raise RuntimeError("Terminal bridge event loop is not running")
-        asyncio.run_coroutine_threadsafe(self._write_to_process(data), loop)
+        if task_id is None:
+            asyncio.run_coroutine_threadsafe(self._write_to_process(data), loop)
+            return
+        with self._session_lock:
+            binding = self._sessions.get(task_id)
+        if binding is None:
+            raise KeyError(f"No terminal session for task {task_id}")
+        asyncio.run_coroutine_threadsafe(self._write_to_task(binding, data), loop)
 
     # ------------------------------------------------------------------ Internal helpers
     def _run_event_loop(self) -> None:
@@ -211,6 +487,7 @@ class TerminalBridge:
             self._host,
             self._port,
             ping_interval=None,
+            subprotocols=[BINARY_SUBPROTOCOL],
         )
         self._ready_event.set()
 
@@ -219,13 +496,21 @@ class TerminalBridge:
         if previous and not previous.closed:
             await previous.close(code=1012, reason="New terminal client connected")
         self._active_websocket = websocket
-        logger.info("Terminal client connected from %s", getattr(websocket, "remote_address", "?"))
+        writer = TerminalFrameWriter(websocket.send, policy=self._output_policy)
+        writer.start()
+        self._frame_writer = writer
+        self._binary_frames = websocket.subprotocol == BINARY_SUBPROTOCOL
+        logger.info(
+            "Terminal client connected from %s (binary_frames=%s)",
+            getattr(websocket, "remote_address", "?"),
+            self._binary_frames,
+        )
 
         output_task: Optional[asyncio.Task] = None
         input_task: Optional[asyncio.Task] = None
         try:
             await self._ensure_process()
-            output_task = asyncio.create_task(self._stream_process_output(websocket))
+            output_task = asyncio.create_task(self._stream_process_output(writer))
             input_task = asyncio.create_task(self._consume_websocket_input(websocket))
             await asyncio.wait(
                 [output_task, input_task],
@@ -242,17 +527,23 @@ class TerminalBridge:
                 *(task for task in (output_task, input_task) if task),
                 return_exceptions=True,
             )
+            await writer.close(flush=False)
             try:
                 await websocket.close()
             except Exception:
                 pass
             if self._active_websocket is websocket:
                 self._active_websocket = None
+            if self._frame_writer is writer:
+                self._frame_writer = None
             await self._terminate_process()
             logger.info("Terminal client disconnected")
 
     async def _consume_websocket_input(self, websocket: WebSocketServerProtocol) -> None:
         async for message in websocket:
+            if isinstance(message, bytes):
+                await self._handle_binary_message(message)
+                continue
             try:
                 payload = json.loads(message)
             except (TypeError, json.JSONDecodeError):
@@ -260,27 +551,58 @@ class TerminalBridge:
                 continue
             msg_type = payload.get("type")
             if msg_type == "input":
-                data = payload.get("data", "")
-                await self._write_to_process(data)
+                await self._route_input(payload.get("data", ""))
             elif msg_type == "resize":
-                cols = payload.get("cols")
-                rows = payload.get("rows")
-                await self._resize_pty(cols=cols, rows=rows)
+                await self._route_resize(payload.get("cols"), payload.get("rows"))
             else:
                 logger.debug("Unhandled terminal message type: %s", msg_type)
 
-    async def _stream_process_output(self, websocket: WebSocketServerProtocol) -> None:
+    async def _handle_binary_message(self, message: bytes) -> None:
+        if not message:
+            return
+        opcode, payload = message[0], message[1:]
+        if opcode == OP_INPUT:
+            await self._route_input(payload)
+        elif opcode == OP_RESIZE and len(payload) == _RESIZE_FORMAT.size:
+            cols, rows = _RESIZE_FORMAT.unpack(payload)
+            await self._route_resize(cols, rows)
+        else:
+            logger.debug("Unhandled binary terminal frame (opcode=%s, %d bytes)", opcode, len(payload))
+
+    async def _route_input(self, data: Union[str, bytes]) -> None:
+        binding = self._attached_binding()
+        if binding is not None:
+            await self._write_to_task(binding, data)
+        else:
+            await self._write_to_process(data)
+
+    async def _route_resize(self, cols: Optional[int], rows: Optional[int]) -> None:
+        await self._resize_pty(cols=cols, rows=rows)
+        binding = self._attached_binding()
+        if binding is not None:
+            self._set_pty_size(binding.master_fd, cols=cols, rows=rows)
+
+    def _frame_for(self, data: bytes, text: str) -> Union[str, bytes]:
+        """Binary clients get the raw PTY bytes; text clients get the decoded text."""
+        return data if self._binary_frames else text
+
+    async def _stream_process_output(self, writer: TerminalFrameWriter) -> None:
+        # Decoded once per chunk; the websocket, the log and output events share the text.
+        decoder = self._output_decoder
         while True:
             data = await self._read_from_process()
             if data is None:
+                self._handle_output(decoder.decode(b"", final=True))
                 break
-            text = data.decode("utf-8", errors="replace")
-            await websocket.send(text)
+            text = decoder.decode(data)
+            if self._attached_binding() is None:
+                await writer.write(self._frame_for(data, text))
             self._handle_output(text)
 
     async def _ensure_process(self) -> None:
         if self._process and self._process.returncode is None:
             return
+        self._output_decoder = _new_output_decoder()
         if sys.platform.startswith("win"):
             await self._spawn_windows_shell()
         else:
@@ -290,10 +612,11 @@ class TerminalBridge:
         working_dir: Optional[str] = None
         env_vars: Optional[Dict[str, str]] = None
         with self._session_lock:
-            if self._session:
-                if self._session.working_dir:
-                    working_dir = str(self._session.working_dir)
-                env_vars = self._session.environment
+            session = self._sessions.get(self._interactive_task_id or "")
+            if session:
+                if session.working_dir:
+                    working_dir = str(session.working_dir)
+                env_vars = session.environment
 
         env = os.environ.copy()
         if env_vars:
@@ -315,59 +638,132 @@ class TerminalBridge:
         self._process = process
 
     async def _spawn_unix_shell(self) -> None:
-        import fcntl
-        import pty
-        import struct
-        import termios
-
         working_dir: Optional[str] = None
         env_vars: Optional[Dict[str, str]] = None
         with self._session_lock:
-            if self._session:
-                if self._session.working_dir:
-                    working_dir = str(self._session.working_dir)
-                env_vars = self._session.environment
+            session = self._sessions.get(self._interactive_task_id or "")
+            if session:
+                if session.working_dir:
+                    working_dir = str(session.working_dir)
+                env_vars = session.environment
 
         logger.info(
             "Launching POSIX shell for terminal bridge (cwd=%s, env_keys=%s)",
             working_dir,
             sorted(env_vars.keys()) if env_vars else [],
         )
+        self._pty_master_fd = None
+        process, master_fd = await self._open_pty_process(
+            self._DEFAULT_UNIX_SHELL, working_dir=working_dir, env_vars=env_vars
+        )
+        self._process = process
+        self._pty_master_fd = master_fd
+        self._pty_reader = _PtyReader(master_fd)
+
+    async def _open_pty_process(
+        self,
+        argv: Sequence[str],
+        *,
+        working_dir: Optional[str],
+        env_vars: Optional[Dict[str, str]],
+    ) -> Tuple[asyncio.subprocess.Process, int]:
+        """Spawn ``argv`` attached to a fresh PTY and return it with its non-blocking master fd."""
+        import fcntl
+        import pty
+
         env = os.environ.copy()
         env.setdefault("TERM", "xterm-256color")
         if env_vars:
             env.update(env_vars)
-        self._pty_master_fd = None
         master_fd, slave_fd = pty.openpty()
+        process: Optional[asyncio.subprocess.Process] = None
         try:
             process = await asyncio.create_subprocess_exec(
-                *self._DEFAULT_UNIX_SHELL,
+                *argv,
                 stdin=slave_fd,
                 stdout=slave_fd,
                 stderr=slave_fd,
                 env=env,
                 cwd=working_dir,
             )
-            self._process = process
-            self._pty_master_fd = master_fd
 
-            # Ensure master is non-blocking
+            # Non-blocking master: reads are driven by loop readiness callbacks.
             flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
             fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
 
             # Set initial window size
-            try:
-                packed = struct.pack("HHHH", 24, 120, 0, 0)
-                fcntl.ioctl(master_fd, termios.TIOCSWINSZ, packed)
-            except OSError as exc:
-                logger.debug("Failed to set initial PTY size: %s", exc)
+            self._set_pty_size(master_fd, cols=120, rows=24)
         finally:
             os.close(slave_fd)
-            if self._process is None and master_fd is not None:
+            if process is None:
                 try:
                     os.close(master_fd)
                 except OSError:
                     pass
+        return process, master_fd
+
+    async def _spawn_task_process(self, binding: _SessionBinding) -> None:
+        """Start ``binding.command`` in its own PTY (pipes on Windows) and pump its output."""
+        working_dir = str(binding.working_dir) if binding.working_dir else None
+        if sys.platform.startswith("win"):
+            env = os.environ.copy()
+            if binding.environment:
+                env.update(binding.environment)
+            binding.process = await asyncio.create_subprocess_exec(
+                *self._DEFAULT_WINDOWS_SHELL,
+                "-Command",
+                binding.command or "",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=working_dir,
+                env=env,
+            )
+        else:
+            binding.process, binding.master_fd = await self._open_pty_process(
+                [*self._DEFAULT_UNIX_SHELL, "-c", binding.command or ""],
+                working_dir=working_dir,
+                env_vars=binding.environment,
+            )
+            binding.pty_reader = _PtyReader(binding.master_fd)
+        if binding.handle is not None:
+            binding.handle.pid = binding.process.pid
+        binding.reader = asyncio.get_running_loop().create_task(self._pump_task_output(binding))
+        logger.info("Started dedicated PTY for task %s (pid=%s)", binding.task_id, binding.process.pid)
+
+    async def _pump_task_output(self, binding: _SessionBinding) -> None:
+        process = binding.process
+        assert process is not None
+        try:
+            while True:
+                if sys.platform.startswith("win"):
+                    data = await process.stdout.read(4096) if process.stdout else b""
+                else:
+                    data = await binding.pty_reader.read() if binding.pty_reader else None
+                if not data:
+                    self._handle_output(binding.decoder.decode(b"", final=True), binding)
+                    break
+                text = binding.decoder.decode(data)
+                writer = self._frame_writer
+                if writer is not None and self._attached_task_id == binding.task_id:
+                    try:
+                        await writer.write(self._frame_for(data, text))
+                    except Exception as exc:
+                        logger.debug("Failed mirroring task %s output: %s", binding.task_id, exc)
+                self._handle_output(text, binding)
+        finally:
+            returncode = await process.wait()
+            # Make the full log visible before anyone waiting on the exit reads it.
+            try:
+                await asyncio.wrap_future(self._log_writer.flush(binding.log))
+            except Exception as exc:
+                logger.debug("Flushing log for task %s failed: %s", binding.task_id, exc)
+            if binding.handle is not None:
+                binding.handle._mark_exit(returncode)
+            self._close_master_fd(binding)
+            if self._attached_task_id == binding.task_id:
+                self._attached_task_id = None
+            logger.info("Dedicated PTY for task %s exited with %s", binding.task_id, returncode)
 
     async def _read_from_process(self) -> Optional[bytes]:
         if self._process is None:
@@ -379,20 +775,15 @@ class TerminalBridge:
             return data or None
 
         # POSIX: read from PTY master
-        master_fd = self._pty_master_fd
-        if master_fd is None:
+        reader = self._pty_reader
+        if reader is None:
             return None
-        loop = asyncio.get_running_loop()
-        try:
-            data = await loop.run_in_executor(None, os.read, master_fd, 4096)
-        except OSError:
-            return None
-        return data or None
+        return await reader.read()
 
-    async def _write_to_process(self, data: str) -> None:
+    async def _write_to_process(self, data: Union[str, bytes]) -> None:
         if not data:
             return
-        encoded = data.encode("utf-8")
+        encoded = data if isinstance(data, bytes) else data.encode("utf-8")
         if self._process is None:
             return
         if sys.platform.startswith("win"):
@@ -412,14 +803,34 @@ class TerminalBridge:
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, os.write, master_fd, encoded)
 
-    async def _resize_pty(self, *, cols: Optional[int], rows: Optional[int]) -> None:
-        if cols is None or rows is None:
+    async def _write_to_task(self, binding: _SessionBinding, data: Union[str, bytes]) -> None:
+        process = binding.process
+        if not data or process is None or process.returncode is not None:
             return
+        encoded = data if isinstance(data, bytes) else data.encode("utf-8")
+        if sys.platform.startswith("win"):
+            if process.stdin is None:
+                return
+            process.stdin.write(encoded)
+            try:
+                await process.stdin.drain()
+            except Exception:
+                pass
+            return
+        if binding.master_fd is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, os.write, binding.master_fd, encoded)
+
+    async def _resize_pty(self, *, cols: Optional[int], rows: Optional[int]) -> None:
         if sys.platform.startswith("win"):
             # TODO: Windows ConPTY resizing could be implemented via pywinpty in future.
             return
-        master_fd = self._pty_master_fd
-        if master_fd is None:
+        self._set_pty_size(self._pty_master_fd, cols=cols, rows=rows)
+
+    @staticmethod
+    def _set_pty_size(master_fd: Optional[int], *, cols: Optional[int], rows: Optional[int]) -> None:
+        if master_fd is None or cols is None or rows is None or sys.platform.startswith("win"):
             return
         import fcntl
         import struct
@@ -448,6 +859,9 @@ class TerminalBridge:
         else:
             master_fd = self._pty_master_fd
             self._pty_master_fd = None
+            reader, self._pty_reader = self._pty_reader, None
+            if reader is not None:
+                reader.close()
             if master_fd is not None:
                 try:
                     os.close(master_fd)
@@ -461,21 +875,61 @@ class TerminalBridge:
                 logger.debug("Failed to terminate POSIX shell: %s", exc)
             await process.wait()
 
-    def _handle_output(self, text: str) -> None:
+    async def _terminate_task_process(self, binding: _SessionBinding) -> None:
+        process = binding.process
+        if process is None:
+            return
+        if process.returncode is None:
+            try:
+                process.terminate()
+            except ProcessLookupError:
+                pass
+            except Exception as exc:
+                logger.debug("Failed to terminate PTY for task %s: %s", binding.task_id, exc)
+        reader = binding.reader
+        if reader is not None:
+            # The reader reaps the process, records the exit code and closes the PTY.
+            await asyncio.gather(reader, return_exceptions=True)
+        else:
+            await process.wait()
+            self._close_master_fd(binding)
+
+    @staticmethod
+    def _close_master_fd(binding: _SessionBinding) -> None:
+        if binding.pty_reader is not None:
+            binding.pty_reader.close()
+        master_fd, binding.master_fd = binding.master_fd, None
+        if master_fd is not None:
+            try:
+                os.close(master_fd)
+            except OSError:
+                pass
+
+    def _attached_binding(self) -> Optional[_SessionBinding]:
+        task_id = self._attached_task_id
+        if task_id is None:
+            return None
+        with self._session_lock:
+            binding = self._sessions.get(task_id)
+        if binding is None or binding.process is None or binding.process.returncode is not None:
+            return None
+        return binding
+
+    def _handle_output(self, text: str, binding: Optional[_SessionBinding] = None) -> None:
         if not text:
             return
         session: Optional[_SessionBinding] = None
-        task_id: Optional[str] = None
         with self._session_lock:
-            session = self._session
-            if session:
-                task_id = session.task_id
-                try:
-                    session.stream.write(text)
-                    session.stream.flush()
-                except Exception as exc:
-                    logger.error("Failed writing terminal log for %s: %s", session.task_id, exc, exc_info=True)
-        if self._event_bus and task_id:
+            if binding is None:
+                session = self._sessions.get(self._interactive_task_id or "")
+            elif self._sessions.get(binding.task_id) is binding:
+                session = binding
+        if session is None:
+            return
+        task_id = session.task_id
+        # Only queues the text; the log writer thread does the disk I/O.
+        self._log_writer.write(session.log, text)
+        if self._event_bus:
             payload = {
                 "task_id": task_id,
                 "text": text,
@@ -487,17 +941,21 @@ class TerminalBridge:
             except Exception:
                 logger.error("Failed to dispatch terminal output event", exc_info=True)
 
-    def _close_session_locked(self) -> None:
-        session = self._session
+    def _close_session_locked(self, task_id: str) -> Optional[_SessionBinding]:
+        session = self._sessions.pop(task_id, None)
         if not session:
-            return
-        try:
-            session.stream.flush()
-        except Exception:
-            pass
-        try:
-            session.stream.close()
-        except Exception:
-            pass
+            return None
+        if self._interactive_task_id == task_id:
+            self._interactive_task_id = None
         logger.info("Stopped capturing terminal output for task %s", session.task_id)
-        self._session = None
+        return session
+
+    def _close_logs(self, bindings: Iterable[Optional[_SessionBinding]], timeout: float = 5.0) -> None:
+        """Close the bindings' logs, waiting for their queued output to be written."""
+        for binding in bindings:
+            if binding is None:
+                continue
+            try:
+                self._log_writer.close(binding.log).result(timeout)
+            except Exception as exc:
+                logger.warning("Closing terminal log for %s failed: %s", binding.task_id, exc)
@@ -0,0 +1,207 @@
+"""Coalescing, backpressure-aware writer for terminal websocket frames."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.aura.utils.metrics import RateMeter
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop", "summarize")
+
+
+class TerminalFrameWriter:
+    """
+    Merge terminal output into few websocket frames and bound what a slow client can queue.
+
+    ``write`` appends output to a pending buffer that a single flusher task
+    sends. Output arriving after an idle period goes out immediately so echo
+    stays snappy. During a burst, later reads are merged until
+    ``flush_interval`` passes or ``max_frame_size`` is reached. While a send
+    is in flight (``websocket.send`` waits for the transport to drain when
+    the client falls behind), output keeps accumulating. Once more than
+    ``max_pending_size`` is waiting, the overflow policy applies:
+
+    - ``"block"``: ``write`` waits for the flusher. This stalls the PTY
+      reader, so the kernel throttles the child process.
+    - ``"drop"``: the oldest pending output is discarded and the newest
+      tail is kept, with an ``[output truncated]`` marker in place of the gap.
+    - ``"summarize"``: like ``"drop"``, but the marker also says how much
+      was skipped.
+
+    Sizes are ``len()`` units, i.e. characters for text frames and bytes for
+    binary ones. Only the mirrored view is affected; the session log and
+    output events still see everything.
+    """
+
+    _DEFAULT_POLICY = "summarize"
+
+    def __init__(
+        self,
+        send: Callable[[Any], Awaitable[None]],
+        *,
+        flush_interval: float = 0.01,
+        max_frame_size: int = 64 * 1024,
+        max_pending_size: int = 1024 * 1024,
+        policy: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            send: Coroutine function delivering one frame (e.g. ``websocket.send``).
+            flush_interval: Seconds to merge output for during a burst.
+            max_frame_size: Largest frame sent; a full frame is flushed early.
+            max_pending_size: Output allowed to wait for the client before the policy applies.
+            policy: ``"block"``, ``"drop"`` or ``"summarize"`` (``AURA_TERMINAL_BACKPRESSURE``).
+        """
+        self._send = send
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.max_frame_size = max(1, int(max_frame_size))
+        self.max_pending_size = max(self.max_frame_size, int(max_pending_size))
+        self.policy = self._resolve_policy(policy)
+
+        self._pending: List[Any] = []
+        self._pending_size = 0
+        self._skipped = 0
+        self._data_ready = asyncio.Event()
+        self._frame_full = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._last_send = float("-inf")
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.frames = RateMeter()
+        self.sent = RateMeter()
+        self.dropped = 0
+
+    @classmethod
+    def _resolve_policy(cls, policy: Optional[str]) -> str:
+        value = (policy or os.getenv("AURA_TERMINAL_BACKPRESSURE") or cls._DEFAULT_POLICY).strip().lower()
+        if value not in OVERFLOW_POLICIES:
+            logger.warning("Unknown terminal backpressure policy %r; using %s", value, cls._DEFAULT_POLICY)
+            return cls._DEFAULT_POLICY
+        return value
+
+    # ------------------------------------------------------------------ Public API
+    def start(self) -> None:
+        """Start the flusher task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def write(self, data: Any) -> None:
+        """
+        Queue ``data`` for the client.
+
+        Raises:
+            Exception: Whatever made a previous send fail (e.g. the connection closed).
+        """
+        self._raise_if_failed()
+        if not data or self._closed:
+            return
+        if self.policy == "block":
+            while self._pending_size >= self.max_pending_size and not self._closed:
+                self._drained.clear()
+                await self._drained.wait()
+                self._raise_if_failed()
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size > self.max_pending_size and self.policy != "block":
+            self._shed(self._pending_size - self.max_pending_size)
+        if self._pending_size >= self.max_frame_size:
+            self._frame_full.set()
+        self._data_ready.set()
+
+    async def close(self, *, flush: bool = True) -> None:
+        """Stop the flusher, sending what is still pending unless ``flush`` is False."""
+        self._closed = True
+        self._drained.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if flush and self._pending:
+            try:
+                await self._send_pending()
+            except Exception as exc:
+                logger.debug("Final terminal frame flush failed: %s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return frame and size totals, recent per-second rates and the overflow state."""
+        return {
+            "frames": int(self.frames.total),
+            "bytes": int(self.sent.total),
+            "frames_per_sec": round(self.frames.rate(), 2),
+            "bytes_per_sec": round(self.sent.rate(), 2),
+            "pending": self._pending_size,
+            "dropped": self.dropped,
+            "policy": self.policy,
+        }
+
+    # ------------------------------------------------------------------ Internals
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._data_ready.wait()
+            if self._pending_size < self.max_frame_size and loop.time() - self._last_send < self.flush_interval:
+                try:
+                    await asyncio.wait_for(self._frame_full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._send_pending()
+            self._last_send = loop.time()
+
+    async def _send_pending(self) -> None:
+        chunks, self._pending = self._pending, []
+        self._pending_size = 0
+        self._data_ready.clear()
+        self._frame_full.clear()
+        try:
+            if not chunks:
+                return
+            frame = chunks[0][:0].join(chunks)
+            skipped, self._skipped = self._skipped, 0
+            if skipped:
+                frame = self._truncation_marker(skipped, isinstance(frame, bytes)) + frame
+            for offset in range(0, len(frame), self.max_frame_size):
+                piece = frame[offset : offset + self.max_frame_size]
+                await self._send(piece)
+                self.frames.mark()
+                self.sent.mark(len(piece))
+        finally:
+            # Blocked writers resume only once this output has actually left.
+            self._drained.set()
+
+    def _truncation_marker(self, skipped: int, binary: bool) -> Any:
+        if self.policy == "summarize":
+            detail = (
+                f"aura: {skipped} {'bytes' if binary else 'characters'} of output skipped "
+                "while the terminal caught up"
+            )
+        else:
+            detail = "output truncated"
+        marker = f"\r\n\x1b[2m[{detail}]\x1b[0m\r\n"
+        return marker.encode("utf-8") if binary else marker
+
+    def _shed(self, excess: int) -> None:
+        # Drop the oldest output first; the client only needs the latest screen.
+        # ``_send_pending`` puts a truncation marker where the gap is.
+        self.dropped += excess
+        self._skipped += excess
+        self._pending_size -= excess
+        while excess > 0:
+            head = self._pending[0]
+            if len(head) <= excess:
+                self._pending.pop(0)
+                excess -= len(head)
+            else:
+                self._pending[0] = head[excess:]
+                excess = 0
+
+    def _raise_if_failed(self) -> None:
+        task = self._task
+        if task is not None and task.done() and not task.cancelled():
+            task.result()
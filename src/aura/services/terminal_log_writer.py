@@ -0,0 +1,259 @@
+"""Background writer that keeps terminal log disk I/O off the PTY read path."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Set, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("never", "flush", "close")
+
+
+class TerminalLog:
+    """Handle on one open session log; only ``TerminalLogWriter`` touches the file."""
+
+    def __init__(self, path: Path, stream: TextIO) -> None:
+        self.path = path
+        self._stream = stream
+        self._dirty = 0
+        self._dropped = 0
+        self.closed = False
+
+
+class TerminalLogWriter:
+    """
+    Append terminal output to session logs from a dedicated thread.
+
+    ``write`` only queues the text, so the event loop that reads PTY output
+    never waits for the disk. The writer thread appends queued text through
+    a large buffered stream. It flushes a log once ``flush_bytes`` are
+    buffered for it and flushes every dirty log each ``flush_interval``
+    seconds. The fsync policy (``AURA_TERMINAL_LOG_FSYNC``) is one of:
+
+    - ``"never"``: leave syncing to the OS.
+    - ``"flush"``: fsync after every flush.
+    - ``"close"``: fsync once when a log is closed.
+
+    ``flush`` and ``close`` return futures that resolve once everything
+    queued before them is on disk, which is the final-flush guarantee
+    behind ``TerminalBridge.end_session``.
+
+    The queue is bounded by ``max_queue_bytes`` and ``write`` never waits.
+    Text that does not fit while the disk lags is dropped. The log gets an
+    ``[aura: N characters of output dropped]`` line where the gap is, and
+    the loss is counted in ``stats()``.
+    """
+
+    _DEFAULT_FSYNC = "never"
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = 0.25,
+        flush_bytes: int = 64 * 1024,
+        max_queue_bytes: int = 4 * 1024 * 1024,
+        fsync: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            flush_interval: Longest time written text may sit in a log's buffer.
+            flush_bytes: Buffered size that triggers an early flush of a log.
+            max_queue_bytes: Queued text allowed before further output is dropped.
+            fsync: ``"never"``, ``"flush"`` or ``"close"`` (``AURA_TERMINAL_LOG_FSYNC``).
+        """
+        self.flush_interval = max(0.01, float(flush_interval))
+        self.flush_bytes = max(1, int(flush_bytes))
+        self.max_queue_bytes = max(1, int(max_queue_bytes))
+        self.fsync = self._resolve_fsync(fsync)
+
+        self._condition = threading.Condition()
+        self._queue: Deque[Tuple[str, TerminalLog, object]] = deque()
+        self._queued_bytes = 0
+        self._logs: Set[TerminalLog] = set()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._stats = {"writes": 0, "bytes": 0, "flushes": 0, "fsyncs": 0, "dropped_bytes": 0}
+
+    @classmethod
+    def _resolve_fsync(cls, policy: Optional[str]) -> str:
+        value = (policy or os.getenv("AURA_TERMINAL_LOG_FSYNC") or cls._DEFAULT_FSYNC).strip().lower()
+        if value not in FSYNC_POLICIES:
+            logger.warning("Unknown terminal log fsync policy %r; using %s", value, cls._DEFAULT_FSYNC)
+            return cls._DEFAULT_FSYNC
+        return value
+
+    # ------------------------------------------------------------------ Public API
+    def open(self, path: Path) -> TerminalLog:
+        """
+        Open ``path`` for appending and return its handle.
+
+        Raises:
+            OSError: The log directory or file could not be created.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stream = path.open("a", encoding="utf-8", buffering=max(self.flush_bytes, 8192))
+        log = TerminalLog(path, stream)
+        with self._condition:
+            self._logs.add(log)
+            self._ensure_thread_locked()
+        return log
+
+    def write(self, log: TerminalLog, text: str) -> None:
+        """Queue ``text`` for ``log`` without blocking; drops it if the queue is full."""
+        if not text or log.closed:
+            return
+        size = len(text)
+        with self._condition:
+            if self._queued_bytes + size > self.max_queue_bytes:
+                log._dropped += size
+                self._stats["dropped_bytes"] += size
+                return
+            self._queue_drop_marker_locked(log)
+            self._queue.append(("data", log, text))
+            self._queued_bytes += size
+            self._condition.notify_all()
+
+    def flush(self, log: Optional[TerminalLog] = None) -> "Future[None]":
+        """Flush ``log`` (every open log when omitted) once queued text is written."""
+        return self._enqueue_marker("flush", log)
+
+    def close(self, log: TerminalLog) -> "Future[None]":
+        """Write what is queued for ``log``, flush it and close the file."""
+        return self._enqueue_marker("close", log)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close every open log and stop the writer thread (restarted by the next ``open``)."""
+        with self._condition:
+            logs = list(self._logs)
+        for log in logs:
+            try:
+                self.close(log).result(timeout)
+            except Exception as exc:
+                logger.debug("Closing terminal log %s failed: %s", log.path, exc)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._condition:
+            self._stopping = False
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {**self._stats, "queued_bytes": self._queued_bytes, "open_logs": len(self._logs)}
+
+    # ------------------------------------------------------------------ Internals
+    def _queue_drop_marker_locked(self, log: TerminalLog) -> None:
+        if not log._dropped:
+            return
+        notice = f"\n[aura: {log._dropped} characters of output dropped while the log disk lagged]\n"
+        log._dropped = 0
+        self._queue.append(("data", log, notice))
+        self._queued_bytes += len(notice)
+
+    def _enqueue_marker(self, kind: str, log: Optional[TerminalLog]) -> "Future[None]":
+        future: "Future[None]" = Future()
+        with self._condition:
+            for target in [log] if log is not None else list(self._logs):
+                self._queue_drop_marker_locked(target)
+            if self._thread is None:
+                # Nothing is queued without a running thread; act inline.
+                self._apply_marker(kind, log)
+                future.set_result(None)
+                return future
+            self._queue.append((kind, log, future))
+            self._condition.notify_all()
+        return future
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="aura-terminal-log", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            with self._condition:
+                if not self._queue and not self._stopping:
+                    self._condition.wait(self.flush_interval)
+                if self._stopping and not self._queue:
+                    return
+                batch: List[Tuple[str, TerminalLog, object]] = list(self._queue)
+                self._queue.clear()
+                self._queued_bytes = 0
+                self._condition.notify_all()
+
+            for kind, log, item in batch:
+                if kind == "data":
+                    self._append(log, item)  # type: ignore[arg-type]
+                    continue
+                try:
+                    self._apply_marker(kind, log)
+                    item.set_result(None)  # type: ignore[union-attr]
+                except Exception as exc:
+                    item.set_exception(exc)  # type: ignore[union-attr]
+
+            now = time.monotonic()
+            if now - last_flush >= self.flush_interval:
+                self._flush_dirty()
+                last_flush = now
+
+    def _append(self, log: TerminalLog, text: str) -> None:
+        if log.closed:
+            return
+        try:
+            log._stream.write(text)
+        except Exception as exc:
+            logger.error("Failed writing terminal log %s: %s", log.path, exc, exc_info=True)
+            return
+        log._dirty += len(text)
+        self._stats["writes"] += 1
+        self._stats["bytes"] += len(text)
+        if log._dirty >= self.flush_bytes:
+            self._flush_log(log)
+
+    def _apply_marker(self, kind: str, log: Optional[TerminalLog]) -> None:
+        if kind == "flush":
+            if log is None:
+                self._flush_dirty(force=True)
+            else:
+                self._flush_log(log, force=True)
+            return
+        if log is None or log.closed:
+            return
+        self._flush_log(log, force=True, sync=self.fsync != "never")
+        log.closed = True
+        with self._condition:
+            self._logs.discard(log)
+        try:
+            log._stream.close()
+        except Exception as exc:
+            logger.debug("Failed closing terminal log %s: %s", log.path, exc)
+
+    def _flush_dirty(self, force: bool = False) -> None:
+        with self._condition:
+            logs = list(self._logs)
+        for log in logs:
+            self._flush_log(log, force=force)
+
+    def _flush_log(self, log: TerminalLog, *, force: bool = False, sync: Optional[bool] = None) -> None:
+        if log.closed or (not log._dirty and not force):
+            return
+        try:
+            log._stream.flush()
+            self._stats["flushes"] += 1
+            if sync if sync is not None else self.fsync == "flush":
+                os.fsync(log._stream.fileno())
+                self._stats["fsyncs"] += 1
+        except Exception as exc:
+            logger.error("Failed flushing terminal log %s: %s", log.path, exc, exc_info=True)
+        log._dirty = 0
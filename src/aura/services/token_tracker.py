@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Dict, Iterable, Optional
 
-from src.aura.app.event_bus import EventBus
+from src.aura.app.event_bus import WORKER_LANE, EventBus
 from src.aura.models.events import Event
 from src.aura.models.event_types import (
     CONVERSATION_MESSAGE_ADDED,
@@ -49,8 +49,9 @@ class TokenTracker:
     # ------------------------------------------------------------------ #
 
     def _register_event_handlers(self) -> None:
-        self.event_bus.subscribe(CONVERSATION_SESSION_STARTED, self._handle_session_started)
-        self.event_bus.subscribe(CONVERSATION_MESSAGE_ADDED, self._handle_message_added)
+        # Token accounting is pure bookkeeping; keep it off the UI thread.
+        self.event_bus.subscribe(CONVERSATION_SESSION_STARTED, self._handle_session_started, lane=WORKER_LANE)
+        self.event_bus.subscribe(CONVERSATION_MESSAGE_ADDED, self._handle_message_added, lane=WORKER_LANE)
 
     # ------------------------------------------------------------------ #
     # Event handlers
@@ -0,0 +1,59 @@
+"""Cooperative cancellation for long-running LLM requests."""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, List, Optional
+
+
+class CancellationToken:
+    """
+    Thread-safe, one-shot cancellation flag.
+
+    Work loops poll ``cancelled`` between steps and use ``wait`` instead of
+    ``time.sleep`` so a pending backoff ends the moment ``cancel`` is called.
+    """
+
+    __slots__ = ("_event", "_lock", "_callbacks", "reason")
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[["CancellationToken"], None]] = []
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """
+        Request cancellation.
+
+        Args:
+            reason: Short description recorded on the token and reported to listeners.
+
+        Returns:
+            True if this call cancelled the token, False if it was already cancelled.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+        return True
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds; return True early if the token is cancelled."""
+        return self._event.wait(timeout)
+
+    def add_callback(self, callback: Callable[["CancellationToken"], None]) -> None:
+        """Run ``callback(token)`` once on cancellation (immediately if already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
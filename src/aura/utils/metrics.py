@@ -0,0 +1,120 @@
+"""Lightweight in-process metrics primitives."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+# Upper bounds in milliseconds; roughly doubling from 0.05 ms to 5 s.
+DEFAULT_LATENCY_BUCKETS_MS: Sequence[float] = (
+    0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000, 2500, 5000,
+)
+
+
+class LatencyHistogram:
+    """
+    Thread-safe fixed-bucket histogram of durations.
+
+    Observations are recorded in seconds and reported in milliseconds. Percentiles
+    are estimated from bucket upper bounds, which is accurate enough to tell a
+    1 ms subscriber from a 50 ms one without storing every sample.
+    """
+
+    def __init__(self, bounds_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS) -> None:
+        self._bounds: List[float] = sorted(float(bound) for bound in bounds_ms)
+        self._counts: List[int] = [0] * (len(self._bounds) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration measured in seconds."""
+        value_ms = seconds * 1000.0
+        index = bisect.bisect_left(self._bounds, value_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total_ms += value_ms
+            if value_ms > self.max_ms:
+                self.max_ms = value_ms
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Return the bucket upper bound (ms) at or below which ``fraction`` of samples fall."""
+        with self._lock:
+            return self._percentile_locked(fraction)
+
+    def snapshot(self) -> Dict[str, Union[int, float, Dict[str, int]]]:
+        """Return count, mean/max and estimated p50/p95/p99 in ms, plus non-empty buckets."""
+        with self._lock:
+            buckets = {}
+            for index, count in enumerate(self._counts):
+                if not count:
+                    continue
+                label = f"<={self._bounds[index]:g}" if index < len(self._bounds) else f">{self._bounds[-1]:g}"
+                buckets[label] = count
+            mean = self.total_ms / self.count if self.count else 0.0
+            return {
+                "count": self.count,
+                "mean_ms": round(mean, 3),
+                "max_ms": round(self.max_ms, 3),
+                "p50_ms": self._percentile_locked(0.50) or 0.0,
+                "p95_ms": self._percentile_locked(0.95) or 0.0,
+                "p99_ms": self._percentile_locked(0.99) or 0.0,
+                "buckets": buckets,
+            }
+
+    def _percentile_locked(self, fraction: float) -> Optional[float]:
+        if not self.count:
+            return None
+        target = max(fraction, 0.0) * self.count
+        running = 0
+        for index, count in enumerate(self._counts):
+            running += count
+            if running >= target and count:
+                if index < len(self._bounds):
+                    return min(self._bounds[index], round(self.max_ms, 3))
+                return round(self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+
+class RateMeter:
+    """
+    Thread-safe running total plus a per-second rate over a sliding window.
+
+    Marks are kept as ``(timestamp, amount)`` pairs for the last
+    ``window_seconds`` only, so the rate reflects recent throughput rather than
+    the lifetime average.
+    """
+
+    def __init__(self, window_seconds: float = 5.0) -> None:
+        self.window_seconds = float(window_seconds)
+        self._marks: Deque[Tuple[float, float]] = deque()
+        self._window_total = 0.0
+        self._lock = threading.Lock()
+        self.total = 0.0
+
+    def mark(self, amount: float = 1.0, now: Optional[float] = None) -> None:
+        """Record ``amount`` (events, bytes, ...) at ``now`` (monotonic seconds)."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._marks.append((now, amount))
+            self._window_total += amount
+            self.total += amount
+            self._expire_locked(now)
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """Return the amount per second over the window ending at ``now``."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire_locked(now)
+            return self._window_total / self.window_seconds
+
+    def _expire_locked(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._marks and self._marks[0][0] <= cutoff:
+            _, amount = self._marks.popleft()
+            self._window_total -= amount
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import codecs
+import json
 import logging
+import re
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
 
 
 logger = logging.getLogger(__name__)
@@ -70,3 +76,239 @@ def read_new_text(log_path: Path, position: int) -> tuple[str, int]:
         text = stream.read()
         new_position = stream.tell()
     return text, new_position
+
+
+class CliStatsAccumulator:
+    """
+    Incrementally extracts Gemini CLI statistics from terminal output.
+
+    Output is consumed chunk by chunk as the session runs, so at completion the
+    final numbers are already known instead of being recomputed from the whole
+    log. Two scanners share each chunk:
+
+    - a line scanner that counts ``Using tool:`` lines, ``Writing to:`` targets
+      and added/removed line counts with precompiled patterns;
+    - a streaming brace matcher that tracks JSON objects across chunk
+      boundaries and keeps the most recent one that parses. Objects introduced
+      by a ``json`` marker (``json{...}``) take precedence over bare ones.
+
+    An unbalanced ``{`` in prose or code must not swallow the rest of the log,
+    so a ``{`` at the start of a line, or a raw newline inside a string (which
+    JSON never contains), abandons the current candidate.
+    """
+
+    _TOOL_MARKER = "using tool:"
+    _WRITING_RE = re.compile(r"writing to:\s*(.+)", re.IGNORECASE)
+    _ADDED_RE = re.compile(r"(?:wrote|added)\s+(\d+)\s+lines", re.IGNORECASE)
+    _REMOVED_RE = re.compile(r"(?:removed|deleted)\s+(\d+)\s+lines", re.IGNORECASE)
+    _BLOCK_TOKEN_RE = re.compile(r'["{}]')
+    _STRING_TOKEN_RE = re.compile(r'["\\\n]')
+    _JSON_MARKER = "json"
+    _MAX_BLOCK_CHARS = 4 * 1024 * 1024
+    _READ_SIZE = 64 * 1024
+
+    def __init__(self, log_path: Optional[Path] = None) -> None:
+        self.log_path = Path(log_path) if log_path is not None else None
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._last_consumed = 0.0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        self.tool_calls = 0
+        self.file_targets: Set[str] = set()
+        self.lines_added = 0
+        self.lines_removed = 0
+        self.matched_text = False
+        self._line_tail = ""
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._block: List[str] = []
+        self._block_chars = 0
+        self._block_marked = False
+        self._carry = ""
+        self._latest_marked: Optional[Dict[str, Any]] = None
+        self._latest_bare: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------ Public API
+    def feed(self, text: str) -> None:
+        """Consume the next chunk of output."""
+        if not text:
+            return
+        with self._lock:
+            self._scan(text)
+
+    def consume_file(self, min_interval: float = 0.0) -> None:
+        """
+        Feed whatever was appended to ``log_path`` since the previous call.
+
+        Calls within ``min_interval`` seconds of the previous read are skipped,
+        letting per-chunk callers poll cheaply; the final call should pass 0.
+        """
+        if self.log_path is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if min_interval and now - self._last_consumed < min_interval:
+                return
+            self._last_consumed = now
+            try:
+                with self.log_path.open("rb") as stream:
+                    stream.seek(self._offset)
+                    while True:
+                        data = stream.read(self._READ_SIZE)
+                        if not data:
+                            break
+                        self._offset += len(data)
+                        self._scan(self._decoder.decode(data))
+            except OSError as exc:
+                logger.debug("Failed reading output log %s: %s", self.log_path, exc)
+
+    def flush(self) -> None:
+        """Treat the output seen so far as complete (scans a trailing unterminated line)."""
+        with self._lock:
+            self._scan(self._decoder.decode(b"", final=True))
+            line, self._line_tail = self._line_tail, ""
+            self._scan_line(line)
+
+    def latest_json(self) -> Optional[Dict[str, Any]]:
+        """Most recent parseable JSON object, preferring ``json``-marked ones."""
+        with self._lock:
+            return self._latest_marked if self._latest_marked is not None else self._latest_bare
+
+    def _scan(self, text: str) -> None:
+        if text:
+            self._scan_lines(text)
+            self._scan_json(text)
+
+    # ------------------------------------------------------------------ Line scanner
+    def _scan_lines(self, text: str) -> None:
+        lines = (self._line_tail + text).split("\n")
+        self._line_tail = lines.pop()
+        for line in lines:
+            self._scan_line(line)
+
+    def _scan_line(self, raw_line: str) -> None:
+        line = raw_line.strip()
+        if not line:
+            return
+        if self._TOOL_MARKER in line.lower():
+            self.tool_calls += 1
+            self.matched_text = True
+        writing_match = self._WRITING_RE.search(line)
+        if writing_match:
+            self.file_targets.add(writing_match.group(1).strip())
+            self.matched_text = True
+        added_match = self._ADDED_RE.search(line)
+        if added_match:
+            self.lines_added += int(added_match.group(1))
+            self.matched_text = True
+        removed_match = self._REMOVED_RE.search(line)
+        if removed_match:
+            self.lines_removed += int(removed_match.group(1))
+            self.matched_text = True
+
+    # ------------------------------------------------------------------ JSON scanner
+    def _scan_json(self, text: str) -> None:
+        position = 0
+        length = len(text)
+        segment_start = 0
+        while position < length:
+            if self._escape:
+                self._escape = False
+                position += 1
+                continue
+            if self._in_string:
+                match = self._STRING_TOKEN_RE.search(text, position)
+                if match is None:
+                    position = length
+                    break
+                position = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                elif match.group() == "\n":
+                    self._reset_block()
+                else:
+                    self._in_string = False
+                continue
+
+            if self._depth == 0:
+                brace = text.find("{", position)
+                if brace == -1:
+                    position = length
+                    break
+                self._start_block(self._preceded_by_marker(text, brace))
+                segment_start = brace
+                position = brace + 1
+                continue
+
+            match = self._BLOCK_TOKEN_RE.search(text, position)
+            if match is None:
+                position = length
+                break
+            token, position = match.group(), match.end()
+            if token == '"':
+                self._in_string = True
+            elif token == "{":
+                if self._preceded_by_marker(text, position - 1):
+                    # JSON never contains a bare ``json{``; a new marked object starts here.
+                    self._start_block(True)
+                    segment_start = position - 1
+                elif self._at_line_start(text, position - 1):
+                    # Pretty-printed JSON indents nested objects; this is a new candidate.
+                    self._start_block(False)
+                    segment_start = position - 1
+                else:
+                    self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._block.append(text[segment_start:position])
+                    self._finish_block()
+
+        if self._depth > 0:
+            self._block.append(text[segment_start:length])
+            self._block_chars += length - segment_start
+            if self._block_chars > self._MAX_BLOCK_CHARS:
+                logger.debug("Dropping oversized JSON candidate (%d chars)", self._block_chars)
+                self._reset_block()
+        self._carry = (self._carry + text[-len(self._JSON_MARKER):])[-len(self._JSON_MARKER):]
+
+    def _preceded_by_marker(self, text: str, index: int) -> bool:
+        size = len(self._JSON_MARKER)
+        preceding = text[index - size:index] if index >= size else (self._carry + text[:index])[-size:]
+        return preceding.lower() == self._JSON_MARKER
+
+    def _at_line_start(self, text: str, index: int) -> bool:
+        preceding = text[index - 1] if index else self._carry[-1:]
+        return preceding == "\n"
+
+    def _start_block(self, marked: bool) -> None:
+        self._reset_block()
+        self._depth = 1
+        self._block_marked = marked
+
+    def _finish_block(self) -> None:
+        block = "".join(self._block)
+        marked = self._block_marked
+        self._reset_block()
+        try:
+            payload = json.loads(block)
+        except json.JSONDecodeError as exc:
+            logger.debug("Skipping unparseable JSON block: %s", exc)
+            return
+        if not isinstance(payload, dict):
+            return
+        if marked:
+            self._latest_marked = payload
+        else:
+            self._latest_bare = payload
+
+    def _reset_block(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._block = []
+        self._block_chars = 0
+        self._block_marked = False
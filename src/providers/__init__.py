@@ -1 +1,54 @@
-"""LLM Provider implementations for Aura."""
+"""
+LLM Provider implementations for Aura.
+
+Provider modules (and the SDKs behind them) are imported lazily through
+``get_provider_class`` so that importing this package, or the services that
+use it, does not pay for SDKs that are never used.
+"""
+import importlib
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# provider name -> (module path, class name)
+_PROVIDER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "Google": ("src.providers.gemini_provider", "GeminiProvider"),
+    "Ollama": ("src.providers.ollama_provider", "OllamaProvider"),
+}
+
+_loaded: Dict[str, Optional[type]] = {}
+_lock = threading.Lock()
+
+
+def provider_names() -> Tuple[str, ...]:
+    """Return the names of all registered providers, in load order."""
+    return tuple(_PROVIDER_REGISTRY)
+
+
+def get_provider_class(name: str) -> Optional[type]:
+    """
+    Import and return the provider class registered under ``name``.
+
+    The import happens on first call and its result (including failure) is cached.
+
+    Args:
+        name: Registered provider name (e.g. "Google").
+
+    Returns:
+        The provider class, or None if it is unknown or its module fails to import.
+    """
+    with _lock:
+        if name in _loaded:
+            return _loaded[name]
+        entry = _PROVIDER_REGISTRY.get(name)
+        provider_class: Optional[type] = None
+        if entry is not None:
+            module_path, class_name = entry
+            try:
+                provider_class = getattr(importlib.import_module(module_path), class_name)
+            except Exception as exc:  # pragma: no cover - optional provider
+                logger.debug("Provider '%s' unavailable (%s): %s", name, module_path, exc)
+        _loaded[name] = provider_class
+        return provider_class
@@ -1,7 +1,15 @@
 """Google Gemini LLM Provider for Aura."""
+import asyncio
+import hashlib
+import importlib.util
+import json
 import logging
 import os
-from typing import Any, Dict, Generator, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Generator, Hashable, List, Optional, Tuple
 
 from src.aura.services.user_settings_manager import load_user_settings
 
@@ -9,14 +17,48 @@ from src.aura.services.user_settings_manager import load_user_settings
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _CachedContext:
+    """A server-side ``CachedContent`` handle and when it expires locally."""
+
+    handle: Any
+    expires_at: float
+
+
 class GeminiProvider:
     """
     Provider for Google Gemini models.
 
     Environment variables take precedence - standard security practice.
     Checks GEMINI_API_KEY and GOOGLE_API_KEY before user_settings.json.
+
+    ``GenerativeModel`` handles are cached per (model, generation config, system
+    instruction) with LRU eviction, so repeated calls skip model construction.
+
+    The ``google.generativeai`` SDK is imported on first use of ``client``, not at
+    construction, so listing models never pays for the SDK import.
+
+    Agents that set ``context_cache`` in their config have large stable prefixes
+    (system instruction plus earlier turns, or a ``PrefixedPrompt`` prefix) stored
+    with Gemini's server-side context caching. Earlier turns join the cached
+    prefix in blocks of ``context_cache_turn_block`` (default 8), and the turns
+    after the last full block are sent as live history, so a growing chat reuses
+    one cache for a whole block instead of creating one per turn. Handles are
+    reused until shortly before their TTL runs out, deleted on eviction, and any
+    failure to create one falls back to sending the full request for a few
+    minutes before caching that prefix is tried again.
     """
 
+    _MODEL_CACHE_SIZE = 8
+    _CONTEXT_CACHE_SIZE = 4
+    _CONTEXT_CACHE_TTL_SECONDS = 3600.0
+    # Gemini rejects caches below a minimum token count; ~4 characters per token.
+    _CONTEXT_CACHE_MIN_CHARS = 4 * 4096
+    _CONTEXT_CACHE_REFRESH_MARGIN_SECONDS = 60.0
+    _CONTEXT_CACHE_TURN_BLOCK = 8
+    # After a failed create, the same prefix goes uncached this long before retrying.
+    _CONTEXT_CACHE_RETRY_SECONDS = 300.0
+
     def __init__(self, image_storage: Optional[Any] = None) -> None:
         """
         Initialize Gemini provider with API key from environment or settings.
@@ -27,19 +69,43 @@ class GeminiProvider:
         self.image_storage = image_storage
         self.provider_name = "Google"
         self.api_key = self._load_api_key()
-
-        # Initialize Gemini client if API key is available
+        self._model_cache: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self._model_cache_lock = threading.Lock()
+        self._model_cache_hits = 0
+        self._model_cache_misses = 0
+        self._context_caches: "OrderedDict[Tuple[Hashable, ...], _CachedContext]" = OrderedDict()
+        self._context_cache_lock = threading.Lock()
+        # Key -> monotonic time after which creating the cache may be retried.
+        self._context_cache_failures: "OrderedDict[Tuple[Hashable, ...], float]" = OrderedDict()
+        self._context_cache_hits = 0
+        self._context_cache_misses = 0
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+        # The client itself is created lazily; only check the SDK is installed here.
         if self.api_key:
             logger.info("GeminiProvider initialized with API key from %s",
                        self._get_api_key_source())
-            self._init_client()
+            self._ensure_sdk_available()
         else:
             logger.warning(
                 "GeminiProvider initialized without API key. "
                 "Set GEMINI_API_KEY or GOOGLE_API_KEY environment variable, "
                 "or configure api_keys.google in user_settings.json"
             )
-            self.client = None
+
+    @property
+    def client(self) -> Any:
+        """The configured ``google.generativeai`` module, imported on first access."""
+        if self._client is None and self.api_key:
+            with self._client_lock:
+                if self._client is None:
+                    self._init_client()
+        return self._client
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
 
     def _load_api_key(self) -> Optional[str]:
         """
@@ -92,6 +158,23 @@ class GeminiProvider:
             return "GOOGLE_API_KEY environment variable"
         return "user_settings.json"
 
+    @staticmethod
+    def _ensure_sdk_available() -> None:
+        """Fail fast when the SDK is missing without paying for its import."""
+        try:
+            spec = importlib.util.find_spec("google.generativeai")
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None:
+            logger.error(
+                "Failed to import google.generativeai. "
+                "Install with: pip install google-generativeai"
+            )
+            raise ImportError(
+                "google-generativeai package not installed. "
+                "Install with: pip install google-generativeai"
+            )
+
     def _init_client(self) -> None:
         """Initialize the Google Generative AI client."""
         try:
@@ -112,6 +195,223 @@ class GeminiProvider:
             logger.error("Failed to initialize Gemini client: %s", exc)
             raise
 
+    def clear_model_cache(self) -> None:
+        """Drop all cached model handles and server-side contexts (e.g. after the LLM configuration is reloaded)."""
+        with self._model_cache_lock:
+            dropped = len(self._model_cache)
+            self._model_cache.clear()
+        with self._context_cache_lock:
+            contexts = list(self._context_caches.values())
+            self._context_caches.clear()
+            self._context_cache_failures.clear()
+        for context in contexts:
+            self._delete_context(context)
+        logger.info(
+            "Cleared %d cached Gemini model handles (hits=%d, misses=%d)",
+            dropped,
+            self._model_cache_hits,
+            self._model_cache_misses,
+        )
+
+    def model_cache_stats(self) -> Dict[str, int]:
+        """Return the model handle cache size and hit/miss counters."""
+        with self._model_cache_lock:
+            return {
+                "size": len(self._model_cache),
+                "hits": self._model_cache_hits,
+                "misses": self._model_cache_misses,
+            }
+
+    def context_cache_stats(self) -> Dict[str, int]:
+        """Return the server-side context cache size and hit/miss counters."""
+        with self._context_cache_lock:
+            return {
+                "size": len(self._context_caches),
+                "hits": self._context_cache_hits,
+                "misses": self._context_cache_misses,
+            }
+
+    def _get_cached_context(
+        self,
+        model_name: str,
+        config: Dict[str, Any],
+        system_instruction: Optional[str],
+        history: List[Dict[str, Any]],
+    ) -> Optional[Any]:
+        """
+        Return a server-side ``CachedContent`` for the stable part of a request.
+
+        Args:
+            model_name: The Gemini model identifier.
+            config: Agent configuration; caching is used only when ``context_cache`` is set.
+            system_instruction: Stable system instruction to cache.
+            history: Earlier conversation turns to cache with it (see ``_cached_turn_count``).
+
+        Returns:
+            The cached content handle, or None to use the plain request path.
+        """
+        if not config.get("context_cache"):
+            return None
+        size = len(system_instruction or "") + sum(
+            len(str(part)) for turn in history for part in turn.get("parts", [])
+        )
+        if size < int(config.get("context_cache_min_chars", self._CONTEXT_CACHE_MIN_CHARS)):
+            return None
+
+        material = json.dumps([system_instruction, history], sort_keys=True, default=str)
+        key = (model_name, hashlib.sha256(material.encode("utf-8")).hexdigest())
+        now = time.monotonic()
+        with self._context_cache_lock:
+            retry_at = self._context_cache_failures.get(key)
+            if retry_at is not None:
+                if now < retry_at:
+                    return None
+                del self._context_cache_failures[key]
+            context = self._context_caches.get(key)
+            if context is not None and context.expires_at - now > self._CONTEXT_CACHE_REFRESH_MARGIN_SECONDS:
+                self._context_caches.move_to_end(key)
+                self._context_cache_hits += 1
+                return context.handle
+            self._context_cache_misses += 1
+            stale = self._context_caches.pop(key, None)
+        if stale is not None:
+            self._delete_context(stale)
+
+        ttl = float(config.get("context_cache_ttl_seconds", self._CONTEXT_CACHE_TTL_SECONDS))
+        try:
+            caching = self.client.caching
+            handle = caching.CachedContent.create(
+                model=model_name,
+                system_instruction=system_instruction,
+                contents=history or None,
+                ttl=int(ttl),
+            )
+        except Exception as exc:
+            logger.info("Gemini context caching unavailable for '%s'; sending full request: %s", model_name, exc)
+            with self._context_cache_lock:
+                self._context_cache_failures[key] = time.monotonic() + self._CONTEXT_CACHE_RETRY_SECONDS
+                while len(self._context_cache_failures) > self._CONTEXT_CACHE_SIZE * 4:
+                    self._context_cache_failures.popitem(last=False)
+            return None
+
+        evicted: List[_CachedContext] = []
+        with self._context_cache_lock:
+            self._context_caches[key] = _CachedContext(handle=handle, expires_at=now + ttl)
+            while len(self._context_caches) > self._CONTEXT_CACHE_SIZE:
+                evicted.append(self._context_caches.popitem(last=False)[1])
+        for context in evicted:
+            self._delete_context(context)
+        logger.debug("Created Gemini cached context for '%s' (%d chars, ttl=%ds)", model_name, size, int(ttl))
+        return handle
+
+    @classmethod
+    def _cached_turn_count(cls, config: Dict[str, Any], history: List[Dict[str, Any]]) -> int:
+        """How many leading history turns belong in the cached prefix; it only grows a block at a time."""
+        block = max(1, int(config.get("context_cache_turn_block", cls._CONTEXT_CACHE_TURN_BLOCK)))
+        return len(history) // block * block
+
+    def _invalidate_cached_context(self, handle: Any) -> None:
+        """Forget and delete a cached context after a request using it failed (e.g. it expired early)."""
+        evicted: List[_CachedContext] = []
+        with self._context_cache_lock:
+            for key, context in list(self._context_caches.items()):
+                if context.handle is handle:
+                    evicted.append(self._context_caches.pop(key))
+        for context in evicted:
+            self._delete_context(context)
+
+    @staticmethod
+    def _delete_context(context: _CachedContext) -> None:
+        try:
+            context.handle.delete()
+        except Exception as exc:  # noqa: BLE001 - best effort; the TTL cleans up anyway
+            logger.debug("Failed to delete Gemini cached context: %s", exc)
+
+    def _cached_model(self, handle: Any, generation_config: Dict[str, Any]) -> Any:
+        return self.client.GenerativeModel.from_cached_content(
+            cached_content=handle, generation_config=generation_config
+        )
+
+    @staticmethod
+    def _prompt_prefix(prompt: Any) -> Tuple[Optional[str], Any]:
+        """Return (stable prefix, remainder) for prefix-marked prompts, else (None, prompt)."""
+        prefix = getattr(prompt, "prefix", None)
+        if isinstance(prefix, str) and prefix and isinstance(prompt, str) and len(prompt) > len(prefix):
+            return prefix, prompt[len(prefix):]
+        return None, prompt
+
+    @staticmethod
+    def _prefix_turns(prefix: str) -> List[Dict[str, Any]]:
+        """
+        Cached contents for a prompt prefix.
+
+        The prefix is the start of the user's message, not an instruction, so it is
+        cached as a user turn and the remainder follows it as the live content.
+        """
+        return [{"role": "user", "parts": [prefix]}]
+
+    @staticmethod
+    def _build_generation_config(config: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "temperature": config.get("temperature", 0.7),
+            "top_p": config.get("top_p", 0.95),
+            "max_output_tokens": config.get("max_tokens", 8192),
+        }
+
+    def _get_model(
+        self,
+        model_name: str,
+        generation_config: Dict[str, Any],
+        system_instruction: Optional[str] = None,
+    ) -> Any:
+        """
+        Return a cached ``GenerativeModel`` for the given settings, creating it on a miss.
+
+        Args:
+            model_name: The Gemini model identifier.
+            generation_config: Generation parameters passed to the model.
+            system_instruction: Optional system instruction baked into the model.
+
+        Returns:
+            A ``GenerativeModel`` instance.
+        """
+        instruction_hash = (
+            hashlib.sha256(system_instruction.encode("utf-8")).hexdigest() if system_instruction else None
+        )
+        key = (model_name, tuple(sorted(generation_config.items())), instruction_hash)
+
+        with self._model_cache_lock:
+            model = self._model_cache.get(key)
+            if model is not None:
+                self._model_cache.move_to_end(key)
+                self._model_cache_hits += 1
+                logger.debug(
+                    "Gemini model cache hit for '%s' (hits=%d, misses=%d)",
+                    model_name,
+                    self._model_cache_hits,
+                    self._model_cache_misses,
+                )
+                return model
+            self._model_cache_misses += 1
+
+        model_kwargs: Dict[str, Any] = {"model_name": model_name, "generation_config": generation_config}
+        if system_instruction:
+            model_kwargs["system_instruction"] = system_instruction
+        model = self.client.GenerativeModel(**model_kwargs)
+
+        with self._model_cache_lock:
+            self._model_cache[key] = model
+            self._model_cache.move_to_end(key)
+            while len(self._model_cache) > self._MODEL_CACHE_SIZE:
+                self._model_cache.popitem(last=False)
+        logger.debug(
+            "Gemini model cache miss for '%s' (hits=%d, misses=%d)",
+            model_name,
+            self._model_cache_hits,
+            self._model_cache_misses,
+        )
+        return model
+
     def get_available_models(self) -> List[str]:
         """
         Return list of available Gemini model names.
@@ -119,7 +419,7 @@ class GeminiProvider:
         Returns:
             List of model identifiers.
         """
-        if not self.client:
+        if not self.api_key:
             logger.warning("Cannot list models: Gemini client not initialized")
             return []
 
@@ -161,19 +461,17 @@ class GeminiProvider:
                 "Gemini client not initialized. Check API key configuration."
             )
 
+        cached = None
         try:
-            # Extract generation config
-            generation_config = {
-                "temperature": config.get("temperature", 0.7),
-                "top_p": config.get("top_p", 0.95),
-                "max_output_tokens": config.get("max_tokens", 8192),
-            }
-
-            # Create model instance
-            model = self.client.GenerativeModel(
-                model_name=model_name,
-                generation_config=generation_config
-            )
+            generation_config = self._build_generation_config(config)
+            prefix, remainder = self._prompt_prefix(prompt)
+            if prefix:
+                cached = self._get_cached_context(model_name, config, None, self._prefix_turns(prefix))
+            if cached is not None:
+                # The stable prefix lives server-side as the leading user turn.
+                model, prompt = self._cached_model(cached, generation_config), remainder
+            else:
+                model = self._get_model(model_name, generation_config)
 
             # Generate content with streaming
             response = model.generate_content(prompt, stream=True)
@@ -183,6 +481,8 @@ class GeminiProvider:
                     yield chunk.text
 
         except Exception as exc:
+            if cached is not None:
+                self._invalidate_cached_context(cached)
             logger.error("Gemini streaming failed for model '%s': %s", model_name, exc)
             raise
 
@@ -208,52 +508,152 @@ class GeminiProvider:
                 "Gemini client not initialized. Check API key configuration."
             )
 
+        cached = None
         try:
-            # Extract generation config
-            generation_config = {
-                "temperature": config.get("temperature", 0.7),
-                "top_p": config.get("top_p", 0.95),
-                "max_output_tokens": config.get("max_tokens", 8192),
-            }
+            generation_config = self._build_generation_config(config)
+
+            system_instruction, history, user_message = self._split_messages(messages)
+            cached_turns = self._cached_turn_count(config, history)
+            cached = self._get_cached_context(model_name, config, system_instruction, history[:cached_turns])
+            if cached is not None:
+                # The system instruction and leading turns are held server-side; send the rest.
+                chat = self._cached_model(cached, generation_config).start_chat(history=history[cached_turns:])
+            else:
+                model = self._get_model(model_name, generation_config, system_instruction)
+                # Start chat with history
+                chat = model.start_chat(history=history)
 
-            # Convert messages to Gemini format
-            system_instruction = None
-            history = []
-            user_message = ""
-
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
+            # Send user message and stream response
+            response = chat.send_message(user_message, stream=True)
 
-                if role == "system":
-                    system_instruction = content
-                elif role == "user":
-                    user_message = content
-                elif role == "assistant":
-                    # Add to history for multi-turn conversations
-                    history.append({"role": "model", "parts": [content]})
+            for chunk in response:
+                if hasattr(chunk, 'text'):
+                    yield chunk.text
 
-            # Create model with system instruction if present
-            model_kwargs = {"model_name": model_name, "generation_config": generation_config}
-            if system_instruction:
-                model_kwargs["system_instruction"] = system_instruction
+        except Exception as exc:
+            if cached is not None:
+                self._invalidate_cached_context(cached)
+            logger.error(
+                "Gemini structured streaming failed for model '%s': %s",
+                model_name,
+                exc
+            )
+            raise
 
-            model = self.client.GenerativeModel(**model_kwargs)
+    async def astream_chat(
+        self,
+        model_name: str,
+        prompt: Any,
+        config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``stream_chat`` using the SDK's non-blocking API.
 
-            # Start chat with history
-            chat = model.start_chat(history=history)
+        Args:
+            model_name: The Gemini model identifier.
+            prompt: The prompt to send (string or structured format).
+            config: Configuration dict with temperature, top_p, etc.
 
-            # Send user message and stream response
-            response = chat.send_message(user_message, stream=True)
+        Yields:
+            Response chunks as strings.
+        """
+        if not self.client:
+            raise RuntimeError(
+                "Gemini client not initialized. Check API key configuration."
+            )
 
-            for chunk in response:
+        cached = None
+        try:
+            generation_config = self._build_generation_config(config)
+            prefix, remainder = self._prompt_prefix(prompt)
+            if prefix and config.get("context_cache"):
+                # Creating the cache is a blocking API call; keep it off the loop.
+                cached = await asyncio.to_thread(
+                    self._get_cached_context, model_name, config, None, self._prefix_turns(prefix)
+                )
+            if cached is not None:
+                model, prompt = self._cached_model(cached, generation_config), remainder
+            else:
+                model = self._get_model(model_name, generation_config)
+            response = await model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
                 if hasattr(chunk, 'text'):
                     yield chunk.text
+        except Exception as exc:
+            if cached is not None:
+                self._invalidate_cached_context(cached)
+            logger.error("Gemini async streaming failed for model '%s': %s", model_name, exc)
+            raise
+
+    async def astream_chat_structured(
+        self,
+        model_name: str,
+        messages: List[Dict[str, Any]],
+        config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``stream_chat_structured``.
+
+        Args:
+            model_name: The Gemini model identifier.
+            messages: List of message dicts with 'role' and 'content'.
+            config: Configuration dict with temperature, top_p, etc.
 
+        Yields:
+            Response chunks as strings.
+        """
+        if not self.client:
+            raise RuntimeError(
+                "Gemini client not initialized. Check API key configuration."
+            )
+
+        cached = None
+        try:
+            generation_config = self._build_generation_config(config)
+            system_instruction, history, user_message = self._split_messages(messages)
+            cached_turns = self._cached_turn_count(config, history)
+            if config.get("context_cache"):
+                cached = await asyncio.to_thread(
+                    self._get_cached_context, model_name, config, system_instruction, history[:cached_turns]
+                )
+            if cached is not None:
+                chat = self._cached_model(cached, generation_config).start_chat(history=history[cached_turns:])
+            else:
+                model = self._get_model(model_name, generation_config, system_instruction)
+                chat = model.start_chat(history=history)
+            response = await chat.send_message_async(user_message, stream=True)
+            async for chunk in response:
+                if hasattr(chunk, 'text'):
+                    yield chunk.text
         except Exception as exc:
+            if cached is not None:
+                self._invalidate_cached_context(cached)
             logger.error(
-                "Gemini structured streaming failed for model '%s': %s",
+                "Gemini async structured streaming failed for model '%s': %s",
                 model_name,
                 exc
             )
             raise
+
+    @staticmethod
+    def _split_messages(
+        messages: List[Dict[str, Any]],
+    ) -> Tuple[Optional[str], List[Dict[str, Any]], str]:
+        """Convert role/content messages into (system instruction, Gemini history, user message)."""
+        system_instruction = None
+        history: List[Dict[str, Any]] = []
+        user_message = ""
+
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+
+            if role == "system":
+                system_instruction = content
+            elif role == "user":
+                user_message = content
+            elif role == "assistant":
+                # Add to history for multi-turn conversations
+                history.append({"role": "model", "parts": [content]})
+
+        return system_instruction, history, user_message
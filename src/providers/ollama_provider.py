@@ -1,7 +1,9 @@
 """Ollama LLM Provider for Aura."""
+import asyncio
 import logging
 import os
-from typing import Any, Dict, Generator, List, Optional
+import threading
+from typing import Any, AsyncIterator, Dict, Generator, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -12,16 +14,81 @@ class OllamaProvider:
 
     Ollama runs locally, so typically no API key is needed.
     Checks OLLAMA_HOST environment variable for custom server location.
+
+    The provider owns one ``ollama.Client`` whose HTTP connection pool stays open
+    between calls (plus one ``ollama.AsyncClient`` for the current event loop),
+    caps concurrent requests on both paths, and sends ``keep_alive`` so the model
+    stays loaded in the server between planning calls.
+
+    Prompts are always sent whole through the model's template. While the model
+    stays loaded, the server reuses its KV cache for the longest token prefix
+    shared with the previous request, so a stable leading part (see
+    ``PrefixedPrompt``) is only evaluated once without changing the prompt.
     """
 
-    def __init__(self) -> None:
-        """Initialize Ollama provider."""
-        self.provider_name = "Ollama"
-        self.host = self._get_ollama_host()
+    _DEFAULT_CONNECT_TIMEOUT = 5.0
+    _DEFAULT_READ_TIMEOUT = 300.0
+    _DEFAULT_MAX_CONCURRENCY = 2
+    _DEFAULT_KEEP_ALIVE = "30m"
+    _POOL_KEEPALIVE_EXPIRY = 60.0
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        keep_alive: Optional[Union[str, float]] = None,
+    ) -> None:
+        """
+        Initialize Ollama provider.
 
-        logger.info("OllamaProvider initialized with host: %s", self.host)
+        Each setting falls back to an environment variable, then to the class default.
+
+        Args:
+            host: Server URL (``OLLAMA_HOST``).
+            connect_timeout: Seconds to establish a connection (``AURA_OLLAMA_CONNECT_TIMEOUT``).
+            read_timeout: Seconds to wait between streamed chunks (``AURA_OLLAMA_READ_TIMEOUT``).
+            max_concurrency: Maximum simultaneous requests (``AURA_OLLAMA_MAX_CONCURRENCY``).
+            keep_alive: How long the server keeps the model loaded after a request,
+                e.g. "30m" or seconds (``OLLAMA_KEEP_ALIVE``).
+        """
+        self.provider_name = "Ollama"
+        self.host = host or self._get_ollama_host()
+        self.connect_timeout = self._env_float("AURA_OLLAMA_CONNECT_TIMEOUT", connect_timeout, self._DEFAULT_CONNECT_TIMEOUT)
+        self.read_timeout = self._env_float("AURA_OLLAMA_READ_TIMEOUT", read_timeout, self._DEFAULT_READ_TIMEOUT)
+        self.max_concurrency = max(
+            int(self._env_float("AURA_OLLAMA_MAX_CONCURRENCY", max_concurrency, self._DEFAULT_MAX_CONCURRENCY)),
+            1,
+        )
+        self.keep_alive = keep_alive if keep_alive is not None else (
+            os.getenv("OLLAMA_KEEP_ALIVE") or self._DEFAULT_KEEP_ALIVE
+        )
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._async_client: Any = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_slots: Optional[asyncio.Semaphore] = None
+
+        logger.info(
+            "OllamaProvider initialized with host: %s (max_concurrency=%d, keep_alive=%s)",
+            self.host,
+            self.max_concurrency,
+            self.keep_alive,
+        )
         self._init_client()
 
+    @staticmethod
+    def _env_float(env_name: str, value: Optional[float], default: float) -> float:
+        if value is not None:
+            return float(value)
+        raw = os.getenv(env_name)
+        if raw:
+            try:
+                return float(raw)
+            except ValueError:
+                logger.warning("Ignoring invalid %s=%r; using %s", env_name, raw, default)
+        return default
+
     def _get_ollama_host(self) -> str:
         """
         Get Ollama server host from environment or use default.
@@ -36,12 +103,31 @@ class OllamaProvider:
             logger.debug("Using default Ollama host: %s", host)
         return host
 
+    def _http_options(self) -> Dict[str, Any]:
+        """httpx settings shared by the sync and async clients."""
+        import httpx
+
+        return {
+            "timeout": httpx.Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.connect_timeout,
+                pool=self.read_timeout,
+            ),
+            "limits": httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+                keepalive_expiry=self._POOL_KEEPALIVE_EXPIRY,
+            ),
+        }
+
     def _init_client(self) -> None:
-        """Initialize the Ollama client."""
+        """Initialize the pooled Ollama client."""
         try:
             # Import ollama library
             import ollama
-            self.client = ollama
+            self.client = ollama.Client(host=self.host, **self._http_options())
+            self._async_client_class = ollama.AsyncClient
             logger.debug("Ollama client initialized successfully")
         except ImportError as exc:
             logger.error(
@@ -56,6 +142,59 @@ class OllamaProvider:
             logger.error("Failed to initialize Ollama client: %s", exc)
             raise
 
+    async def _get_async_client(self) -> Tuple[Any, asyncio.Semaphore]:
+        """
+        Return the pooled async client and its request slots for the running event loop.
+
+        httpx async pools and asyncio semaphores are bound to the loop that first
+        used them, so both are rebuilt if a different loop calls in and the
+        previous client's connections are closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            stale_client, stale_loop = self._async_client, self._async_client_loop
+            self._async_client = self._async_client_class(host=self.host, **self._http_options())
+            self._async_client_loop = loop
+            self._async_slots = asyncio.Semaphore(self.max_concurrency)
+            if stale_client is not None:
+                await self._aclose_async_client(stale_client, stale_loop)
+        return self._async_client, self._async_slots
+
+    @staticmethod
+    async def _aclose_async_client(client: Any, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a retired async client's connections on the loop that owns them."""
+        http_client = getattr(client, "_client", None)
+        if http_client is None or loop is None:
+            return
+        try:
+            if loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(http_client.aclose(), loop))
+            elif not loop.is_closed():
+                await asyncio.to_thread(loop.run_until_complete, http_client.aclose())
+            # A closed loop already tore down its transports; the sockets go with the client.
+        except Exception as exc:  # noqa: BLE001 - best effort; the old pool is discarded either way
+            logger.debug("Failed to close previous Ollama async client: %s", exc)
+
+    async def _aacquire_slot(self, slots: asyncio.Semaphore) -> None:
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.read_timeout)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(
+                f"Timed out waiting for one of {self.max_concurrency} Ollama request slots"
+            ) from exc
+
+    def _acquire_slot(self) -> None:
+        if not self._request_slots.acquire(timeout=self.read_timeout):
+            raise TimeoutError(
+                f"Timed out waiting for one of {self.max_concurrency} Ollama request slots"
+            )
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        client = getattr(self.client, "_client", None)
+        if client is not None:
+            client.close()
+
     def get_available_models(self) -> List[str]:
         """
         Return list of available Ollama models.
@@ -72,7 +211,11 @@ class OllamaProvider:
         try:
             # Query Ollama for available models
             response = self.client.list()
-            models = [model['name'] for model in response.get('models', [])]
+            models = [
+                model.get('model') or model.get('name')
+                for model in response.get('models', [])
+                if model.get('model') or model.get('name')
+            ]
 
             if models:
                 logger.info("Found %d Ollama models: %s", len(models), models)
@@ -137,16 +280,22 @@ class OllamaProvider:
             prompt_text = str(prompt) if not isinstance(prompt, str) else prompt
 
             # Stream from Ollama
-            response = self.client.generate(
-                model=model_name,
-                prompt=prompt_text,
-                stream=True,
-                options=options
-            )
+            self._acquire_slot()
+            try:
+                response = self.client.generate(
+                    model=model_name,
+                    prompt=prompt_text,
+                    stream=True,
+                    options=options,
+                    keep_alive=self.keep_alive,
+                )
 
-            for chunk in response:
-                if isinstance(chunk, dict) and 'response' in chunk:
-                    yield chunk['response']
+                for chunk in response:
+                    text = chunk['response'] if 'response' in chunk else None
+                    if text:
+                        yield text
+            finally:
+                self._request_slots.release()
 
         except Exception as exc:
             logger.error("Ollama streaming failed for model '%s': %s", model_name, exc)
@@ -182,20 +331,24 @@ class OllamaProvider:
             }
 
             # Use Ollama's chat API for structured messages
-            response = self.client.chat(
-                model=model_name,
-                messages=messages,
-                stream=True,
-                options=options
-            )
+            self._acquire_slot()
+            try:
+                response = self.client.chat(
+                    model=model_name,
+                    messages=messages,
+                    stream=True,
+                    options=options,
+                    keep_alive=self.keep_alive,
+                )
 
-            for chunk in response:
-                if isinstance(chunk, dict):
+                for chunk in response:
                     # Extract message content
-                    message = chunk.get('message', {})
-                    content = message.get('content', '')
+                    message = chunk['message'] if 'message' in chunk else None
+                    content = message['content'] if message and 'content' in message else ''
                     if content:
                         yield content
+            finally:
+                self._request_slots.release()
 
         except Exception as exc:
             logger.error(
@@ -204,3 +357,107 @@ class OllamaProvider:
                 exc
             )
             raise
+
+    async def astream_chat(
+        self,
+        model_name: str,
+        prompt: Any,
+        config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``stream_chat`` using ``ollama.AsyncClient``.
+
+        Args:
+            model_name: The Ollama model identifier.
+            prompt: The prompt to send (string or structured format).
+            config: Configuration dict with temperature, top_p, etc.
+
+        Yields:
+            Response chunks as strings.
+        """
+        if not self.client:
+            raise RuntimeError(
+                "Ollama client not initialized. Check installation."
+            )
+
+        try:
+            options = {
+                "temperature": config.get("temperature", 0.7),
+                "top_p": config.get("top_p", 0.95),
+            }
+            prompt_text = str(prompt) if not isinstance(prompt, str) else prompt
+
+            client, slots = await self._get_async_client()
+            await self._aacquire_slot(slots)
+            try:
+                response = await client.generate(
+                    model=model_name,
+                    prompt=prompt_text,
+                    stream=True,
+                    options=options,
+                    keep_alive=self.keep_alive,
+                )
+                async for chunk in response:
+                    text = chunk['response'] if 'response' in chunk else None
+                    if text:
+                        yield text
+            finally:
+                slots.release()
+
+        except Exception as exc:
+            logger.error("Ollama async streaming failed for model '%s': %s", model_name, exc)
+            raise
+
+    async def astream_chat_structured(
+        self,
+        model_name: str,
+        messages: List[Dict[str, Any]],
+        config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Async counterpart of ``stream_chat_structured``.
+
+        Args:
+            model_name: The Ollama model identifier.
+            messages: List of message dicts with 'role' and 'content'.
+            config: Configuration dict with temperature, top_p, etc.
+
+        Yields:
+            Response chunks as strings.
+        """
+        if not self.client:
+            raise RuntimeError(
+                "Ollama client not initialized. Check installation."
+            )
+
+        try:
+            options = {
+                "temperature": config.get("temperature", 0.7),
+                "top_p": config.get("top_p", 0.95),
+            }
+
+            client, slots = await self._get_async_client()
+            await self._aacquire_slot(slots)
+            try:
+                response = await client.chat(
+                    model=model_name,
+                    messages=messages,
+                    stream=True,
+                    options=options,
+                    keep_alive=self.keep_alive,
+                )
+                async for chunk in response:
+                    message = chunk['message'] if 'message' in chunk else None
+                    content = message['content'] if message and 'content' in message else ''
+                    if content:
+                        yield content
+            finally:
+                slots.release()
+
+        except Exception as exc:
+            logger.error(
+                "Ollama async structured streaming failed for model '%s': %s",
+                model_name,
+                exc
+            )
+            raise
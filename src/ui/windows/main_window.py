@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from PySide6.QtCore import Qt, QThreadPool, Signal, QTimer
 from PySide6.QtGui import QFont, QIcon
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import QApplication, QLabel, QMainWindow, QSplitter, QVBo
 from src.aura.app.event_bus import EventBus
 from src.aura.config import ASSETS_DIR
 from src.aura.models.event_types import (
+    DEBUG_EVENT_BUS_STATS,
     TERMINAL_EXECUTE_COMMAND,
     TERMINAL_OUTPUT_RECEIVED,
     TERMINAL_SESSION_COMPLETED,
@@ -68,6 +69,7 @@ class MainWindow(QMainWindow):
     ) -> None:
         super().__init__()
         self.event_bus = event_bus
+        self.llm_service = llm_service
         self.settings_window: Optional[SettingsWindow] = None
         self.workspace_service = workspace_service
         self.supervisor = AgentSupervisor(
@@ -191,7 +193,7 @@ class MainWindow(QMainWindow):
     def _subscribe_supervisor_events(self) -> None:
         """Subscribe to supervisor-emitted events for agent output and lifecycle."""
         self.event_bus.subscribe(TERMINAL_SESSION_STARTED, self._handle_terminal_session_started)
-        self.event_bus.subscribe(TERMINAL_OUTPUT_RECEIVED, self._handle_terminal_output_received)
+        self.event_bus.subscribe_batch(TERMINAL_OUTPUT_RECEIVED, self._handle_terminal_output_batch)
         self.event_bus.subscribe(TERMINAL_SESSION_COMPLETED, self._handle_session_completed)
         self.event_bus.subscribe(TERMINAL_SESSION_FAILED, self._handle_session_failed)
         self.event_bus.subscribe(TERMINAL_EXECUTE_COMMAND, self._handle_terminal_command)
@@ -219,23 +221,30 @@ class MainWindow(QMainWindow):
         self._active_terminal_messages[str(task_id)] = message
         self.chat_display.create_terminal_message(message)
 
-    def _handle_terminal_output_received(self, event: Event) -> None:
-        """Stream terminal output to chat message box."""
-        payload = event.payload or {}
-        task_id = str(payload.get("task_id", ""))
-        text = payload.get("text", "")
-
-        if not task_id or task_id not in self._active_terminal_messages:
-            return
-
-        message = self._active_terminal_messages[task_id]
-        message.output += text + "\n"
+    def _handle_terminal_output_batch(self, events: List[Event]) -> None:
+        """
+        Stream a frame of terminal output to the chat message boxes, one update per task.
+
+        Text is appended exactly as read from the PTY, which carries its own line
+        endings, so the result does not depend on how output was split into frames.
+        """
+        pending: Dict[str, str] = {}
+        for event in events:
+            payload = event.payload or {}
+            task_id = str(payload.get("task_id", ""))
+            if not task_id or task_id not in self._active_terminal_messages:
+                continue
+            pending[task_id] = pending.get(task_id, "") + payload.get("text", "")
+
+        for task_id, new_output in pending.items():
+            message = self._active_terminal_messages[task_id]
+            message.output += new_output
 
-        self.chat_display.update_terminal_message(
-            message_id=message.message_id,
-            new_output=text + "\n",
-            status="running",
-        )
+            self.chat_display.update_terminal_message(
+                message_id=message.message_id,
+                new_output=new_output,
+                status="running",
+            )
 
     def _handle_terminal_command(self, event: Event) -> None:
         payload = event.payload or {}
@@ -246,7 +255,8 @@ class MainWindow(QMainWindow):
             self.terminal_widget.clear_captured_output()
         except Exception:
             pass
-        self.terminal_widget.send_command(command)
+        if not payload.get("dedicated_pty"):
+            self.terminal_widget.send_command(command)
         self.terminal_widget.focus_terminal()
 
     def _handle_session_completed(self, event: Event) -> None:
@@ -368,6 +378,8 @@ class MainWindow(QMainWindow):
             self.restore_input_signal.emit()
 
     def closeEvent(self, event) -> None:  # noqa: D401 - QWidget signature
+        # Stop streaming tokens and retry backoffs for requests nobody will read.
+        self.llm_service.cancel_all("main window closed")
         QApplication.quit()
         super().closeEvent(event)
 
@@ -384,6 +396,8 @@ class MainWindow(QMainWindow):
                 self.terminal_widget.setMaximumHeight(0)
                 self.panel_splitter.setStretchFactor(0, 1)
                 self.panel_splitter.setStretchFactor(1, 0)
+        elif event.key() == Qt.Key_D and event.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier):
+            self.event_bus.dispatch(Event(event_type=DEBUG_EVENT_BUS_STATS))
         super().keyPressEvent(event)
 
     def _on_sidebar_collapsed_changed(self, collapsed: bool) -> None:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from PySide6.QtCore import QUrl, QUrlQuery
 from PySide6.QtGui import QDesktopServices
 
 from src.aura.app.event_bus import EventBus
+from src.aura.models.event_types import DEBUG_EVENT_BUS_STATS
 from src.aura.models.events import Event
 from src.aura.services.conversation_management_service import ConversationManagementService
 from src.ui.widgets.chat_display_widget import ChatDisplayWidget
@@ -95,6 +96,8 @@ class MainWindowEventController:
         self.event_bus.subscribe("TASK_COMPLETED", self._handle_task_completed)
         self.event_bus.subscribe("FILE_GENERATED", self._handle_file_generated)
 
+        self.event_bus.subscribe(DEBUG_EVENT_BUS_STATS, self._handle_event_bus_stats)
+
     def handle_anchor_clicked(self, url: QUrl) -> None:
         """
         Process anchor clicks from the chat display for diff actions.
@@ -126,6 +129,12 @@ class MainWindowEventController:
 
     def _handle_task_plan_generated(self, event: Event) -> None:
         payload = event.payload or {}
+        if payload.get("partial"):
+            if payload.get("section") == "task_spec" and payload.get("section_state") == "complete":
+                self.thinking_indicator.set_thinking_message("Task spec ready, launching agent...")
+            else:
+                self.thinking_indicator.set_thinking_message("Streaming plan...")
+            return
         task_description = payload.get("task_description")
         if task_description:
             self.thinking_indicator.stop_thinking()
@@ -359,6 +368,40 @@ class MainWindowEventController:
         )
         self.chat_display.display_system_message("WARNING", message)
 
+    def _handle_event_bus_stats(self, event: Event) -> None:
+        top = int((event.payload or {}).get("top") or 8)
+        self.chat_display.display_system_message("KERNEL", self._format_event_bus_stats(self.event_bus.stats(), top))
+
+    @staticmethod
+    def _format_event_bus_stats(stats: Dict[str, Any], top: int) -> str:
+        lines = ["EventBus stats"]
+        for lane, lane_stats in stats.get("lanes", {}).items():
+            lines.append(
+                f"  lane {lane}: depth={lane_stats['depth']} delivered={lane_stats['delivered']} "
+                f"avg={lane_stats['avg_latency_ms']}ms max={lane_stats['max_latency_ms']}ms"
+            )
+
+        event_types = [
+            (name, data) for name, data in stats.get("event_types", {}).items() if data.get("queue_delay")
+        ]
+        event_types.sort(key=lambda item: item[1]["queue_delay"]["p95_ms"], reverse=True)
+        lines.append(f"Queue delay by event type (top {top} by p95):")
+        for name, data in event_types[:top]:
+            delay = data["queue_delay"]
+            lines.append(
+                f"  {name}: n={data['dispatched']} p50={delay['p50_ms']}ms "
+                f"p95={delay['p95_ms']}ms max={delay['max_ms']}ms"
+            )
+
+        callbacks = sorted(stats.get("callbacks", {}).items(), key=lambda item: item[1]["max_ms"], reverse=True)
+        lines.append(f"Slowest callbacks (top {top} by max):")
+        for name, timing in callbacks[:top]:
+            lines.append(
+                f"  {name}: n={timing['count']} mean={timing['mean_ms']}ms "
+                f"p95={timing['p95_ms']}ms max={timing['max_ms']}ms"
+            )
+        return "\n".join(lines)
+
     @staticmethod
     def _format_token_count(tokens: int) -> str:
         absolute = abs(tokens)
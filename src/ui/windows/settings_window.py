@@ -1,5 +1,5 @@
 import logging
-from typing import Dict
+from typing import Any, Dict
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -15,6 +15,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from src.aura.app.event_bus import EventBus
+from src.aura.models.event_types import LLM_REQUEST_METRICS, REQUEST_LLM_METRICS
 from src.aura.models.events import Event
 from src.aura.services.user_settings_manager import (
     AURA_BRAIN_MODEL_CHOICES,
@@ -115,6 +116,8 @@ class SettingsWindow(QWidget):
         self.gemini_model_combo: QComboBox
         self.api_key_inputs: Dict[str, QLineEdit] = {}
         self.auto_accept_checkbox: QCheckBox
+        self.metrics_label: QLabel
+        self._metrics_subscribed = False
 
         self._init_ui()
         self._load_settings()
@@ -196,6 +199,12 @@ class SettingsWindow(QWidget):
         self.auto_accept_checkbox = QCheckBox("Auto-accept code changes")
         panel_layout.addWidget(self.auto_accept_checkbox)
 
+        panel_layout.addWidget(self._create_section_label("------ LLM Latency ------", ascii_font))
+        self.metrics_label = QLabel("No LLM requests recorded yet.")
+        self.metrics_label.setObjectName("hint_label")
+        self.metrics_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        panel_layout.addWidget(self.metrics_label)
+
         footer_layout = QHBoxLayout()
         footer_layout.addStretch(1)
         save_button = QPushButton("Save & Close")
@@ -310,9 +319,44 @@ class SettingsWindow(QWidget):
 
         self.close()
 
+    def _handle_llm_metrics(self, event: Event) -> None:
+        metrics = (event.payload or {}).get("metrics")
+        if isinstance(metrics, dict):
+            self.metrics_label.setText(self._format_llm_metrics(metrics))
+
+    @staticmethod
+    def _format_llm_metrics(metrics: Dict[str, Dict[str, Any]]) -> str:
+        if not metrics:
+            return "No LLM requests recorded yet."
+
+        def _ms(value: Any) -> str:
+            return f"{value:.0f}ms" if isinstance(value, (int, float)) else "-"
+
+        lines = []
+        for key, entry in metrics.items():
+            rate = entry.get("chunks_per_second_p50")
+            lines.append(
+                f"{key}  n={entry.get('requests', 0)} err={entry.get('errors', 0)}  "
+                f"ttft p50/p95 {_ms(entry.get('ttft_p50_ms'))}/{_ms(entry.get('ttft_p95_ms'))}  "
+                f"total p50 {_ms(entry.get('duration_p50_ms'))}  "
+                f"{f'{rate:.1f}' if isinstance(rate, (int, float)) else '-'} chunks/s"
+            )
+        return "\n".join(lines)
+
     def showEvent(self, event):
         super().showEvent(event)
+        # Metrics only matter while the window is visible; hideEvent drops the subscription again.
+        if not self._metrics_subscribed:
+            self.event_bus.subscribe(LLM_REQUEST_METRICS, self._handle_llm_metrics)
+            self._metrics_subscribed = True
         try:
             self.event_bus.dispatch(Event(event_type="REQUEST_AVAILABLE_MODELS"))
+            self.event_bus.dispatch(Event(event_type=REQUEST_LLM_METRICS))
         except Exception as exc:
-            logger.debug("Unable to request available models: %s", exc)
+            logger.debug("Unable to request settings data: %s", exc)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self._metrics_subscribed:
+            self.event_bus.unsubscribe(LLM_REQUEST_METRICS, self._handle_llm_metrics)
+            self._metrics_subscribed = False
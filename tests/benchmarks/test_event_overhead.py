@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import timeit
+
+import pytest
+
+from src.aura.models.event_types import TERMINAL_OUTPUT_RECEIVED
+from src.aura.models.events import Event, EventModel
+
+pytestmark = pytest.mark.benchmark
+
+_PAYLOAD = {
+    "task_id": "task-123",
+    "text": "x" * 256,
+    "stream_type": "stdout",
+    "timestamp": "2024-01-01T00:00:00",
+}
+
+
+def _per_event_us(factory, number: int = 20_000) -> float:
+    best = min(timeit.repeat(factory, number=number, repeat=5))
+    return best / number * 1_000_000
+
+
+def test_slots_event_construction_is_cheaper_than_pydantic_model() -> None:
+    pydantic_us = _per_event_us(lambda: EventModel(event_type=TERMINAL_OUTPUT_RECEIVED, payload=dict(_PAYLOAD)))
+    slots_us = _per_event_us(lambda: Event(event_type=TERMINAL_OUTPUT_RECEIVED, payload=dict(_PAYLOAD)))
+
+    print(
+        f"\nper-event construction: pydantic={pydantic_us:.3f}us slots={slots_us:.3f}us "
+        f"({pydantic_us / slots_us:.1f}x)"
+    )
+    assert slots_us < pydantic_us
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+_ROOT = Path(__file__).resolve().parents[2]
+
+# SDKs that must only be imported once a provider (or feature) actually uses them.
+_HEAVY_MODULES = (
+    "google.generativeai",
+    "google.api_core",
+    "requests",
+    "ollama",
+    "langchain",
+    "langgraph",
+    "tavily",
+)
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Return cumulative import time in microseconds per module from ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["src.providers", "src.aura.services.llm_service"])
+def test_module_import_does_not_load_provider_sdks(module: str) -> None:
+    times = _import_times(module)
+
+    print(f"\n{module}: {times[module] / 1000:.1f}ms cumulative import time")
+    loaded = sorted(
+        name for name in times if any(name == heavy or name.startswith(heavy + ".") for heavy in _HEAVY_MODULES)
+    )
+    assert loaded == []
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.aura.services.terminal_bridge import TerminalBridge
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(sys.platform.startswith("win"), reason="PTY reader is POSIX-only"),
+]
+
+_LINE = "x" * 99 + "\n"
+_LINES = 80_000  # ~8 MB
+
+
+def _allocate_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _executor_threads() -> int:
+    return sum(1 for thread in threading.enumerate() if thread.name.startswith("asyncio_"))
+
+
+def test_cat_large_file_through_bridge(tmp_path: Path) -> None:
+    source = tmp_path / "big.txt"
+    source.write_text(_LINE * _LINES, encoding="utf-8")
+    log_path = tmp_path / "task.log"
+
+    bridge = TerminalBridge(host="127.0.0.1", port=_allocate_port())
+    bridge.start()
+    try:
+        assert bridge.wait_ready(timeout=5)
+        threads_before = _executor_threads()
+        start = time.perf_counter()
+        handle = bridge.start_session("bench", log_path, command=f"cat {source}")
+        assert handle is not None and handle.wait(timeout=60) == 0
+        elapsed = time.perf_counter() - start
+        stats = bridge._sessions["bench"].pty_reader.stats()
+        threads_after = _executor_threads()
+    finally:
+        bridge.stop()
+
+    # The PTY line discipline turns each "\n" into "\r\n".
+    assert log_path.read_text(encoding="utf-8").count("x") == 99 * _LINES
+    megabytes = stats["bytes"] / 1_000_000
+    print(
+        f"\ncat {megabytes:.1f}MB through PTY: {megabytes / elapsed:.1f}MB/s, "
+        f"{stats['reads']} reads in {stats['wakeups']} loop wakeups "
+        f"({stats['bytes'] / stats['reads']:.0f}B/read, final read size {stats['read_size']})"
+    )
+    # Reads run on the loop thread; no executor thread is spun up per chunk.
+    assert threads_after == threads_before
+    # At most one extra wakeup: the hang-up that reports EOF.
+    assert stats["wakeups"] <= stats["reads"] + 1
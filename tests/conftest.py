@@ -21,7 +21,7 @@ class RecordingEventBus:
         self._subscribers: Dict[str, List[Callable[[Event], None]]] = {}
         self.dispatched: List[Event] = []
 
-    def subscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
+    def subscribe(self, event_type: str, callback: Callable[[Event], None], lane: str = "main") -> None:
         self._subscribers.setdefault(event_type, []).append(callback)
 
     def dispatch(self, event: Event) -> None:
@@ -5,11 +5,13 @@ import json
 import socket
 import sys
 import time
+from pathlib import Path
 from typing import Callable
 
+import pytest
 import websockets
 
-from src.aura.services.terminal_bridge import TerminalBridge
+from src.aura.services.terminal_bridge import BINARY_SUBPROTOCOL, OP_INPUT, OP_RESIZE, TerminalBridge
 
 
 def _allocate_port() -> int:
@@ -59,3 +61,57 @@ async def _exercise_terminal_bridge() -> None:
 
 def test_terminal_bridge_executes_command() -> None:
     asyncio.run(_exercise_terminal_bridge())
+
+
+async def _exercise_binary_framing() -> None:
+    host = "127.0.0.1"
+    port = _allocate_port()
+    bridge = TerminalBridge(host=host, port=port)
+    bridge.start()
+    try:
+        await _wait_for(lambda: bridge._server is not None, timeout=5)
+        async with websockets.connect(f"ws://{host}:{port}", subprotocols=[BINARY_SUBPROTOCOL]) as websocket:
+            assert websocket.subprotocol == BINARY_SUBPROTOCOL
+            await asyncio.sleep(0.2)
+            await websocket.send(bytes([OP_RESIZE]) + (100).to_bytes(2, "big") + (40).to_bytes(2, "big"))
+            await websocket.send(bytes([OP_INPUT]) + b"stty size; printf 'caf\\303\\251-%s\\n' done\n")
+            output = b""
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and "café-done".encode("utf-8") not in output:
+                chunk = await asyncio.wait_for(websocket.recv(), timeout=2)
+                assert isinstance(chunk, bytes)
+                output += chunk
+            assert b"40 100" in output
+            assert "café-done".encode("utf-8") in output
+    finally:
+        bridge.stop()
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="PTY resize is POSIX-only")
+def test_binary_frames_carry_raw_bytes_and_opcodes() -> None:
+    asyncio.run(_exercise_binary_framing())
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="dedicated PTYs are POSIX-only")
+def test_concurrent_tasks_get_separate_ptys_and_logs(tmp_path: Path) -> None:
+    bridge = TerminalBridge(host="127.0.0.1", port=_allocate_port())
+    bridge.start()
+    try:
+        first = bridge.start_session("task-a", tmp_path / "a.log", command="echo from-a; exit 3")
+        second = bridge.start_session("task-b", tmp_path / "b.log", command="echo from-b")
+
+        assert first is not None and second is not None
+        assert first.pid != second.pid
+        assert sorted(bridge.active_sessions()) == ["task-a", "task-b"]
+        assert first.wait(timeout=10) == 3
+        assert second.wait(timeout=10) == 0
+
+        log_a = (tmp_path / "a.log").read_text(encoding="utf-8")
+        log_b = (tmp_path / "b.log").read_text(encoding="utf-8")
+        assert "from-a" in log_a and "from-b" not in log_a
+        assert "from-b" in log_b and "from-a" not in log_b
+
+        bridge.end_session("task-a")
+        assert bridge.active_sessions() == ["task-b"]
+    finally:
+        bridge.stop()
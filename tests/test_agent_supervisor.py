@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
@@ -87,9 +89,8 @@ def test_generate_task_plan_produces_plan_event(
     supervisor_factory: Callable[[], SupervisorHarness],
 ) -> None:
     harness = supervisor_factory()
-    harness.llm_service.run_for_agent.return_value = (
-        "<detailed_plan>Steps</detailed_plan>\n"
-        "<task_spec># Task: Build</task_spec>"
+    harness.llm_service.stream_chat_for_agent.return_value = iter(
+        ["<detailed_plan>Steps</detailed_plan>\n", "<task_spec># Task: Build</task_spec>"]
     )
 
     result = harness.supervisor._generate_task_plan("Ship it")
@@ -97,7 +98,7 @@ def test_generate_task_plan_produces_plan_event(
     assert isinstance(result, TaskPlanningResult)
     assert result.detailed_plan == "Steps"
     assert result.task_spec == "# Task: Build"
-    harness.llm_service.run_for_agent.assert_called_once()
+    harness.llm_service.stream_chat_for_agent.assert_called_once()
 
 
 @pytest.mark.parametrize(
@@ -272,47 +273,52 @@ def test_process_message_launches_terminal_session(
         spec_path="spec.md",
     )
     harness.terminal_service.spawn_agent.return_value = session
-    harness.supervisor._start_monitor_thread = MagicMock()
-    harness.llm_service.run_for_agent.return_value = (
-        "<detailed_plan>Detailed plan</detailed_plan>\n"
-        "<task_spec># Task: Build</task_spec>"
+    harness.supervisor._watch_session = MagicMock()
+    harness.llm_service.stream_chat_for_agent.return_value = iter(
+        ["<task_spec># Task: Build</task_spec>\n", "<detailed_plan>Detailed plan</detailed_plan>"]
     )
 
     harness.supervisor.process_message("Implement feature", "project-alpha")
 
     events = {event.event_type for event in harness.event_bus.dispatched}
     assert TERMINAL_SESSION_STARTED in events
-    assert harness.supervisor._start_monitor_thread.called
+    assert harness.supervisor._watch_session.called
     project_path = harness.workspace_root / "project-alpha"
     assert (project_path / "GEMINI.md").exists()
     assert session.task_id in harness.supervisor._sessions
 
 
-def test_monitor_output_loop_detects_done_file(
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_watch_session_detects_done_file(
     supervisor_factory: Callable[[], SupervisorHarness],
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     harness = supervisor_factory()
     session = StubSession("monitor-task")
     project_path = harness.workspace_root / "proj"
     aura_dir = project_path / ".aura"
     aura_dir.mkdir(parents=True, exist_ok=True)
-    done_path = aura_dir / "monitor-task.done"
-    done_path.write_text("done", encoding="utf-8")
     harness.supervisor._sessions[session.task_id] = session
     finalize = MagicMock()
     harness.supervisor._finalize_session = finalize
-    monkeypatch.setattr("src.aura.services.agent_supervisor.time.sleep", lambda *_: None)
 
-    harness.supervisor._monitor_output_loop(session, project_path)
+    harness.supervisor._watch_session(session, project_path)
+    (aura_dir / "monitor-task.done").write_text("done", encoding="utf-8")
 
-    finalize.assert_called_once()
+    assert _wait_for(lambda: finalize.called)
     assert finalize.call_args.kwargs["completion_reason"] == "done-file-detected"
+    harness.supervisor._watcher.stop()
 
 
-def test_monitor_output_loop_handles_monitor_error(
+def test_watch_session_reports_monitor_error(
     supervisor_factory: Callable[[], SupervisorHarness],
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     harness = supervisor_factory()
     session = StubSession("error-task")
@@ -320,15 +326,15 @@ def test_monitor_output_loop_handles_monitor_error(
     (project_path / ".aura").mkdir(parents=True, exist_ok=True)
     session.poll.side_effect = RuntimeError("poll failure")
     harness.supervisor._sessions[session.task_id] = session
-    monkeypatch.setattr("src.aura.services.agent_supervisor.time.sleep", lambda *_: None)
 
-    harness.supervisor._monitor_output_loop(session, project_path)
+    harness.supervisor._watch_session(session, project_path)
+
+    def _failures() -> list:
+        return [event for event in harness.event_bus.dispatched if event.event_type == TERMINAL_SESSION_FAILED]
 
-    failure_events = [
-        event for event in harness.event_bus.dispatched if event.event_type == TERMINAL_SESSION_FAILED
-    ]
-    assert failure_events
-    assert failure_events[0].payload["failure_reason"] == "monitor_error"
+    assert _wait_for(lambda: bool(_failures()))
+    assert _failures()[0].payload["failure_reason"] == "monitor_error"
+    harness.supervisor._watcher.stop()
 
 
 def test_finalize_session_waits_for_exit_code_when_running(
@@ -364,24 +370,16 @@ def test_finalize_session_waits_for_exit_code_when_running(
     session.wait.assert_called_once_with(timeout=5.0)
 
 
-def test_start_monitor_thread_invokes_thread_factory(
+def test_sessions_share_a_single_watcher_thread(
     supervisor_factory: Callable[[], SupervisorHarness],
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     harness = supervisor_factory()
-    session = TerminalSession(task_id="thread-task", command=["cmd"], spec_path="spec.md")
-    captured_kwargs: dict[str, object] = {}
-
-    class FakeThread:
-        def __init__(self, **kwargs: object) -> None:
-            captured_kwargs.update(kwargs)
-
-        def start(self) -> None:
-            captured_kwargs["started"] = True
-
-    monkeypatch.setattr("src.aura.services.agent_supervisor.threading.Thread", FakeThread)
 
-    harness.supervisor._start_monitor_thread(session, harness.workspace_root / "proj")
+    for index in range(3):
+        session = StubSession(f"shared-{index}")
+        harness.supervisor._watch_session(session, harness.workspace_root / f"proj-{index}")
 
-    assert captured_kwargs["daemon"] is True
-    assert captured_kwargs["started"] is True
+    assert _wait_for(lambda: harness.supervisor._watcher.stats()["sessions"] == 3)
+    watcher_threads = [thread for thread in threading.enumerate() if thread.name == "aura-session-watcher"]
+    assert len(watcher_threads) == 1
+    harness.supervisor._watcher.stop()
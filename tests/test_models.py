@@ -8,6 +8,7 @@ import pytest
 from pydantic import ValidationError
 
 from src.aura.models.agent_task import AgentSpecification, TaskSummary, TerminalSession
+from src.aura.models.events import Event, EventModel
 
 
 def test_agent_specification_serialization_includes_metadata(
@@ -169,3 +170,22 @@ def test_terminal_session_mark_exit_and_capture_without_child() -> None:
     session = TerminalSession(task_id="s11", command=["cmd"], spec_path="spec.md")
     session.mark_exit(2)
     assert session._capture_exit_code() == 2
+
+
+def test_event_defaults_to_fresh_empty_payload() -> None:
+    first = Event(event_type="PING")
+    second = Event("PING")
+    first.payload["n"] = 1
+
+    assert second.payload == {}
+    assert first == Event(event_type="PING", payload={"n": 1})
+    assert not hasattr(first, "__dict__")
+
+
+def test_event_parse_validates_at_the_boundary() -> None:
+    event = Event.parse({"event_type": "PING", "payload": {"n": 1}})
+
+    assert event.payload == {"n": 1}
+    assert isinstance(event.to_model(), EventModel)
+    with pytest.raises(ValidationError):
+        Event.parse({"payload": {}})
@@ -5,7 +5,8 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 from src.aura.models.agent_task import AgentSpecification
-from src.aura.services.agent_supervisor import AgentSupervisor
+from src.aura.models.exceptions import LLMCancelledError
+from src.aura.services.agent_supervisor import AgentSupervisor, PlanStreamParser
 from src.aura.services.agents_md_formatter import format_specification_for_gemini
 
 
@@ -19,21 +20,34 @@ def _build_supervisor() -> AgentSupervisor:
 
 def test_generate_task_plan_splits_dual_sections() -> None:
     supervisor = _build_supervisor()
-    supervisor.llm.run_for_agent.return_value = (
-        "<detailed_plan>Detailed steps here.</detailed_plan>\n"
-        "<task_spec># Task: Build tool</task_spec>"
+    supervisor.llm.stream_chat_for_agent.return_value = iter(
+        ["<detailed_plan>Detailed steps here.</detailed_plan>\n", "<task_spec># Task: Build tool</task_spec>"]
     )
 
     plan = supervisor._generate_task_plan("Build something great")
 
     assert plan.detailed_plan == "Detailed steps here."
     assert plan.task_spec == "# Task: Build tool"
-    supervisor.llm.run_for_agent.assert_called_once()
+    supervisor.llm.stream_chat_for_agent.assert_called_once()
+
+
+def test_plan_prompt_puts_the_stable_template_before_the_request() -> None:
+    supervisor = _build_supervisor()
+    supervisor.llm.stream_chat_for_agent.side_effect = lambda *args, **kwargs: iter(["<task_spec>spec</task_spec>"])
+
+    supervisor._generate_task_plan("first")
+    first = supervisor.llm.stream_chat_for_agent.call_args.args[1]
+    supervisor._generate_task_plan("second")
+    second = supervisor.llm.stream_chat_for_agent.call_args.args[1]
+
+    assert first.prefix == second.prefix
+    assert first.startswith(first.prefix) and first.suffix == "User request: first\n"
+    assert "first" not in first.prefix
 
 
 def test_generate_task_plan_falls_back_when_sections_missing() -> None:
     supervisor = _build_supervisor()
-    supervisor.llm.run_for_agent.return_value = "Plain response without markers"
+    supervisor.llm.stream_chat_for_agent.return_value = iter(["Plain response ", "without markers"])
 
     plan = supervisor._generate_task_plan("Document behaviour")
 
@@ -43,7 +57,7 @@ def test_generate_task_plan_falls_back_when_sections_missing() -> None:
 
 def test_generate_task_plan_handles_llm_failure() -> None:
     supervisor = _build_supervisor()
-    supervisor.llm.run_for_agent.side_effect = RuntimeError("provider unavailable")
+    supervisor.llm.stream_chat_for_agent.side_effect = RuntimeError("provider unavailable")
 
     plan = supervisor._generate_task_plan("Handle failures gracefully")
 
@@ -51,6 +65,118 @@ def test_generate_task_plan_handles_llm_failure() -> None:
     assert plan.task_spec == "Handle failures gracefully"
 
 
+def test_new_plan_cancels_the_previous_in_flight_plan() -> None:
+    supervisor = _build_supervisor()
+    supervisor.llm.stream_chat_for_agent.side_effect = lambda *args, **kwargs: iter(["<task_spec>spec</task_spec>"])
+
+    supervisor._generate_task_plan("first")
+    first_token = supervisor.llm.stream_chat_for_agent.call_args.kwargs["cancel_token"]
+    supervisor._generate_task_plan("second")
+
+    assert first_token.cancelled
+    assert not supervisor.llm.stream_chat_for_agent.call_args.kwargs["cancel_token"].cancelled
+
+
+def test_process_message_stops_when_planning_is_cancelled(tmp_path: Path) -> None:
+    supervisor = _build_supervisor()
+    supervisor.workspace.workspace_root = tmp_path
+    supervisor._ensure_project_directory = MagicMock(return_value=tmp_path)
+    supervisor.llm.stream_chat_for_agent.side_effect = LLMCancelledError("cancelled")
+
+    supervisor.process_message("Build it", "demo")
+
+    supervisor.terminal_service.spawn_agent.assert_not_called()
+
+
+def test_plan_stream_parser_handles_tags_split_across_chunks() -> None:
+    parser = PlanStreamParser()
+    chunks = ["Sure! <task", "_spec># Task: a < b", "</task_s", "pec>\n<detailed_plan>Steps", "</detailed_plan>"]
+
+    transitions = [transition for chunk in chunks for transition in parser.feed(chunk)]
+    parser.finish()
+
+    assert transitions == [
+        ("open", "task_spec"),
+        ("close", "task_spec"),
+        ("open", "detailed_plan"),
+        ("close", "detailed_plan"),
+    ]
+    assert parser.closed == {"task_spec": "# Task: a < b", "detailed_plan": "Steps"}
+    assert parser.text == "".join(chunks)
+
+
+def test_process_message_spawns_agent_before_detailed_plan_finishes(tmp_path: Path) -> None:
+    supervisor = _build_supervisor()
+    supervisor._ensure_project_directory = MagicMock(return_value=tmp_path)
+    supervisor._watch_session = MagicMock()
+    spawned_before_plan: list[bool] = []
+
+    def _stream(*args: object, **kwargs: object):
+        yield "<task_spec># Task: Build</task_spec>\n"
+        spawned_before_plan.append(supervisor.terminal_service.spawn_agent.called)
+        yield "<detailed_plan>Long plan</detailed_plan>"
+
+    supervisor.llm.stream_chat_for_agent.side_effect = _stream
+
+    supervisor.process_message("Build it", "demo")
+
+    assert spawned_before_plan == [True]
+    supervisor.terminal_service.spawn_agent.assert_called_once()
+    assert (tmp_path / "GEMINI.md").exists()
+    plan_events = [
+        call.args[0].payload
+        for call in supervisor.event_bus.dispatch.call_args_list
+        if call.args[0].event_type == "TASK_PLAN_GENERATED"
+    ]
+    assert [payload["partial"] for payload in plan_events] == [True, True, True, True, False]
+    assert plan_events[-1]["task_description"] == "Long plan"
+    assert plan_events[-1]["task_spec"] == "# Task: Build"
+    assert plan_events[-1]["spec_diverged"] is False
+
+
+def test_final_plan_event_reports_the_launched_spec(tmp_path: Path) -> None:
+    supervisor = _build_supervisor()
+    supervisor._ensure_project_directory = MagicMock(return_value=tmp_path)
+    supervisor._watch_session = MagicMock()
+    # The plan quotes an opening tag, so a whole-text re-parse would pick up a different spec.
+    supervisor.llm.stream_chat_for_agent.side_effect = lambda *args, **kwargs: iter(
+        [
+            "<detailed_plan>Explain the <task_spec> block</detailed_plan>\n",
+            "<task_spec># Task: Build</task_spec>",
+        ]
+    )
+
+    supervisor.process_message("Build it", "demo")
+
+    spec = supervisor.terminal_service.spawn_agent.call_args.args[0]
+    final = [
+        call.args[0].payload
+        for call in supervisor.event_bus.dispatch.call_args_list
+        if call.args[0].event_type == "TASK_PLAN_GENERATED"
+    ][-1]
+    assert spec.prompt.startswith("# Task: Build")
+    assert final["partial"] is False
+    assert final["task_spec"] == "# Task: Build"
+    assert final["spec_diverged"] is True
+
+
+def test_second_task_for_a_busy_project_waits_for_the_first(tmp_path: Path) -> None:
+    supervisor = _build_supervisor()
+    supervisor._ensure_project_directory = MagicMock(return_value=tmp_path)
+    supervisor._watch_session = MagicMock()
+    supervisor.llm.stream_chat_for_agent.side_effect = lambda *args, **kwargs: iter(["<task_spec>spec</task_spec>"])
+
+    supervisor.process_message("First", "demo")
+    supervisor.process_message("Second", "demo")
+
+    supervisor.terminal_service.spawn_agent.assert_called_once()
+    snapshot = supervisor.scheduler.snapshot()
+    assert len(snapshot["running"]) == 1 and len(snapshot["queued"]) == 1
+
+    supervisor.scheduler.release(snapshot["running"][0]["task_id"])
+    assert supervisor.terminal_service.spawn_agent.call_count == 2
+
+
 def test_parse_cli_stats_extracts_recent_json(tmp_path: Path) -> None:
     supervisor = _build_supervisor()
     log_path = tmp_path / "task.output.log"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from src.aura.models.agent_task import AgentSpecification
+from src.aura.models.event_types import AGENT_QUEUE_UPDATED
+from src.aura.services.agent_task_scheduler import AgentQueueFullError, AgentTaskScheduler
+from tests.conftest import RecordingEventBus
+
+
+def _spec(task_id: str, project: str) -> AgentSpecification:
+    return AgentSpecification(task_id=task_id, request="req", project_name=project, prompt="prompt")
+
+
+class _Launcher:
+    def __init__(self, fail: Tuple[str, ...] = ()) -> None:
+        self.launched: List[str] = []
+        self.fail = fail
+
+    def __call__(self, spec: AgentSpecification, project_path: Path) -> None:
+        if spec.task_id in self.fail:
+            raise RuntimeError("spawn failed")
+        self.launched.append(spec.task_id)
+
+
+def test_runs_up_to_the_limit_and_serializes_each_project(tmp_path: Path) -> None:
+    launcher = _Launcher()
+    scheduler = AgentTaskScheduler(launcher, max_concurrent=2)
+
+    assert scheduler.submit(_spec("a1", "alpha"), tmp_path / "alpha")
+    assert not scheduler.submit(_spec("a2", "alpha"), tmp_path / "alpha")
+    assert scheduler.submit(_spec("b1", "beta"), tmp_path / "beta")
+    assert not scheduler.submit(_spec("c1", "gamma"), tmp_path / "gamma")
+    assert launcher.launched == ["a1", "b1"]
+
+    # Freeing alpha lets its next task run before the older task for another project.
+    scheduler.release("a1")
+    assert launcher.launched == ["a1", "b1", "a2"]
+    scheduler.release("b1")
+    assert launcher.launched == ["a1", "b1", "a2", "c1"]
+    assert scheduler.snapshot()["queued"] == []
+
+
+def test_queue_is_bounded(tmp_path: Path) -> None:
+    scheduler = AgentTaskScheduler(_Launcher(), max_concurrent=1, max_queue=1)
+    scheduler.submit(_spec("t1", "p"), tmp_path / "p")
+    scheduler.submit(_spec("t2", "p"), tmp_path / "p")
+
+    with pytest.raises(AgentQueueFullError):
+        scheduler.submit(_spec("t3", "q"), tmp_path / "q")
+
+
+def test_failed_launch_frees_the_slot_and_state_changes_are_published(tmp_path: Path) -> None:
+    bus = RecordingEventBus()
+    launcher = _Launcher(fail=("bad",))
+    scheduler = AgentTaskScheduler(launcher, bus, max_concurrent=1)
+
+    assert not scheduler.submit(_spec("bad", "p"), tmp_path / "p")
+    assert scheduler.submit(_spec("good", "p"), tmp_path / "p")
+    assert scheduler.cancel("missing") is False
+
+    changes = [
+        (event.payload["task_id"], event.payload["change"])
+        for event in bus.dispatched
+        if event.event_type == AGENT_QUEUE_UPDATED
+    ]
+    assert changes == [
+        ("bad", "queued"),
+        ("bad", "started"),
+        ("bad", "launch_failed"),
+        ("good", "queued"),
+        ("good", "started"),
+    ]
+    assert bus.dispatched[-1].payload["running"] == [{"task_id": "good", "project": "p"}]
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import List
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from src.aura.app.event_bus import INLINE_LANE, WORKER_LANE, EventBus, coalesce_terminal_output
+from src.aura.models.event_types import TERMINAL_OUTPUT_RECEIVED
+from src.aura.models.events import Event
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qt_app() -> QCoreApplication:
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _terminal_event(task_id: str, text: str, timestamp: str = "t0") -> Event:
+    return Event(
+        event_type=TERMINAL_OUTPUT_RECEIVED,
+        payload={"task_id": task_id, "text": text, "stream_type": "stdout", "timestamp": timestamp},
+    )
+
+
+def test_dispatch_delivers_unbatched_events_immediately() -> None:
+    bus = EventBus()
+    received: List[Event] = []
+    bus.subscribe("PING", received.append)
+
+    bus.dispatch(Event(event_type="PING", payload={"n": 1}))
+
+    assert [event.payload["n"] for event in received] == [1]
+
+
+def test_batched_events_wait_for_flush_and_arrive_as_list() -> None:
+    bus = EventBus()
+    batches: List[List[Event]] = []
+    singles: List[Event] = []
+    bus.subscribe_batch(TERMINAL_OUTPUT_RECEIVED, batches.append)
+    bus.subscribe(TERMINAL_OUTPUT_RECEIVED, singles.append)
+
+    bus.dispatch(_terminal_event("a", "one"))
+    bus.dispatch(_terminal_event("a", "two"))
+    assert batches == []
+    assert singles == []
+
+    bus.flush_batches()
+
+    assert len(batches) == 1
+    assert [event.payload["text"] for event in batches[0]] == ["one", "two"]
+    assert [event.payload["text"] for event in singles] == ["one", "two"]
+
+
+def test_coalescing_rule_merges_text_per_task() -> None:
+    bus = EventBus()
+    bus.enable_batching(TERMINAL_OUTPUT_RECEIVED, coalesce=coalesce_terminal_output)
+    received: List[Event] = []
+    bus.subscribe(TERMINAL_OUTPUT_RECEIVED, received.append)
+
+    bus.dispatch(_terminal_event("a", "foo", "t1"))
+    bus.dispatch(_terminal_event("b", "bar", "t2"))
+    bus.dispatch(_terminal_event("a", "baz", "t3"))
+    bus.flush_batches()
+
+    by_task = {event.payload["task_id"]: event.payload for event in received}
+    assert by_task["a"]["text"] == "foobaz"
+    assert by_task["a"]["timestamp"] == "t3"
+    assert by_task["b"]["text"] == "bar"
+
+
+def test_coalesced_text_does_not_depend_on_frame_boundaries() -> None:
+    chunks = ["$ ls\r\n", "a.py  b", ".py\r\n", "$ "]
+    outputs = []
+    for frame_sizes in ([4], [1, 1, 1, 1], [2, 2], [3, 1]):
+        bus = EventBus()
+        bus.enable_batching(TERMINAL_OUTPUT_RECEIVED, coalesce=coalesce_terminal_output)
+        received: List[str] = []
+        bus.subscribe_batch(
+            TERMINAL_OUTPUT_RECEIVED, lambda events: received.extend(e.payload["text"] for e in events)
+        )
+        remaining = iter(chunks)
+        for size in frame_sizes:
+            for _ in range(size):
+                bus.dispatch(_terminal_event("a", next(remaining)))
+            bus.flush_batches()
+        outputs.append("".join(received))
+
+    assert outputs == ["".join(chunks)] * 4
+
+
+def test_events_queued_behind_a_batch_keep_their_order() -> None:
+    bus = EventBus()
+    bus.enable_batching(TERMINAL_OUTPUT_RECEIVED, coalesce=coalesce_terminal_output)
+    received: List[str] = []
+    bus.subscribe(TERMINAL_OUTPUT_RECEIVED, lambda event: received.append(event.payload["text"]))
+    bus.subscribe("SESSION_DONE", lambda event: received.append(f"done:{event.payload['n']}"))
+
+    bus.dispatch(Event(event_type="SESSION_DONE", payload={"n": 0}))
+    bus.dispatch(_terminal_event("a", "foo"))
+    bus.dispatch(Event(event_type="SESSION_DONE", payload={"n": 1}))
+    bus.dispatch(_terminal_event("a", "bar"))
+    bus.dispatch(Event(event_type="SESSION_DONE", payload={"n": 2}))
+    # Nothing overtakes the pending output.
+    assert received == ["done:0"]
+
+    bus.flush_batches()
+
+    assert received == ["done:0", "foobar", "done:1", "done:2"]
+    assert bus.lane_stats()["main"]["depth"] == 0
+
+
+def test_flush_after_drain_is_a_no_op() -> None:
+    bus = EventBus()
+    batches: List[List[Event]] = []
+    bus.subscribe_batch(TERMINAL_OUTPUT_RECEIVED, batches.append)
+
+    bus.dispatch(_terminal_event("a", "x"))
+    bus.flush_batches()
+    bus.flush_batches()
+
+    assert len(batches) == 1
+
+
+def test_inline_lane_runs_on_dispatching_thread() -> None:
+    bus = EventBus()
+    threads: List[str] = []
+    bus.subscribe("INLINE", lambda _event: threads.append(threading.current_thread().name), lane=INLINE_LANE)
+
+    worker = threading.Thread(target=lambda: bus.dispatch(Event(event_type="INLINE")), name="dispatcher")
+    worker.start()
+    worker.join()
+
+    assert threads == ["dispatcher"]
+    assert bus.lane_stats()[INLINE_LANE]["delivered"] == 1
+
+
+def test_worker_lane_delivers_off_main_thread_and_reports_stats() -> None:
+    bus = EventBus()
+    delivered = threading.Event()
+    seen: List[str] = []
+
+    def _on_event(event: Event) -> None:
+        seen.append(threading.current_thread().name)
+        delivered.set()
+
+    bus.subscribe("WORK", _on_event, lane=WORKER_LANE)
+    bus.dispatch(Event(event_type="WORK"))
+
+    assert delivered.wait(2.0)
+    bus.shutdown()
+    assert seen and seen[0].startswith("aura-event-worker")
+    stats = bus.lane_stats()[WORKER_LANE]
+    assert stats["delivered"] == 1
+    assert stats["depth"] == 0
+
+
+def test_worker_lane_coalesces_queued_batched_events() -> None:
+    bus = EventBus()
+    bus.enable_batching(TERMINAL_OUTPUT_RECEIVED, coalesce=coalesce_terminal_output)
+    gate = threading.Event()
+    texts: List[str] = []
+    done = threading.Event()
+
+    def _blocker(_event: Event) -> None:
+        gate.wait(2.0)
+
+    def _collect(event: Event) -> None:
+        texts.append(event.payload["text"])
+        if "".join(texts) == "abc":
+            done.set()
+
+    bus.subscribe("BLOCK", _blocker, lane=WORKER_LANE)
+    bus.subscribe(TERMINAL_OUTPUT_RECEIVED, _collect, lane=WORKER_LANE)
+    bus.dispatch(Event(event_type="BLOCK"))
+    for text in ("a", "b", "c"):
+        bus.dispatch(_terminal_event("task", text))
+    gate.set()
+
+    assert done.wait(2.0)
+    bus.shutdown()
+    assert texts == ["abc"]
+
+
+def test_unsubscribe_stops_delivery_and_routing() -> None:
+    bus = EventBus()
+    received: List[Event] = []
+    bus.subscribe("PING", received.append)
+
+    assert bus.unsubscribe("PING", received.append)
+    assert not bus.unsubscribe("PING", received.append)
+    bus.dispatch(Event(event_type="PING"))
+
+    assert received == []
+    assert "PING" not in bus._subscribers["main"]
+
+
+def test_subscribe_rejects_unknown_lane() -> None:
+    bus = EventBus()
+    with pytest.raises(ValueError):
+        bus.subscribe("X", lambda _event: None, lane="gpu")
+
+
+def test_trace_buffer_samples_recent_deliveries() -> None:
+    bus = EventBus(trace_capacity=2, trace_sample_every=1)
+    bus.subscribe("TRACE", lambda _event: None, lane=INLINE_LANE)
+
+    for text in ("a", "bb", "ccc"):
+        bus.dispatch(Event(event_type="TRACE", payload={"text": text}))
+
+    records = bus.dump_trace(clear=True)
+    assert [record["payload_size"] for record in records] == [2, 3]
+    assert all(record["lane"] == INLINE_LANE and record["latency_ms"] >= 0 for record in records)
+    assert bus.dump_trace() == []
+
+
+def test_dispatch_does_not_format_payload_when_debug_disabled(caplog: pytest.LogCaptureFixture) -> None:
+    class _Exploding:
+        def __repr__(self) -> str:  # pragma: no cover - must never run
+            raise AssertionError("payload formatted while tracing disabled")
+
+    bus = EventBus()
+    bus.subscribe("QUIET", lambda _event: None, lane=INLINE_LANE)
+    caplog.set_level(logging.INFO, logger="src.aura.app.event_bus")
+
+    bus.dispatch(Event(event_type="QUIET", payload={"blob": _Exploding()}))
+
+
+def test_stats_reports_counts_queue_delay_and_callback_times() -> None:
+    bus = EventBus()
+
+    def slow_subscriber(_event: Event) -> None:
+        time.sleep(0.005)
+
+    bus.subscribe("STATS", slow_subscriber, lane=INLINE_LANE)
+    bus.subscribe("STATS", lambda _event: None, lane=INLINE_LANE)
+    for _ in range(3):
+        bus.dispatch(Event(event_type="STATS"))
+
+    stats = bus.stats()
+    assert stats["lanes"][INLINE_LANE]["delivered"] == 3
+    assert stats["event_types"]["STATS"]["dispatched"] == 3
+    assert stats["event_types"]["STATS"]["queue_delay"]["count"] == 3
+    timing = next(value for name, value in stats["callbacks"].items() if name.endswith("slow_subscriber"))
+    assert timing["count"] == 3
+    assert timing["max_ms"] >= 5
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from src.aura.models.prompt import PrefixedPrompt
+from src.providers import gemini_provider
+from src.providers.gemini_provider import GeminiProvider
+
+
+class _FakeChunk:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _FakeModel:
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+    def generate_content(self, prompt: Any, stream: bool = False) -> List[_FakeChunk]:
+        return [_FakeChunk("ok")]
+
+
+class _FakeGenAI:
+    def __init__(self) -> None:
+        self.created: List[Dict[str, Any]] = []
+
+    def GenerativeModel(self, **kwargs: Any) -> _FakeModel:  # noqa: N802 - mirrors the SDK
+        self.created.append(kwargs)
+        return _FakeModel(**kwargs)
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch) -> GeminiProvider:
+    fake = _FakeGenAI()
+
+    def _fake_init(self: GeminiProvider) -> None:
+        self.client = fake
+
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(GeminiProvider, "_init_client", _fake_init)
+    return GeminiProvider()
+
+
+def test_stream_chat_reuses_model_handle_for_identical_settings(provider: GeminiProvider) -> None:
+    config = {"temperature": 0.1, "top_p": 0.9}
+
+    assert list(provider.stream_chat("gemini-2.5-pro", "a", config)) == ["ok"]
+    assert list(provider.stream_chat("gemini-2.5-pro", "b", dict(config))) == ["ok"]
+    list(provider.stream_chat("gemini-2.5-pro", "c", {"temperature": 0.5}))
+
+    assert len(provider.client.created) == 2
+    assert provider.model_cache_stats() == {"size": 2, "hits": 1, "misses": 2}
+
+
+def test_model_cache_evicts_least_recently_used_and_clears(provider: GeminiProvider) -> None:
+    provider._MODEL_CACHE_SIZE = 2
+    config: Dict[str, Any] = {}
+
+    provider._get_model("m1", config)
+    provider._get_model("m2", config)
+    provider._get_model("m1", config)
+    provider._get_model("m3", config)
+    provider._get_model("m1", config)
+    provider._get_model("m2", config)
+
+    assert [kwargs["model_name"] for kwargs in provider.client.created] == ["m1", "m2", "m3", "m2"]
+
+    provider.clear_model_cache()
+    assert provider.model_cache_stats()["size"] == 0
+
+
+def test_sdk_is_imported_on_first_client_use_not_at_construction(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[str] = []
+
+    def _fake_init(self: GeminiProvider) -> None:
+        calls.append("init")
+        self.client = _FakeGenAI()
+
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(GeminiProvider, "_init_client", _fake_init)
+    provider = GeminiProvider()
+
+    assert "gemini-2.5-pro" in provider.get_available_models()
+    assert calls == []
+
+    list(provider.stream_chat("gemini-2.5-pro", "a", {}))
+    list(provider.stream_chat("gemini-2.5-pro", "b", {}))
+    assert calls == ["init"]
+
+
+class _FakeCache:
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.deleted = False
+
+    def delete(self) -> None:
+        self.deleted = True
+
+
+class _FakeCaching:
+    """Stands in for ``genai.caching``; ``CachedContent.create`` records each cache."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.caches: List[_FakeCache] = []
+        self.CachedContent = self
+
+    def create(self, **kwargs: Any) -> _FakeCache:
+        if self.fail:
+            raise RuntimeError("context caching not supported for this model")
+        cache = _FakeCache(**kwargs)
+        self.caches.append(cache)
+        return cache
+
+
+class _FakeChatModel:
+    def __init__(self, sent: List[Dict[str, Any]], **kwargs: Any) -> None:
+        self.sent = sent
+        self.kwargs = kwargs
+
+    def start_chat(self, history: List[Dict[str, Any]]) -> "_FakeChatModel":
+        self.history = history
+        return self
+
+    def send_message(self, message: Any, stream: bool = False) -> List[_FakeChunk]:
+        self.sent.append({"model": self.kwargs, "history": self.history, "message": message})
+        return [_FakeChunk("ok")]
+
+    def generate_content(self, prompt: Any, stream: bool = False) -> List[_FakeChunk]:
+        self.sent.append({"model": self.kwargs, "history": None, "message": prompt})
+        return [_FakeChunk("ok")]
+
+
+class _FakeModelClass:
+    def __init__(self, sent: List[Dict[str, Any]]) -> None:
+        self.sent = sent
+
+    def __call__(self, **kwargs: Any) -> _FakeChatModel:
+        return _FakeChatModel(self.sent, **kwargs)
+
+    def from_cached_content(self, cached_content: Any, generation_config: Dict[str, Any]) -> _FakeChatModel:
+        return _FakeChatModel(self.sent, cached_content=cached_content)
+
+
+class _FakeCachingGenAI:
+    def __init__(self, fail: bool = False) -> None:
+        self.sent: List[Dict[str, Any]] = []
+        self.caching = _FakeCaching(fail)
+        self.GenerativeModel = _FakeModelClass(self.sent)
+
+
+def _caching_provider(monkeypatch: pytest.MonkeyPatch, fake: _FakeCachingGenAI) -> GeminiProvider:
+    def _fake_init(self: GeminiProvider) -> None:
+        self.client = fake
+
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(GeminiProvider, "_init_client", _fake_init)
+    return GeminiProvider()
+
+
+_CACHING_CONFIG = {"context_cache": True, "context_cache_min_chars": 10}
+_MESSAGES = [
+    {"role": "system", "content": "Follow the coding rules. " * 4},
+    {"role": "assistant", "content": "Earlier answer"},
+    {"role": "user", "content": "Next question"},
+]
+
+
+def test_structured_chat_reuses_server_side_context_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeCachingGenAI()
+    provider = _caching_provider(monkeypatch, fake)
+
+    for _ in range(2):
+        assert list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, _CACHING_CONFIG)) == ["ok"]
+
+    assert len(fake.caching.caches) == 1
+    cache = fake.caching.caches[0]
+    assert cache.kwargs["system_instruction"] == _MESSAGES[0]["content"]
+    # A single earlier turn is below one block, so it stays live history.
+    assert cache.kwargs["contents"] is None
+    assert [sent["history"] for sent in fake.sent] == [[{"role": "model", "parts": ["Earlier answer"]}]] * 2
+    assert all(sent["model"] == {"cached_content": cache} for sent in fake.sent)
+    assert provider.context_cache_stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    provider.clear_model_cache()
+    assert cache.deleted
+    assert provider.context_cache_stats()["size"] == 0
+
+
+
+def test_growing_chat_reuses_the_cache_until_a_turn_block_fills(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeCachingGenAI()
+    provider = _caching_provider(monkeypatch, fake)
+    config = {**_CACHING_CONFIG, "context_cache_turn_block": 2}
+    conversation = [_MESSAGES[0]]
+    for turn in range(5):
+        conversation += [{"role": "user", "content": f"q{turn}"}, {"role": "assistant", "content": f"a{turn}"}]
+        list(provider.stream_chat_structured("gemini-2.5-pro", conversation + [{"role": "user", "content": "next"}], config))
+
+    # Histories of 1..5 model turns: cached prefixes of 0, 2, 2, 4 and 4 turns.
+    assert [len(cache.kwargs["contents"] or []) for cache in fake.caching.caches] == [0, 2, 4]
+    assert [len(sent["history"]) for sent in fake.sent] == [1, 0, 1, 0, 1]
+    assert provider.context_cache_stats()["hits"] == 2
+
+
+def test_expiring_context_cache_is_recreated(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeCachingGenAI()
+    provider = _caching_provider(monkeypatch, fake)
+    config = {**_CACHING_CONFIG, "context_cache_ttl_seconds": 30}
+
+    list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, config))
+    list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, config))
+
+    # A 30s TTL is inside the refresh margin, so every call replaces the handle.
+    assert len(fake.caching.caches) == 2
+    assert fake.caching.caches[0].deleted
+
+
+def test_failed_request_deletes_its_cached_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeCachingGenAI()
+    provider = _caching_provider(monkeypatch, fake)
+
+    def _expired(self: _FakeChatModel, message: Any, stream: bool = False) -> List[_FakeChunk]:
+        raise RuntimeError("cached content expired")
+
+    monkeypatch.setattr(_FakeChatModel, "send_message", _expired)
+    with pytest.raises(RuntimeError):
+        list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, _CACHING_CONFIG))
+
+    assert fake.caching.caches[0].deleted
+    assert provider.context_cache_stats()["size"] == 0
+
+
+def test_falls_back_to_plain_request_when_caching_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeCachingGenAI(fail=True)
+    provider = _caching_provider(monkeypatch, fake)
+
+    for _ in range(2):
+        assert list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, _CACHING_CONFIG)) == ["ok"]
+    assert list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, {})) == ["ok"]
+
+    assert fake.caching.caches == []
+    assert fake.sent[0]["model"]["system_instruction"] == _MESSAGES[0]["content"]
+    assert fake.sent[0]["history"] == [{"role": "model", "parts": ["Earlier answer"]}]
+    assert provider.context_cache_stats() == {"size": 0, "hits": 0, "misses": 1}
+
+
+def test_caching_is_retried_after_a_failure_backs_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeCachingGenAI(fail=True)
+    provider = _caching_provider(monkeypatch, fake)
+    clock = [1000.0]
+    monkeypatch.setattr(gemini_provider.time, "monotonic", lambda: clock[0])
+
+    list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, _CACHING_CONFIG))
+    fake.caching.fail = False
+    clock[0] += GeminiProvider._CONTEXT_CACHE_RETRY_SECONDS - 1
+    list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, _CACHING_CONFIG))
+    assert fake.caching.caches == []
+
+    clock[0] += 1
+    list(provider.stream_chat_structured("gemini-2.5-pro", _MESSAGES, _CACHING_CONFIG))
+    assert len(fake.caching.caches) == 1
+    assert fake.sent[-1]["model"] == {"cached_content": fake.caching.caches[0]}
+
+
+def test_prefixed_prompt_caches_the_prefix_as_a_leading_user_turn(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeCachingGenAI()
+    provider = _caching_provider(monkeypatch, fake)
+
+    prompt = PrefixedPrompt("Architect template. " * 4, "User request: build it\n")
+    assert list(provider.stream_chat("gemini-2.5-pro", prompt, _CACHING_CONFIG)) == ["ok"]
+
+    cache = fake.caching.caches[0]
+    assert cache.kwargs["system_instruction"] is None
+    assert cache.kwargs["contents"] == [{"role": "user", "parts": [prompt.prefix]}]
+    assert fake.sent[0]["message"] == "User request: build it\n"
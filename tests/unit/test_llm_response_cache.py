@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from src.aura.services.llm_response_cache import LLMResponseCache
+
+
+def test_key_depends_on_every_request_input() -> None:
+    base = LLMResponseCache.make_key("architect_agent", "gemini-2.5-pro", {"temperature": 0.05}, "plan")
+
+    assert base == LLMResponseCache.make_key("architect_agent", "gemini-2.5-pro", {"temperature": 0.05}, "plan")
+    assert base != LLMResponseCache.make_key("architect_agent", "gemini-2.5-pro", {"temperature": 0.5}, "plan")
+    assert base != LLMResponseCache.make_key("architect_agent", "gemini-2.5-flash", {"temperature": 0.05}, "plan")
+    assert base != LLMResponseCache.make_key("architect_agent", "gemini-2.5-pro", {"temperature": 0.05}, "plan!")
+
+
+def test_round_trip_and_ttl_expiry(tmp_path: Path) -> None:
+    cache = LLMResponseCache(tmp_path, ttl_seconds=60)
+    key = cache.make_key("a", "m", {}, "p")
+
+    assert cache.get(key) is None
+    cache.put(key, "response text")
+    assert cache.get(key) == "response text"
+
+    expired = LLMResponseCache(tmp_path, ttl_seconds=0.01)
+    time.sleep(0.05)
+    assert expired.get(key) is None
+    assert cache.get(key) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_size_budget_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = LLMResponseCache(tmp_path, max_bytes=700)
+    keys = [cache.make_key("a", "m", {}, str(index)) for index in range(3)]
+
+    cache.put(keys[0], "x" * 200)
+    cache.put(keys[1], "y" * 200)
+    old = time.time() - 100
+    for path in tmp_path.glob("*/*.json"):
+        os.utime(path, (old, old))
+    assert cache.get(keys[0]) is not None  # refreshes keys[0]
+    cache.put(keys[2], "z" * 200)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.stats()["evictions"] == 1
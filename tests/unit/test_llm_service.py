@@ -0,0 +1,570 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Generator, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.aura.models.event_types import LLM_REQUEST_CANCELLED, LLM_REQUEST_METRICS, REQUEST_LLM_METRICS
+from src.aura.models.exceptions import LLMCancelledError, LLMServiceError
+from src.aura.models.events import Event
+from src.aura.services.agent_supervisor import AgentSupervisor
+from src.aura.services.llm_response_cache import LLMResponseCache
+from src.aura.services.llm_service import LLMService
+from src.aura.utils.cancellation import CancellationToken
+from tests.conftest import RecordingEventBus
+
+
+class SyncOnlyProvider:
+    """Provider exposing only the blocking streaming API."""
+
+    provider_name = "Sync"
+
+    def __init__(self, chunks: List[str]) -> None:
+        self.chunks = chunks
+        self.calls = 0
+
+    def get_available_models(self) -> List[str]:
+        return ["sync-model"]
+
+    def stream_chat(self, model_name: str, prompt: Any, config: Dict[str, Any]) -> Generator[str, None, None]:
+        self.calls += 1
+        for chunk in self.chunks:
+            time.sleep(0.001)
+            yield chunk
+
+
+class AsyncProvider(SyncOnlyProvider):
+    """Provider with a native async stream that fails transiently first."""
+
+    provider_name = "Async"
+
+    def __init__(self, chunks: List[str], failures: int = 0) -> None:
+        super().__init__(chunks)
+        self.failures = failures
+        self.async_calls = 0
+
+    async def astream_chat(self, model_name: str, prompt: Any, config: Dict[str, Any]) -> AsyncIterator[str]:
+        self.async_calls += 1
+        if self.async_calls <= self.failures:
+            raise ConnectionError("connection reset by peer")
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+
+def _make_service(monkeypatch: pytest.MonkeyPatch, provider: Any, model: str) -> LLMService:
+    monkeypatch.setattr(LLMService, "_load_providers", lambda self: None)
+    service = LLMService(RecordingEventBus())
+    assert service.wait_for_providers(timeout=5)
+    service.providers = {provider.provider_name: provider}
+    service.model_to_provider_map = {model: provider.provider_name}
+    service.agent_config = {"architect_agent": {"model": model}}
+    return service
+
+
+def test_arun_for_agent_bridges_sync_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _make_service(monkeypatch, SyncOnlyProvider(["a", "b", "c"]), "sync-model")
+
+    assert asyncio.run(service.arun_for_agent("architect_agent", "prompt")) == "abc"
+
+
+def test_astream_retries_with_non_blocking_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = AsyncProvider(["x", "y"], failures=1)
+    service = _make_service(monkeypatch, provider, "async-model")
+    monkeypatch.setattr(LLMService, "_RETRY_BACKOFF_SECONDS", (0.05,))
+
+    async def _run() -> List[str]:
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(_ticker())
+        chunks = [chunk async for chunk in service.astream_chat_for_agent("architect_agent", "prompt")]
+        ticker.cancel()
+        # The loop kept running other tasks during the backoff.
+        assert ticks > 2
+        return chunks
+
+    assert asyncio.run(_run()) == ["x", "y"]
+    assert provider.async_calls == 2
+    assert provider.calls == 0
+
+
+def test_arun_for_agent_raises_after_exhausting_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _make_service(monkeypatch, AsyncProvider(["x"], failures=5), "async-model")
+    monkeypatch.setattr(LLMService, "_RETRY_BACKOFF_SECONDS", (0, 0))
+
+    with pytest.raises(LLMServiceError):
+        asyncio.run(service.arun_for_agent("architect_agent", "prompt"))
+
+
+def test_cancelling_async_stream_stops_the_bridge_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = SyncOnlyProvider(["chunk"] * 1000)
+    service = _make_service(monkeypatch, provider, "sync-model")
+
+    async def _run() -> None:
+        async def _consume() -> None:
+            async for _chunk in service.astream_chat_for_agent("architect_agent", "prompt"):
+                pass
+
+        task = asyncio.create_task(_consume())
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_run())
+
+
+def test_cancel_all_stops_async_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _make_service(monkeypatch, SyncOnlyProvider(["chunk"] * 1000), "sync-model")
+    token = CancellationToken()
+
+    async def _run() -> List[str]:
+        chunks: List[str] = []
+        with pytest.raises(LLMCancelledError):
+            async for chunk in service.astream_chat_for_agent("architect_agent", "prompt", cancel_token=token):
+                chunks.append(chunk)
+                if len(chunks) == 3:
+                    threading.Thread(target=service.cancel_all, args=("shutdown",)).start()
+                    # The cancel lands while the consumer awaits its own work, not the stream.
+                    await asyncio.sleep(0.05)
+        # Only the request was cancelled; the consuming task carries on.
+        assert asyncio.current_task().cancelling() == 0
+        await asyncio.sleep(0.01)
+        return chunks
+
+    chunks = asyncio.run(_run())
+
+    assert token.cancelled and token.reason == "shutdown"
+    assert 3 <= len(chunks) < 1000
+    assert service._inflight == set()
+    assert any(event.event_type == LLM_REQUEST_CANCELLED for event in service.event_bus.dispatched)
+
+
+class HangingAsyncProvider(SyncOnlyProvider):
+    """Async provider that never produces a first chunk."""
+
+    provider_name = "Hanging"
+
+    def __init__(self) -> None:
+        super().__init__([])
+        self.closed = 0
+
+    async def astream_chat(self, model_name: str, prompt: Any, config: Dict[str, Any]) -> AsyncIterator[str]:
+        try:
+            await asyncio.sleep(30)
+            yield "late"
+        finally:
+            self.closed += 1
+
+
+def test_token_cancels_an_async_request_waiting_on_the_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = HangingAsyncProvider()
+    service = _make_service(monkeypatch, provider, "hanging-model")
+
+    async def _run() -> None:
+        for consume in (
+            lambda token: service.arun_for_agent("architect_agent", "prompt", cancel_token=token),
+            lambda token: _drain(service.astream_chat_for_agent("architect_agent", "prompt", cancel_token=token)),
+        ):
+            token = CancellationToken()
+            threading.Timer(0.05, token.cancel, args=("user stopped",)).start()
+            started = time.monotonic()
+            with pytest.raises(LLMCancelledError):
+                await consume(token)
+            assert time.monotonic() - started < 5
+            assert asyncio.current_task().cancelling() == 0
+
+    async def _drain(stream: AsyncIterator[str]) -> None:
+        async for _chunk in stream:
+            pass
+
+    asyncio.run(_run())
+
+    assert provider.closed == 2
+    cancelled = [event for event in service.event_bus.dispatched if event.event_type == LLM_REQUEST_CANCELLED]
+    assert [event.payload["operation"] for event in cancelled] == ["arun_for_agent", "astream_chat"]
+    assert service._inflight == set()
+
+
+def test_async_requests_share_the_response_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    provider = SyncOnlyProvider(["a", "b"])
+    service = _make_service(monkeypatch, provider, "sync-model")
+    service.response_cache = LLMResponseCache(tmp_path)
+
+    async def _stream() -> List[str]:
+        return [chunk async for chunk in service.astream_chat_for_agent("architect_agent", "prompt")]
+
+    assert asyncio.run(_stream()) == ["a", "b"]
+    assert asyncio.run(service.arun_for_agent("architect_agent", "prompt")) == "ab"
+    assert service.run_for_agent("architect_agent", "prompt") == "ab"
+    assert provider.calls == 1
+
+
+class BlockingRetryProvider(SyncOnlyProvider):
+    """Provider that always fails with a retryable error."""
+
+    provider_name = "Flaky"
+
+    def stream_chat(self, model_name: str, prompt: Any, config: Dict[str, Any]) -> Generator[str, None, None]:
+        self.calls += 1
+        raise ConnectionError("connection refused")
+        yield ""  # pragma: no cover - makes this a generator
+
+
+def test_cancel_skips_pending_backoff_and_emits_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = BlockingRetryProvider([])
+    service = _make_service(monkeypatch, provider, "flaky-model")
+    monkeypatch.setattr(LLMService, "_RETRY_BACKOFF_SECONDS", (30, 30, 30))
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel, args=("user closed window",)).start()
+
+    started = time.monotonic()
+    with pytest.raises(LLMCancelledError):
+        service.run_for_agent("architect_agent", "prompt", cancel_token=token)
+
+    assert time.monotonic() - started < 5
+    assert provider.calls == 1
+    cancelled = [e for e in service.event_bus.dispatched if e.event_type == LLM_REQUEST_CANCELLED]
+    assert cancelled[0].payload["reason"] == "user closed window"
+
+
+def test_stream_handle_cancel_closes_provider_iterator(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: List[bool] = []
+
+    class EndlessProvider(SyncOnlyProvider):
+        def stream_chat(self, model_name: str, prompt: Any, config: Dict[str, Any]) -> Generator[str, None, None]:
+            try:
+                while True:
+                    yield "tok"
+            finally:
+                closed.append(True)
+
+    service = _make_service(monkeypatch, EndlessProvider([]), "sync-model")
+    stream = service.stream_chat_for_agent("architect_agent", "prompt")
+
+    received = []
+    with pytest.raises(LLMCancelledError):
+        for chunk in stream:
+            received.append(chunk)
+            if len(received) == 3:
+                stream.cancel()
+
+    assert received == ["tok"] * 3
+    assert closed == [True]
+
+
+def test_cancel_all_cancels_in_flight_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = BlockingRetryProvider([])
+    service = _make_service(monkeypatch, provider, "flaky-model")
+    monkeypatch.setattr(LLMService, "_RETRY_BACKOFF_SECONDS", (30,))
+    errors: List[Exception] = []
+
+    def _worker() -> None:
+        try:
+            service.run_for_agent("architect_agent", "prompt")
+        except Exception as exc:  # noqa: BLE001 - recorded for assertions
+            errors.append(exc)
+
+    worker = threading.Thread(target=_worker)
+    worker.start()
+    while provider.calls == 0:
+        time.sleep(0.005)
+    time.sleep(0.02)
+
+    assert service.cancel_all("shutdown") == 1
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert isinstance(errors[0], LLMCancelledError)
+
+
+def test_run_for_agent_serves_repeats_from_response_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    provider = SyncOnlyProvider(["plan"])
+    service = _make_service(monkeypatch, provider, "sync-model")
+    service.response_cache = LLMResponseCache(tmp_path)
+
+    assert service.run_for_agent("architect_agent", "prompt") == "plan"
+    assert service.run_for_agent("architect_agent", "prompt") == "plan"
+    assert service.run_for_agent("architect_agent", "prompt", use_cache=False) == "plan"
+    assert provider.calls == 2
+    assert service.response_cache.stats()["hits"] == 1
+
+
+def test_stream_is_cached_only_after_it_completes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    provider = SyncOnlyProvider(["a", "b"])
+    service = _make_service(monkeypatch, provider, "sync-model")
+    service.response_cache = LLMResponseCache(tmp_path)
+
+    partial = service.stream_chat_for_agent("architect_agent", "prompt")
+    next(partial)
+    partial.close()
+    assert list(service.stream_chat_for_agent("architect_agent", "prompt")) == ["a", "b"]
+    assert list(service.stream_chat_for_agent("architect_agent", "prompt")) == ["ab"]
+    assert provider.calls == 2
+
+
+class MidStreamFailureProvider(SyncOnlyProvider):
+    """Provider whose first stream breaks after one chunk; later streams complete."""
+
+    def stream_chat(self, model_name: str, prompt: Any, config: Dict[str, Any]) -> Generator[str, None, None]:
+        self.calls += 1
+        yield "ab"
+        if self.calls == 1:
+            raise ConnectionError("connection reset by peer")
+        yield "cd"
+
+
+def test_retried_stream_caches_only_the_successful_attempt(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(LLMService, "_RETRY_BACKOFF_SECONDS", (0,))
+    provider = MidStreamFailureProvider([])
+    service = _make_service(monkeypatch, provider, "sync-model")
+    service.response_cache = LLMResponseCache(tmp_path)
+
+    assert list(service.stream_chat_for_agent("architect_agent", "prompt")) == ["ab", "ab", "cd"]
+    assert list(service.stream_chat_for_agent("architect_agent", "prompt")) == ["abcd"]
+
+    provider.calls = 0
+
+    async def _stream() -> List[str]:
+        return [chunk async for chunk in service.astream_chat_for_agent("architect_agent", "other prompt")]
+
+    assert asyncio.run(_stream()) == ["ab", "ab", "cd"]
+    assert service.run_for_agent("architect_agent", "other prompt") == "abcd"
+    assert provider.calls == 2
+
+
+def test_cached_plan_replays_through_the_supervisor_stream(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    provider = SyncOnlyProvider(["<detailed_plan>steps</detailed_plan>", "<task_spec>spec</task_spec>"])
+    service = _make_service(monkeypatch, provider, "sync-model")
+    service.response_cache = LLMResponseCache(tmp_path)
+    supervisor = AgentSupervisor(service, MagicMock(), MagicMock(), MagicMock())
+
+    first = supervisor._generate_task_plan("hello")
+    second = supervisor._generate_task_plan("hello")
+
+    assert provider.calls == 1
+    assert (second.detailed_plan, second.task_spec) == (first.detailed_plan, first.task_spec) == ("steps", "spec")
+
+
+class ScriptedProvider:
+    """Provider whose first-chunk delay and failure mode are scripted per model."""
+
+    provider_name = "Scripted"
+
+    def __init__(self, delays: Dict[str, float], failing: Tuple[str, ...] = ()) -> None:
+        self.delays = delays
+        self.failing = failing
+        self.started: List[str] = []
+        self.closed: List[str] = []
+
+    def get_available_models(self) -> List[str]:
+        return list(self.delays)
+
+    def stream_chat(self, model_name: str, prompt: Any, config: Dict[str, Any]) -> Generator[str, None, None]:
+        self.started.append(model_name)
+        try:
+            time.sleep(self.delays[model_name])
+            if model_name in self.failing:
+                raise ValueError(f"{model_name} exploded")
+            for index in range(3):
+                yield f"{model_name}-{index}|"
+                time.sleep(0.01)
+        finally:
+            self.closed.append(model_name)
+
+
+def _make_hedged_service(
+    monkeypatch: pytest.MonkeyPatch, provider: ScriptedProvider, hedge_after: float
+) -> LLMService:
+    service = _make_service(monkeypatch, provider, "primary")
+    service.model_to_provider_map["secondary"] = provider.provider_name
+    service.agent_config["architect_agent"].update({"hedge_model": "secondary", "hedge_after_seconds": hedge_after})
+    return service
+
+
+def test_hedge_wins_when_primary_first_token_is_slow(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = ScriptedProvider({"primary": 0.5, "secondary": 0.0})
+    service = _make_hedged_service(monkeypatch, provider, hedge_after=0.05)
+
+    started = time.monotonic()
+    response = service.run_for_agent("architect_agent", "prompt")
+
+    assert response == "secondary-0|secondary-1|secondary-2|"
+    assert time.monotonic() - started < 0.45
+    assert provider.started == ["primary", "secondary"]
+    assert "Scripted:secondary" in service.time_to_first_token_stats()
+
+
+def test_async_requests_are_hedged(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = ScriptedProvider({"primary": 0.5, "secondary": 0.0})
+    service = _make_hedged_service(monkeypatch, provider, hedge_after=0.05)
+
+    started = time.monotonic()
+    response = asyncio.run(service.arun_for_agent("architect_agent", "prompt"))
+
+    assert response == "secondary-0|secondary-1|secondary-2|"
+    assert time.monotonic() - started < 0.45
+    assert provider.started == ["primary", "secondary"]
+
+
+def test_hedge_is_not_started_when_primary_answers_in_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = ScriptedProvider({"primary": 0.0, "secondary": 0.0})
+    service = _make_hedged_service(monkeypatch, provider, hedge_after=0.5)
+
+    assert service.run_for_agent("architect_agent", "prompt") == "primary-0|primary-1|primary-2|"
+    assert provider.started == ["primary"]
+    assert service.time_to_first_token_stats()["Scripted:primary"]["count"] == 1
+
+
+def test_hedge_starts_immediately_when_primary_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = ScriptedProvider({"primary": 0.0, "secondary": 0.0}, failing=("primary",))
+    service = _make_hedged_service(monkeypatch, provider, hedge_after=5.0)
+
+    stream = service.stream_chat_for_agent("architect_agent", "prompt")
+
+    assert "".join(stream) == "secondary-0|secondary-1|secondary-2|"
+
+
+def test_every_provider_call_records_a_span_and_publishes_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _make_service(monkeypatch, SyncOnlyProvider(["ab", "c", "d"]), "sync-model")
+
+    assert service.run_for_agent("architect_agent", "prompt", use_cache=False) == "abcd"
+    assert asyncio.run(service.arun_for_agent("architect_agent", "prompt")) == "abcd"
+
+    spans = [
+        event.payload["span"]
+        for event in service.event_bus.dispatched
+        if event.event_type == LLM_REQUEST_METRICS
+    ]
+    assert [span["operation"] for span in spans] == ["run_for_agent", "arun_for_agent"]
+    assert all(span["outcome"] == "ok" and span["chunks"] == 3 and span["bytes"] == 4 for span in spans)
+    assert all(0 < span["ttft_ms"] <= span["duration_ms"] for span in spans)
+
+    summary = service.metrics()["architect_agent/sync-model"]
+    assert summary["provider"] == "Sync"
+    assert summary["requests"] == 2
+    assert summary["errors"] == 0
+    assert summary["ttft_p50_ms"] is not None
+    assert summary["chunks_per_second_p50"] > 0
+
+
+def test_metrics_request_is_answered_with_a_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _make_service(monkeypatch, SyncOnlyProvider(["a"]), "sync-model")
+    "".join(service.stream_chat_for_agent("architect_agent", "prompt", use_cache=False))
+
+    service.event_bus.dispatch(Event(event_type=REQUEST_LLM_METRICS))
+
+    reply = service.event_bus.dispatched[-1]
+    assert reply.event_type == LLM_REQUEST_METRICS
+    assert reply.payload["span"] is None
+    assert reply.payload["metrics"]["architect_agent/sync-model"]["requests"] == 1
+
+
+def test_hedge_loser_span_is_recorded_as_cancelled(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = ScriptedProvider({"primary": 0.3, "secondary": 0.0})
+    service = _make_hedged_service(monkeypatch, provider, hedge_after=0.05)
+
+    service.run_for_agent("architect_agent", "prompt")
+
+    deadline = time.monotonic() + 2.0
+    while len(service.telemetry.summary()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    outcomes = {
+        event.payload["span"]["model"]: event.payload["span"]["outcome"]
+        for event in list(service.event_bus.dispatched)
+        if event.event_type == LLM_REQUEST_METRICS
+    }
+    assert outcomes == {"secondary": "ok", "primary": "cancelled"}
+
+
+def test_provider_discovery_runs_in_background_and_persists_models(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache_path = tmp_path / "llm_models.json"
+    cache_path.write_text(json.dumps({"models": {"Sync": ["old-model"]}}), encoding="utf-8")
+    release = threading.Event()
+
+    def _slow_load(self: LLMService) -> None:
+        release.wait(5)
+        self.providers = {"Sync": SyncOnlyProvider(["ok"])}
+        self.model_to_provider_map = {"sync-model": "Sync"}
+
+    monkeypatch.setattr(LLMService, "_load_providers", _slow_load)
+    bus = RecordingEventBus()
+    started = time.monotonic()
+    service = LLMService(bus, model_cache_path=cache_path)
+    assert time.monotonic() - started < 1.0
+
+    bus.dispatch(Event(event_type="REQUEST_AVAILABLE_MODELS"))
+    assert bus.dispatched[-1].payload == {"models": {"Sync": ["old-model"]}, "stale": True}
+
+    service.agent_config = {"architect_agent": {"model": "old-model"}}
+    # Capability queries come from the UI thread and answer from the persisted list at once.
+    started = time.monotonic()
+    assert service.get_provider_name_for_agent("architect_agent") == "Sync"
+    assert time.monotonic() - started < 0.5
+
+    # Requests run on worker threads, which wait for discovery to finish.
+    service.agent_config = {"architect_agent": {"model": "sync-model"}}
+    results: List[str] = []
+    worker = threading.Thread(
+        target=lambda: results.append(service.run_for_agent("architect_agent", "prompt", use_cache=False))
+    )
+    worker.start()
+    threading.Timer(0.05, release.set).start()
+    worker.join(5)
+    assert results == ["ok"]
+
+    announced = [
+        event.payload for event in bus.dispatched
+        if event.event_type == "AVAILABLE_MODELS_RECEIVED" and not event.payload["stale"]
+    ]
+    assert announced == [{"models": {"Sync": ["sync-model"]}, "stale": False}]
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["models"] == {"Sync": ["sync-model"]}
+
+
+def test_async_requests_await_discovery_without_blocking_the_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    def _slow_load(self: LLMService) -> None:
+        release.wait(5)
+        self.providers = {"Sync": SyncOnlyProvider(["ok"])}
+        self.model_to_provider_map = {"sync-model": "Sync"}
+
+    monkeypatch.setattr(LLMService, "_load_providers", _slow_load)
+    service = LLMService(RecordingEventBus())
+    service.agent_config = {"architect_agent": {"model": "sync-model"}}
+
+    async def _run() -> Tuple[str, int]:
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(_ticker())
+        threading.Timer(0.1, release.set).start()
+        result = await service.arun_for_agent("architect_agent", "prompt")
+        ticker.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(_run())
+
+    assert result == "ok"
+    # The loop kept running while discovery finished on its own thread.
+    assert ticks >= 5
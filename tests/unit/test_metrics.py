@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from src.aura.utils.metrics import LatencyHistogram, RateMeter
+
+
+def test_histogram_estimates_percentiles_from_buckets() -> None:
+    histogram = LatencyHistogram(bounds_ms=(1, 10, 100))
+    for _ in range(90):
+        histogram.observe(0.0005)
+    for _ in range(10):
+        histogram.observe(0.05)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 100
+    assert snapshot["p50_ms"] == 1
+    assert snapshot["p99_ms"] == 50
+    assert snapshot["buckets"] == {"<=1": 90, "<=100": 10}
+
+
+def test_empty_histogram_snapshot_is_zeroed() -> None:
+    snapshot = LatencyHistogram().snapshot()
+
+    assert snapshot["count"] == 0
+    assert snapshot["p95_ms"] == 0.0
+    assert snapshot["buckets"] == {}
+
+
+def test_rate_meter_reports_recent_rate_and_lifetime_total() -> None:
+    meter = RateMeter(window_seconds=2.0)
+    meter.mark(100, now=10.0)
+    meter.mark(300, now=11.0)
+
+    assert meter.rate(now=11.5) == 200.0
+    assert meter.rate(now=12.5) == 150.0
+    assert meter.total == 400
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+
+pytest.importorskip("ollama")
+
+from src.aura.models.prompt import PrefixedPrompt
+from src.providers.ollama_provider import OllamaProvider
+
+
+class _StubOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal Ollama HTTP API: /api/tags, /api/generate and /api/chat with NDJSON streams."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self._record({})
+        self._send({"models": [{"model": "llama3.2:latest"}, {"model": "mistral"}]})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self._record(body)
+        time.sleep(self.server.delay)  # type: ignore[attr-defined]
+        if self.path == "/api/chat":
+            lines = [{"message": {"role": "assistant", "content": part}, "done": False} for part in ("he", "llo")]
+            lines.append({"message": {"role": "assistant", "content": ""}, "done": True})
+        else:
+            lines = [{"response": part, "done": False} for part in ("he", "llo")]
+            lines.append({"response": "", "done": True})
+        self._send_ndjson(lines)
+
+    def _record(self, body: Dict[str, Any]) -> None:
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.requests.append((self.path, self.client_address[1], body))  # type: ignore[attr-defined]
+            server.active += 1  # type: ignore[attr-defined]
+            server.peak = max(server.peak, server.active)  # type: ignore[attr-defined]
+
+    def _finish(self) -> None:
+        with self.server.lock:  # type: ignore[attr-defined]
+            self.server.active -= 1  # type: ignore[attr-defined]
+
+    def _send(self, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        self._finish()
+
+    def _send_ndjson(self, lines: List[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(line) + "\n" for line in lines).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        self._finish()
+
+
+@pytest.fixture
+def stub_server() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllamaHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    server.requests: List[Tuple[str, int, Dict[str, Any]]] = []  # type: ignore[attr-defined]
+    server.active = 0  # type: ignore[attr-defined]
+    server.peak = 0  # type: ignore[attr-defined]
+    server.delay = 0.0  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _provider(server: ThreadingHTTPServer, **kwargs: Any) -> OllamaProvider:
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+    return OllamaProvider(host=host, keep_alive="15m", **kwargs)
+
+
+def test_requests_reuse_pooled_connection_and_send_keep_alive(stub_server: ThreadingHTTPServer) -> None:
+    provider = _provider(stub_server)
+
+    assert provider.get_available_models() == ["llama3.2:latest", "mistral"]
+    assert "".join(provider.stream_chat("llama3.2", "hi", {"temperature": 0.1})) == "hello"
+    messages = [{"role": "user", "content": "hi"}]
+    assert "".join(provider.stream_chat_structured("llama3.2", messages, {})) == "hello"
+    provider.close()
+
+    paths = [path for path, _, _ in stub_server.requests]  # type: ignore[attr-defined]
+    ports = {port for _, port, _ in stub_server.requests}  # type: ignore[attr-defined]
+    bodies = [body for _, _, body in stub_server.requests[1:]]  # type: ignore[attr-defined]
+    assert paths == ["/api/tags", "/api/generate", "/api/chat"]
+    assert len(ports) == 1
+    assert all(body["keep_alive"] == "15m" for body in bodies)
+    assert bodies[0]["options"]["temperature"] == 0.1
+
+
+def test_concurrent_streams_are_capped(stub_server: ThreadingHTTPServer) -> None:
+    stub_server.delay = 0.05  # type: ignore[attr-defined]
+    provider = _provider(stub_server, max_concurrency=1)
+    results: List[str] = []
+
+    def _run() -> None:
+        results.append("".join(provider.stream_chat("llama3.2", "hi", {})))
+
+    threads = [threading.Thread(target=_run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == ["hello"] * 3
+    assert stub_server.peak == 1  # type: ignore[attr-defined]
+
+
+def test_async_stream_reuses_client_within_a_loop(stub_server: ThreadingHTTPServer) -> None:
+    provider = _provider(stub_server)
+
+    async def _collect() -> List[str]:
+        first = [chunk async for chunk in provider.astream_chat("llama3.2", "hi", {})]
+        client = provider._async_client
+        second = [chunk async for chunk in provider.astream_chat("llama3.2", "hi", {})]
+        assert provider._async_client is client
+        return first + second
+
+    assert "".join(asyncio.run(_collect())) == "hellohello"
+    ports = {port for _, port, _ in stub_server.requests}  # type: ignore[attr-defined]
+    assert len(ports) == 1
+
+
+def test_async_streams_are_capped(stub_server: ThreadingHTTPServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    stub_server.delay = 0.05  # type: ignore[attr-defined]
+    provider = _provider(stub_server, max_concurrency=1)
+    # Lift the connection-pool limit so only the request slots cap concurrency.
+    monkeypatch.setattr(provider, "_http_options", lambda: {})
+
+    async def _join(stream: Any) -> str:
+        return "".join([chunk async for chunk in stream])
+
+    async def _collect() -> List[str]:
+        messages = [{"role": "user", "content": "hi"}]
+        return await asyncio.gather(
+            _join(provider.astream_chat("llama3.2", "hi", {})),
+            _join(provider.astream_chat_structured("llama3.2", messages, {})),
+        )
+
+    assert asyncio.run(_collect()) == ["hello", "hello"]
+    assert stub_server.peak == 1  # type: ignore[attr-defined]
+
+
+def test_async_client_from_a_previous_loop_is_closed(stub_server: ThreadingHTTPServer) -> None:
+    provider = _provider(stub_server)
+
+    async def _collect() -> str:
+        return "".join([chunk async for chunk in provider.astream_chat("llama3.2", "hi", {})])
+
+    first_loop = asyncio.new_event_loop()
+    try:
+        assert first_loop.run_until_complete(_collect()) == "hello"
+        stale = provider._async_client
+        assert asyncio.run(_collect()) == "hello"
+    finally:
+        first_loop.close()
+
+    assert provider._async_client is not stale
+    assert stale._client.is_closed
+
+
+def test_prefixed_prompts_are_sent_whole_through_the_template(stub_server: ThreadingHTTPServer) -> None:
+    provider = _provider(stub_server)
+    prompts = [PrefixedPrompt("TEMPLATE\n", f"User request: {request}\n") for request in ("one", "two")]
+
+    for prompt in prompts:
+        assert "".join(provider.stream_chat("llama3.2", prompt, {})) == "hello"
+
+    async def _collect() -> str:
+        return "".join([chunk async for chunk in provider.astream_chat("llama3.2", prompts[0], {})])
+
+    assert asyncio.run(_collect()) == "hello"
+
+    bodies = [body for _, _, body in stub_server.requests]  # type: ignore[attr-defined]
+    # One request per prompt: no priming call, no chained context and no raw mode,
+    # so the model sees exactly what it would for the plain string.
+    assert [body["prompt"] for body in bodies] == [str(prompts[0]), str(prompts[1]), str(prompts[0])]
+    assert all(body["stream"] and not body.get("context") and not body.get("raw") for body in bodies)
+    assert all(body["keep_alive"] == "15m" for body in bodies)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.aura.utils.output_parser import CliStatsAccumulator
+
+
+def _feed_in_chunks(accumulator: CliStatsAccumulator, text: str, size: int) -> None:
+    for index in range(0, len(text), size):
+        accumulator.feed(text[index : index + size])
+
+
+def test_json_block_split_across_chunks_is_recovered() -> None:
+    text = (
+        'noise {"early": 1}\n'
+        'json{"stats": {"tools": {"totalCalls": 3}, "note": "brace } and \\"quote\\" {"}}\n'
+        '{"trailing": true}\n'
+    )
+    accumulator = CliStatsAccumulator()
+    # Three-character chunks split the ``json{`` marker, escapes and closing braces.
+    _feed_in_chunks(accumulator, text, 3)
+
+    assert accumulator.latest_json() == {
+        "stats": {"tools": {"totalCalls": 3}, "note": 'brace } and "quote" {'}
+    }
+
+
+def test_unbalanced_braces_and_quotes_do_not_hide_later_json() -> None:
+    for noise in ('if (x) {\n...\n', 'print("{unterminated)\n'):
+        text = noise + '{"stats": {"tool_calls": 3}}'
+        for size in (1, 4, len(text)):
+            accumulator = CliStatsAccumulator()
+            _feed_in_chunks(accumulator, text, size)
+            accumulator.flush()
+            assert accumulator.latest_json() == {"stats": {"tool_calls": 3}}, (noise, size)
+
+
+def test_pretty_printed_json_is_kept_whole() -> None:
+    text = 'json{\n  "stats": {\n    "models": [\n      {"calls": 2}\n    ]\n  }\n}\n'
+    accumulator = CliStatsAccumulator()
+    _feed_in_chunks(accumulator, text, 2)
+    assert accumulator.latest_json() == {"stats": {"models": [{"calls": 2}]}}
+
+
+def test_verbose_lines_are_counted_once_complete() -> None:
+    accumulator = CliStatsAccumulator()
+    _feed_in_chunks(
+        accumulator,
+        "Using tool: write_file\nWriting to: app.py\nAdded 12 lines\nUsing tool: edit\nRemoved 4 lines",
+        5,
+    )
+    assert accumulator.tool_calls == 2
+    assert accumulator.lines_removed == 0
+
+    accumulator.flush()
+    assert accumulator.file_targets == {"app.py"}
+    assert (accumulator.lines_added, accumulator.lines_removed) == (12, 4)
+
+
+def test_consume_file_reads_only_new_bytes(tmp_path: Path) -> None:
+    log_path = tmp_path / "task.output.log"
+    log_path.write_bytes("Using tool: read\nWriting to: café".encode("utf-8")[:-1])
+    accumulator = CliStatsAccumulator(log_path)
+    accumulator.consume_file()
+
+    with log_path.open("ab") as handle:
+        handle.write("é".encode("utf-8")[-1:] + b".py\nUsing tool: write\n")
+    accumulator.consume_file()
+    accumulator.flush()
+
+    assert accumulator.tool_calls == 2
+    assert accumulator.file_targets == {"café.py"}
+
+
+def test_consume_file_skips_reads_within_min_interval(tmp_path: Path) -> None:
+    log_path = tmp_path / "task.output.log"
+    log_path.write_text("Using tool: read\n", encoding="utf-8")
+    accumulator = CliStatsAccumulator(log_path)
+    accumulator.consume_file(min_interval=60.0)
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("Using tool: write\n")
+    accumulator.consume_file(min_interval=60.0)
+    assert accumulator.tool_calls == 1
+
+    accumulator.consume_file()
+    assert accumulator.tool_calls == 2
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+import pytest
+
+from src.aura.services.session_watcher import SessionCompletion, SessionWatcher
+
+
+class _Session:
+    def __init__(self, task_id: str, process: Optional[subprocess.Popen] = None) -> None:
+        self.task_id = task_id
+        self.process = process
+        self.process_id = process.pid if process is not None else None
+
+    def poll(self) -> Optional[int]:
+        return self.process.poll() if self.process is not None else None
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.completions: List[SessionCompletion] = []
+        self.event = threading.Event()
+
+    def __call__(self, completion: SessionCompletion) -> None:
+        self.completions.append(completion)
+        self.event.set()
+
+
+@pytest.fixture
+def watcher() -> Any:
+    # A long poll interval proves completion is event-driven, not polled.
+    instance = SessionWatcher(poll_interval=30.0)
+    yield instance
+    instance.stop()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_done_file_is_detected_without_waiting_for_a_poll(watcher: SessionWatcher, tmp_path: Path) -> None:
+    collector = _Collector()
+    watcher.watch(_Session("task-1"), tmp_path / ".aura", collector, timeout=60)
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    (tmp_path / ".aura" / "task-1.done").write_text("done", encoding="utf-8")
+
+    assert collector.event.wait(2)
+    assert time.monotonic() - start < 1.0
+    assert watcher.backend == "inotify"
+    assert [completion.reason for completion in collector.completions] == ["done-file-detected"]
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd needs Linux 5.3+")
+def test_process_exit_is_detected_without_waiting_for_a_poll(watcher: SessionWatcher, tmp_path: Path) -> None:
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    collector = _Collector()
+
+    watcher.watch(_Session("task-2", process), tmp_path / ".aura", collector, timeout=60)
+
+    assert collector.event.wait(5)
+    assert collector.completions[0].reason == "process-exited"
+    assert collector.completions[0].duration_seconds < 5
+
+
+def test_polling_fallback_detects_summary_and_timeout(tmp_path: Path) -> None:
+    watcher = SessionWatcher(poll_interval=0.02, use_inotify=False)
+    summary_done, timeout_done = _Collector(), _Collector()
+    try:
+        watcher.watch(_Session("task-3"), tmp_path, summary_done, timeout=60)
+        watcher.watch(SimpleNamespace(task_id="task-4", poll=lambda: None), tmp_path, timeout_done, timeout=0.1)
+        (tmp_path / "task-3.summary.json").write_text("{}", encoding="utf-8")
+
+        assert summary_done.event.wait(2) and timeout_done.event.wait(2)
+        assert watcher.backend == "polling"
+    finally:
+        watcher.stop()
+
+    assert summary_done.completions[0].reason == "summary-file-detected"
+    assert timeout_done.completions[0].timed_out
+
+
+def test_unwatched_sessions_are_not_reported(watcher: SessionWatcher, tmp_path: Path) -> None:
+    collector = _Collector()
+    watcher.watch(_Session("task-5"), tmp_path, collector, timeout=60)
+    watcher.unwatch("task-5")
+    time.sleep(0.05)
+
+    (tmp_path / "task-5.done").write_text("done", encoding="utf-8")
+
+    assert not collector.event.wait(0.2)
+    assert watcher.stats()["sessions"] == 0
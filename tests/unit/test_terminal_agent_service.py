@@ -21,6 +21,7 @@ class FakeTerminalBridge:
     def __init__(self) -> None:
         self.started = False
         self.sessions: List[tuple[str, Path, Optional[Path], Optional[Dict[str, str]]]] = []
+        self.commands: List[Optional[str]] = []
         self.ended = False
 
     def start(self) -> None:
@@ -32,10 +33,12 @@ class FakeTerminalBridge:
         log_path: Path,
         working_dir: Optional[Path] = None,
         environment: Optional[Dict[str, str]] = None,
+        command: Optional[str] = None,
     ) -> None:
         self.sessions.append((task_id, Path(log_path), working_dir, environment))
+        self.commands.append(command)
 
-    def end_session(self) -> None:
+    def end_session(self, task_id: Optional[str] = None) -> None:
         self.ended = True
 
 
@@ -46,7 +49,7 @@ class FakeEventBus:
         self._subscribers: Dict[str, List[Callable[[Event], None]]] = {}
         self.dispatched: List[Event] = []
 
-    def subscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
+    def subscribe(self, event_type: str, callback: Callable[[Event], None], lane: str = "main") -> None:
         self._subscribers.setdefault(event_type, []).append(callback)
 
     def dispatch(self, event: Event) -> None:
@@ -111,6 +114,7 @@ def test_spawn_agent_dispatches_terminal_command(tmp_path: Path) -> None:
     command = command_event.payload["command"]
 
     assert command.strip().startswith("gemini")
+    assert bridge.commands == [command]
     assert "--model" in command
     assert "--output-format" in command
     assert "--yolo" in command
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from src.aura.models.event_types import TERMINAL_OUTPUT_RECEIVED
+from src.aura.services.terminal_bridge import TerminalBridge
+from tests.conftest import RecordingEventBus
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.frames: List[object] = []
+
+    async def write(self, data: object) -> None:
+        if data:
+            self.frames.append(data)
+
+
+def _bridge_reading(chunks: List[bytes], bus: RecordingEventBus) -> TerminalBridge:
+    bridge = TerminalBridge(event_bus=bus)
+    pending: Iterator[bytes] = iter(chunks)
+
+    async def _read() -> Optional[bytes]:
+        return next(pending, None)
+
+    bridge._read_from_process = _read  # type: ignore[method-assign]
+    return bridge
+
+
+def test_multibyte_characters_split_across_reads_are_decoded_once_intact(tmp_path: Path) -> None:
+    bus = RecordingEventBus()
+    # "é" is split across the first two reads; "€" is cut off by EOF.
+    bridge = _bridge_reading([b"caf\xc3", b"\xa9 ok\n", b"\xe2\x82"], bus)
+    log_path = tmp_path / "task.output.log"
+    bridge.start_session("task-1", log_path)
+    writer = _Writer()
+
+    asyncio.run(bridge._stream_process_output(writer))  # type: ignore[arg-type]
+    bridge.stop()
+
+    events = [event.payload["text"] for event in bus.dispatched if event.event_type == TERMINAL_OUTPUT_RECEIVED]
+    assert events == ["caf", "é ok\n", "�"]
+    assert writer.frames == ["caf", "é ok\n"]
+    assert log_path.read_text(encoding="utf-8") == "café ok\n�"
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from src.aura.services.terminal_frame_writer import TerminalFrameWriter
+
+
+class _Client:
+    """Records frames; ``gate`` holds every send until it is set, like a stalled client."""
+
+    def __init__(self, stalled: bool = False) -> None:
+        self.frames: List[str] = []
+        self.gate = asyncio.Event()
+        if not stalled:
+            self.gate.set()
+
+    async def send(self, frame: str) -> None:
+        await self.gate.wait()
+        self.frames.append(frame)
+
+
+def test_burst_of_small_reads_is_merged_into_few_frames() -> None:
+    async def scenario() -> None:
+        client = _Client()
+        writer = TerminalFrameWriter(client.send, flush_interval=0.05, max_frame_size=1000)
+        writer.start()
+        for index in range(500):
+            await writer.write(f"{index % 10}")
+            if index == 0:
+                await asyncio.sleep(0)
+        await asyncio.sleep(0.1)
+        await writer.close()
+
+        assert "".join(client.frames) == "".join(f"{index % 10}" for index in range(500))
+        assert len(client.frames) <= 3
+        stats = writer.stats()
+        assert stats["frames"] == len(client.frames)
+        assert stats["bytes"] == 500
+        assert stats["frames_per_sec"] > 0
+
+    asyncio.run(scenario())
+
+
+def test_summarize_policy_drops_oldest_output_for_a_slow_client() -> None:
+    async def scenario() -> None:
+        client = _Client(stalled=True)
+        writer = TerminalFrameWriter(
+            client.send, flush_interval=0, max_frame_size=10, max_pending_size=20, policy="summarize"
+        )
+        writer.start()
+        await writer.write("first")
+        await asyncio.sleep(0)
+        for chunk in ("aaaaaaaaaa", "bbbbbbbbbb", "cccccccccc"):
+            await writer.write(chunk)
+        client.gate.set()
+        await asyncio.sleep(0.05)
+        await writer.close()
+
+        received = "".join(client.frames)
+        assert received.startswith("first")
+        assert "10 characters of output skipped" in received
+        assert received.endswith("bbbbbbbbbbcccccccccc")
+        assert writer.stats()["dropped"] == 10
+
+    asyncio.run(scenario())
+
+
+def test_drop_policy_marks_where_output_was_truncated() -> None:
+    async def scenario() -> None:
+        client = _Client(stalled=True)
+        writer = TerminalFrameWriter(
+            client.send, flush_interval=0, max_frame_size=10, max_pending_size=20, policy="drop"
+        )
+        writer.start()
+        await writer.write("first")
+        await asyncio.sleep(0)
+        for chunk in ("aaaaaaaaaa", "bbbbbbbbbb", "cccccccccc"):
+            await writer.write(chunk)
+        client.gate.set()
+        await asyncio.sleep(0.05)
+        await writer.close()
+
+        received = "".join(client.frames)
+        assert received.startswith("first")
+        assert "[output truncated]" in received
+        assert "aaaa" not in received and received.endswith("bbbbbbbbbbcccccccccc")
+
+    asyncio.run(scenario())
+
+
+def test_block_policy_holds_the_producer_until_the_client_drains() -> None:
+    async def scenario() -> None:
+        client = _Client(stalled=True)
+        writer = TerminalFrameWriter(client.send, flush_interval=0, max_frame_size=4, max_pending_size=4, policy="block")
+        writer.start()
+        await writer.write("one!")
+        await asyncio.sleep(0)
+        await writer.write("two!")
+
+        blocked = asyncio.ensure_future(writer.write("three"))
+        await asyncio.sleep(0.02)
+        assert not blocked.done()
+
+        client.gate.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await writer.close()
+        assert "".join(client.frames) == "one!two!three"
+        assert writer.stats()["dropped"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_block_policy_waits_for_the_in_flight_send_to_finish() -> None:
+    async def scenario() -> None:
+        client = _Client(stalled=True)
+        writer = TerminalFrameWriter(client.send, flush_interval=0, max_frame_size=4, max_pending_size=4, policy="block")
+        await writer.write("one!")
+        blocked = asyncio.ensure_future(writer.write("two!"))
+        await asyncio.sleep(0)
+        # The producer is waiting on a full buffer before the flusher takes it.
+        writer.start()
+
+        await asyncio.sleep(0.02)
+        # The flusher has taken "one!" off the queue, but the client has not accepted it yet.
+        assert writer.stats()["pending"] == 0
+        assert not blocked.done()
+
+        client.gate.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await writer.close()
+        assert "".join(client.frames) == "one!two!"
+
+    asyncio.run(scenario())
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.aura.services.terminal_log_writer import TerminalLogWriter
+
+
+@pytest.fixture
+def writer() -> TerminalLogWriter:
+    instance = TerminalLogWriter(flush_interval=60, flush_bytes=1024 * 1024)
+    yield instance
+    instance.stop()
+
+
+def test_writes_are_buffered_until_flushed(writer: TerminalLogWriter, tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "task.output.log"
+    log = writer.open(path)
+    for index in range(100):
+        writer.write(log, f"line {index}\n")
+
+    writer.flush(log).result(timeout=5)
+
+    assert path.read_text(encoding="utf-8").splitlines()[-1] == "line 99"
+    assert writer.stats()["queued_bytes"] == 0
+
+
+def test_close_writes_everything_and_syncs_per_policy(tmp_path: Path) -> None:
+    writer = TerminalLogWriter(flush_interval=60, fsync="close")
+    path = tmp_path / "task.output.log"
+    log = writer.open(path)
+    writer.write(log, "final output\n")
+
+    writer.close(log).result(timeout=5)
+    writer.write(log, "ignored after close\n")
+    writer.stop()
+
+    assert path.read_text(encoding="utf-8") == "final output\n"
+    stats = writer.stats()
+    assert stats["fsyncs"] == 1
+    assert stats["open_logs"] == 0
+
+
+def test_size_threshold_flushes_without_waiting_for_the_interval(tmp_path: Path) -> None:
+    writer = TerminalLogWriter(flush_interval=60, flush_bytes=16)
+    path = tmp_path / "task.output.log"
+    log = writer.open(path)
+    try:
+        writer.write(log, "x" * 32)
+        deadline = time.monotonic() + 5
+        while path.stat().st_size < 32 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert path.read_text(encoding="utf-8") == "x" * 32
+    finally:
+        writer.stop()
+
+
+def test_write_never_blocks_on_a_stalled_disk(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    writer = TerminalLogWriter(flush_interval=60, max_queue_bytes=10)
+    path = tmp_path / "task.output.log"
+    log = writer.open(path)
+    stalled, release = threading.Event(), threading.Event()
+    append = TerminalLogWriter._append
+
+    def _stalled_append(self: TerminalLogWriter, target: object, text: str) -> None:
+        stalled.set()
+        release.wait(5)
+        append(self, target, text)
+
+    monkeypatch.setattr(TerminalLogWriter, "_append", _stalled_append)
+    try:
+        writer.write(log, "head\n")
+        assert stalled.wait(5)
+
+        start = time.monotonic()
+        for _ in range(50):
+            writer.write(log, "0123456789")
+        assert time.monotonic() - start < 0.5
+
+        release.set()
+        writer.close(log).result(timeout=5)
+    finally:
+        release.set()
+        writer.stop()
+
+    assert writer.stats()["dropped_bytes"] == 490
+    assert path.read_text(encoding="utf-8") == (
+        "head\n0123456789\n[aura: 490 characters of output dropped while the log disk lagged]\n"
+    )